@@ -1,7 +1,14 @@
+import argparse
+import hashlib
 import json
+import os
 import re
-from typing import Dict
+import time
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 
 # 提供的接口信息字典
@@ -27,6 +34,60 @@ INTERFACE_DICT = {
     "1049": ("credit_ratings", "企业信用评级")
 }
 
+# 元数据 (returnParam) 的本地缓存目录，每个接口一个 JSON 文件
+CACHE_DIR = ".uni_cache"
+# 缓存在此时长内视为新鲜，不再请求接口 (秒)；--refresh 可强制刷新
+CACHE_MAX_AGE_SECONDS = 24 * 3600
+# 并发请求元数据接口的线程数
+FETCH_WORKERS = 8
+# 为 True 时把每个接口的 returnParam 原文输出到标准错误流，便于调试
+DEBUG_DUMP_RETURN_PARAM = False
+
+# 生成逻辑的版本号，修改建表规则时递增，使缓存的SQL失效并重新生成
+SCHEMA_GENERATOR_VERSION = 7
+
+# 字段类型覆盖文件: {"表名.列名": "类型"} 或 {"列名": "类型"}，优先级高于自动推断
+TYPE_OVERRIDE_FILE = "column_type_overrides.json"
+
+# 每张表上由入库程序写入的查询公司名列 (dataetlinsert.COMPANY_KEY_COLUMN)，
+# 接口返回的数据本身大多不含公司名，company_profile.py 按该列查找各接口主表的数据，Doris 按该列分桶
+COMPANY_KEY_COLUMN = "query_company"
+COMPANY_KEY_TYPE = "VARCHAR(255)"
+# 接口字段与生成的列 (id、ingest_date、查询公司名、外键) 重名时加上该前缀，入库程序使用相同的规则
+RESERVED_COLUMN_PREFIX = "src_"
+
+# 出现在任意表中就自动建单列索引的查找字段 (查询公司名列只在主表上建索引，子表按外键查找)
+DEFAULT_LOOKUP_COLUMNS = ("name", "credit_code", "gid")
+# 各接口额外的查找索引，元组中多于一列时生成复合索引；只在包含全部列的表上生成
+LOOKUP_INDEXES = {
+    "1001": [("credit_code",), ("name", "reg_status")],
+    "884": [("id_number", "year")],
+    "1049": [("gid", "rating_date")],
+}
+# 按入库日期分区的高数据量接口: 接口ID -> 预建的月分区数 (之后的数据落入 pmax 分区)
+# 分区表的 ingest_date 列使用表达式默认值 DEFAULT (CURRENT_DATE)，需要 MySQL 8.0.13 及以上版本
+PARTITION_BY_INGEST_DATE = {
+    "943": 24,
+}
+# utf8mb4 下 InnoDB 单列索引最多 3072 字节 (768 字符)，更长的字符串列使用前缀索引
+INDEX_MAX_VARCHAR_LENGTH = 768
+INDEX_PREFIX_LENGTH = 191
+
+# Doris 表的副本分布和按入库日期的动态分区 (按月) 配置
+DORIS_REPLICATION_ALLOCATION = "tag.location.default: 3"
+DORIS_DYNAMIC_PARTITION_HISTORY_MONTHS = 36
+DORIS_DYNAMIC_PARTITION_FUTURE_MONTHS = 3
+# 所有表按查询公司名哈希分桶并放在同一个 colocation group 中，同一公司的各接口数据落在同一分桶，
+# 按公司关联主表和子表时可以走 colocate join；同组的表分桶数必须相同
+DORIS_BUCKETS = 16
+DORIS_COLOCATE_GROUP = "company_risk"
+
+OUTPUT_SQL_FILES = {
+    "mysql": "generated_tables.sql",
+    "doris": "generated_tables_doris.sql",
+}
+OUTPUT_ALTER_FILE = "generated_alters.sql"
+
 # 映射字段类型
 TYPE_MAP = {
     "String": "VARCHAR(255)",
@@ -38,6 +99,21 @@ TYPE_MAP = {
 }
 
 
+# notice 中的长度超过该值的 VARCHAR 改用 TEXT，避免行过宽
+VARCHAR_MAX_LENGTH = 1000
+# 没有任何长度提示时 String 字段的默认长度
+DEFAULT_VARCHAR_LENGTH = 255
+# remark 中出现这些词时，数值字段按金额处理 (DECIMAL)
+AMOUNT_KEYWORDS = ("金额", "资本", "价格", "价款", "费用", "标的", "资金", "收入", "利润", "资产", "负债", "万元")
+# remark 中出现这些词时，无长度提示的字符串字段按长文本处理 (TEXT)
+LONG_TEXT_KEYWORDS = ("经营范围", "内容", "简介", "摘要", "描述", "详情", "正文", "原因", "说明", "判决结果")
+
+NOTICE_SIZED_PATTERN = re.compile(r'^(varchar|char|bigint|int|integer|mediumint|smallint|tinyint|decimal|numeric|double|float)'
+                                  r'\s*(?:\((\d+)(?:\s*,\s*(\d+))?\))?', re.IGNORECASE)
+DATE_SAMPLE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+DATETIME_SAMPLE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?$')
+
+
 # 转为 snake_case 命名
 def to_snake_case(name):
     name = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', name)
@@ -50,12 +126,124 @@ def get_table_name(prefix, path):
     return to_snake_case('_'.join([prefix] + effective_path))
 
 
+_type_overrides = None
+
+
+def load_type_overrides():
+    """读取字段类型覆盖文件 (只读取一次)"""
+    global _type_overrides
+    if _type_overrides is None:
+        _type_overrides = {}
+        if os.path.exists(TYPE_OVERRIDE_FILE):
+            with open(TYPE_OVERRIDE_FILE, "r", encoding="utf-8") as f:
+                _type_overrides = json.load(f)
+    return _type_overrides
+
+
+def _sample_text(sample):
+    return sample.strip() if isinstance(sample, str) else ""
+
+
+def _date_sample_type(sample):
+    """样例能解析为日期时返回 DATE，能解析为日期时间时返回 DATETIME，否则返回 None"""
+    text = _sample_text(sample)
+    try:
+        if DATE_SAMPLE_PATTERN.match(text):
+            datetime.strptime(text, "%Y-%m-%d")
+            return "DATE"
+        if DATETIME_SAMPLE_PATTERN.match(text):
+            text = text.replace("T", " ")
+            datetime.strptime(text[:19], "%Y-%m-%d %H:%M:%S" if len(text) >= 19 else "%Y-%m-%d %H:%M")
+            return "DATETIME"
+    except ValueError:
+        pass
+    return None
+
+
+def _type_from_notice(notice, field_type, sample):
+    """根据 notice 中的类型提示推断列类型，无法识别时返回 None"""
+    notice = (notice or "").strip()
+    if not notice:
+        return None
+    lowered = notice.lower()
+
+    match = NOTICE_SIZED_PATTERN.match(lowered)
+    if match:
+        base, size, scale = match.group(1), match.group(2), match.group(3)
+        if base in ("varchar", "char"):
+            length = int(size) if size else DEFAULT_VARCHAR_LENGTH
+            return "TEXT" if length > VARCHAR_MAX_LENGTH else f"VARCHAR({length})"
+        if base in ("decimal", "numeric"):
+            return f"DECIMAL({size or 20},{scale or 0})"
+        if base in ("double", "float"):
+            return "DOUBLE"
+        if base == "integer":
+            return "INT"
+        return base.upper()
+
+    if lowered in ("text", "mediumtext", "longtext"):
+        return lowered.upper()
+    if ("时间戳" in notice or "timestamp" in lowered) and field_type == "Number":
+        # 接口中的时间戳是毫秒数值，按原样存储
+        return "BIGINT"
+    if field_type == "Number":
+        return None
+    if lowered in ("datetime", "date"):
+        return lowered.upper()
+    if "日期" in notice or "时间" in notice or "timestamp" in lowered:
+        # notice 只是描述 (如 "成立时间")，只有样例确实能解析为日期时才用日期类型；
+        # 没有样例或格式不标准 (如 "2020年1月"、"至今") 时保守地存为短字符串
+        return _date_sample_type(sample) or "VARCHAR(64)"
+    return None
+
+
+def infer_column_type(field_name, field_type, remark="", notice="", sample=None, table_name=None):
+    """
+    推断列类型。
+
+    优先级: 覆盖文件 > notice 中的类型提示 > sample / remark 推断 > TYPE_MAP 默认值。
+    """
+    overrides = load_type_overrides()
+    column_name = to_snake_case(field_name)
+    for key in (f"{table_name}.{column_name}", column_name):
+        if key in overrides:
+            return overrides[key]
+
+    col_type = _type_from_notice(notice, field_type, sample)
+    if col_type:
+        return col_type
+
+    remark = remark or ""
+    if field_type == "Number":
+        if remark.startswith("是否") or "1 是" in remark or "1=是" in remark:
+            return "TINYINT"
+        if isinstance(sample, float) or any(keyword in remark for keyword in AMOUNT_KEYWORDS):
+            return "DECIMAL(20,4)"
+        return "BIGINT"
+    if field_type == "Boolean":
+        return "TINYINT(1)"
+    if field_type == "String":
+        text = _sample_text(sample)
+        date_type = _date_sample_type(text)
+        if date_type:
+            return date_type
+        if len(text) > DEFAULT_VARCHAR_LENGTH or any(keyword in remark for keyword in LONG_TEXT_KEYWORDS):
+            return "TEXT"
+        return f"VARCHAR({DEFAULT_VARCHAR_LENGTH})"
+    return TYPE_MAP.get(field_type, "VARCHAR(255)")
+
+
 # 生成字段定义
-def gen_column(field_name, field_type, remark):
-    col_type = TYPE_MAP.get(field_type, "VARCHAR(255)")
+def gen_column(field_name, field_type, remark, notice="", sample=None, table_name=None):
+    col_type = infer_column_type(field_name, field_type, remark, notice, sample, table_name)
     # 从 remark 中移除换行符，避免 SQL 语法错误
     clean_remark = remark.replace('\n', ' ').replace('\r', '') if remark else ''
-    return f"  `{to_snake_case(field_name)}` {col_type} COMMENT '{clean_remark}'"
+    return {"name": to_snake_case(field_name), "type": col_type, "comment": clean_remark}
+
+
+# 渲染字段定义
+def render_column(column):
+    return f"`{column['name']}` {column['type']} COMMENT '{column['comment']}'"
 
 
 # ### 核心修改点 1: parse_fields 函数 ###
@@ -82,7 +270,11 @@ def parse_fields(fields: dict, prefix: str, chinese_name: str, path: list, table
             "comment": full_comment,
             "foreign_key": None if parent_table is None else (parent_table, to_snake_case(f"{parent_table}_id"))
         }
+        tables[table_name]["columns"].append(
+            {"name": COMPANY_KEY_COLUMN, "type": COMPANY_KEY_TYPE, "comment": "查询的公司名 (入库时写入)"})
 
+    foreign_key = tables[table_name]["foreign_key"]
+    reserved = {"id", "ingest_date", COMPANY_KEY_COLUMN, foreign_key[1] if foreign_key else None}
     for key, meta in fields.items():
         field_type = meta.get("type", "String")
         remark = meta.get("remark", "")
@@ -91,42 +283,302 @@ def parse_fields(fields: dict, prefix: str, chinese_name: str, path: list, table
             parse_fields(meta["_"], prefix, chinese_name, path + [key], tables, table_name)
             continue
         else:
-            tables[table_name]["columns"].append(gen_column(key, field_type, remark))
+            column = gen_column(key, field_type, remark, meta.get("notice", ""), meta.get("sample"), table_name)
+            if column["name"] in reserved:
+                # 例如接口自带的 id 字段，不能与自增主键同名
+                column["name"] = RESERVED_COLUMN_PREFIX + column["name"]
+            tables[table_name]["columns"].append(column)
+
+
+def _index_column_expr(column):
+    """返回建索引用的列表达式；JSON 等不能直接建索引的列返回 None"""
+    col_type = column["type"].upper()
+    if col_type == "JSON":
+        return None
+    if col_type.endswith("TEXT"):
+        return f"`{column['name']}`({INDEX_PREFIX_LENGTH})"
+    match = re.match(r'VARCHAR\((\d+)\)', col_type)
+    if match and int(match.group(1)) > INDEX_MAX_VARCHAR_LENGTH:
+        return f"`{column['name']}`({INDEX_PREFIX_LENGTH})"
+    return f"`{column['name']}`"
+
 
+def _index_name(columns):
+    # MySQL 标识符最长 64 个字符
+    return ("idx_" + "_".join(columns))[:64]
 
-def generate_sql(tables: dict):
+
+def add_indexes(tables: dict, api_id=None):
+    """
+    为表结构补充索引和分区定义 (写入 tables[*]["indexes"] / ["partition_months"])。
+
+    - 所有子表的 `<父表>_id` 外键列，主表的查询公司名列
+    - DEFAULT_LOOKUP_COLUMNS 中出现的查找字段
+    - LOOKUP_INDEXES 中为该接口配置的复合索引
+    """
+    api_id = str(api_id) if api_id is not None else None
+    for table, data in tables.items():
+        columns = {column["name"]: column for column in data["columns"]}
+        if data["foreign_key"]:
+            columns[data["foreign_key"][1]] = {"name": data["foreign_key"][1], "type": "BIGINT"}
+
+        candidates = []
+        if data["foreign_key"]:
+            candidates.append((data["foreign_key"][1],))
+        else:
+            candidates.append((COMPANY_KEY_COLUMN,))
+        candidates.extend((name,) for name in DEFAULT_LOOKUP_COLUMNS)
+        candidates.extend(tuple(index) for index in LOOKUP_INDEXES.get(api_id, []))
+
+        indexes = []
+        seen = set()
+        for index_columns in candidates:
+            if index_columns in seen or not all(name in columns for name in index_columns):
+                continue
+            exprs = [_index_column_expr(columns[name]) for name in index_columns]
+            if None in exprs:
+                continue
+            seen.add(index_columns)
+            indexes.append({"name": _index_name(index_columns), "columns": exprs})
+        # 某个索引的列是另一个复合索引的最左前缀时，它是冗余的
+        data["indexes"] = [index for index in indexes
+                           if not any(other is not index and other["columns"][:len(index["columns"])] == index["columns"]
+                                      for other in indexes)]
+        data["partition_months"] = PARTITION_BY_INGEST_DATE.get(api_id)
+    return tables
+
+
+def _partition_clause(months: int, start: date = None):
+    """生成按入库日期的月分区定义，从当前月开始预建 months 个分区"""
+    start = start or date.today()
+    year, month = start.year, start.month
+    partitions = []
+    for _ in range(months):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        partitions.append(f"  PARTITION p{year}{month:02d} VALUES LESS THAN ('{next_year}-{next_month:02d}-01')")
+        year, month = next_year, next_month
+    partitions.append("  PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return "PARTITION BY RANGE COLUMNS(`ingest_date`) (\n" + ",\n".join(partitions) + "\n)"
+
+
+def generate_mysql_sql(tables: dict):
+    """渲染 MySQL InnoDB 建表语句"""
     sql_list = []
     for table, data in tables.items():
-        lines = [f"CREATE TABLE IF NOT EXISTS `{table}` ("]
-        lines.append(f"  `id` BIGINT AUTO_INCREMENT PRIMARY KEY COMMENT '主键ID',")
+        partition_months = data.get("partition_months")
+        if partition_months:
+            # 分区表的所有唯一键都必须包含分区列，因此主键改为 (id, ingest_date)
+            definitions = [f"`id` BIGINT AUTO_INCREMENT COMMENT '主键ID'",
+                           f"`ingest_date` DATE NOT NULL DEFAULT (CURRENT_DATE) COMMENT '入库日期 (分区键)'"]
+        else:
+            definitions = [f"`id` BIGINT AUTO_INCREMENT PRIMARY KEY COMMENT '主键ID'"]
 
         if data["foreign_key"]:
             fk_table, fk_field = data["foreign_key"]
-            lines.append(f"  `{fk_field}` BIGINT COMMENT '外键, 关联 `{fk_table}`.id',")
+            definitions.append(f"`{fk_field}` BIGINT COMMENT '外键, 关联 `{fk_table}`.id'")
 
-        lines.extend(data["columns"])
+        definitions.extend(render_column(column) for column in data["columns"])
 
-        # 移除最后一个可能存在的逗号
-        if lines[-1].strip().endswith(','):
-            lines[-1] = lines[-1].rstrip(',')
+        if partition_months:
+            definitions.append("PRIMARY KEY (`id`, `ingest_date`)")
+        for index in data.get("indexes", []):
+            definitions.append(f"KEY `{index['name']}` ({', '.join(index['columns'])})")
 
-        lines.append(f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='{data['comment']}';")
+        lines = [f"CREATE TABLE IF NOT EXISTS `{table}` ("]
+        if partition_months:
+            lines.insert(0, "-- 需要 MySQL 8.0.13 及以上版本 (ingest_date 列使用表达式默认值 DEFAULT (CURRENT_DATE))")
+        lines.append(",\n".join(f"  {definition}" for definition in definitions))
+        lines.append(f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='{data['comment']}'"
+                     + (f"\n{_partition_clause(partition_months)};" if partition_months else ";"))
         sql_list.append("\n".join(lines))
     return "\n\n".join(sql_list)
 
 
-def process_api(api_id):
-    url = f"https://open.tianyancha.com/open-admin/interface/uni.json?id={api_id}"
-    headers = {
+# ============================= Doris 方言 =============================
+
+def map_mysql_to_doris_type(mysql_type: str) -> str:
+    """
+    将生成的 MySQL 列类型映射为 Doris 类型。
+
+    与 asetl_to_doris.map_oracle_to_doris_type 保持一致: 字符串统一为 STRING，
+    整数按宽度选择 INT/BIGINT，定点数使用 DECIMALV3，未知类型退化为 STRING。
+    """
+    col_type = mysql_type.upper().strip()
+    if col_type.startswith(("VARCHAR", "CHAR")) or col_type.endswith("TEXT") or col_type == "JSON":
+        return "STRING"
+    match = re.match(r'DECIMAL\((\d+),\s*(\d+)\)', col_type)
+    if match:
+        precision, scale = int(match.group(1)), int(match.group(2))
+        if scale == 0:
+            return "INT" if precision < 10 else "BIGINT"
+        return f"DECIMALV3({precision}, {scale})"
+    if col_type.startswith(("TINYINT", "BOOLEAN")):
+        return "TINYINT"
+    if col_type.startswith("SMALLINT"):
+        return "SMALLINT"
+    if col_type.startswith(("MEDIUMINT", "INT")):
+        return "INT"
+    if col_type.startswith("BIGINT"):
+        return "BIGINT"
+    if col_type in ("DOUBLE", "FLOAT"):
+        return "DOUBLE"
+    if col_type == "DATE":
+        return "DATE"
+    if col_type.startswith(("DATETIME", "TIMESTAMP")):
+        return "DATETIME"
+    print(f"警告: 未知的列类型 '{mysql_type}'，将默认映射为 'STRING'。")
+    return "STRING"
+
+
+def _doris_key_type(mysql_type: str):
+    """Doris 的 Key 列不能是 STRING/DOUBLE 等类型，返回可作为 Key 的类型；不可作为 Key 时返回 None"""
+    col_type = mysql_type.upper().strip()
+    match = re.match(r'(?:VAR)?CHAR\((\d+)\)', col_type)
+    if match:
+        return f"VARCHAR({match.group(1)})"
+    doris_type = map_mysql_to_doris_type(mysql_type)
+    if doris_type in ("STRING", "DOUBLE"):
+        return None
+    return doris_type
+
+
+def generate_doris_sql(tables: dict):
+    """
+    渲染 Doris UNIQUE KEY 模型的建表语句。
+
+    Key 列依次为: 查询公司名、父表外键、自然键 (查找字段和配置的复合索引列)、`id`、`ingest_date`；
+    所有表都按查询公司名哈希分桶并属于同一个 colocation group，按入库日期做按月动态分区。
+    """
+    sql_list = []
+    for table, data in tables.items():
+        columns = {column["name"]: column for column in data["columns"]}
+
+        company = columns[COMPANY_KEY_COLUMN]
+        key_definitions = [f"`{COMPANY_KEY_COLUMN}` {_doris_key_type(company['type'])} COMMENT '{company['comment']}'"]
+        key_names = [COMPANY_KEY_COLUMN]
+        if data["foreign_key"]:
+            fk_table, fk_field = data["foreign_key"]
+            key_definitions.append(f"`{fk_field}` BIGINT COMMENT '外键, 关联 `{fk_table}`.id'")
+            key_names.append(fk_field)
+        for index in data.get("indexes", []):
+            for expr in index["columns"]:
+                name = expr.split("`")[1]
+                if name in key_names or name not in columns:
+                    continue
+                key_type = _doris_key_type(columns[name]["type"])
+                if key_type is None:
+                    continue
+                key_definitions.append(f"`{name}` {key_type} COMMENT '{columns[name]['comment']}'")
+                key_names.append(name)
+        key_definitions.append("`id` BIGINT COMMENT '主键ID'")
+        key_definitions.append("`ingest_date` DATE NOT NULL COMMENT '入库日期 (分区键)'")
+        key_names.extend(["id", "ingest_date"])
+
+        value_definitions = [f"`{column['name']}` {map_mysql_to_doris_type(column['type'])} COMMENT '{column['comment']}'"
+                             for column in data["columns"] if column["name"] not in key_names]
+
+
+        lines = [f"CREATE TABLE IF NOT EXISTS `{table}` ("]
+        lines.append(",\n".join(f"  {definition}" for definition in key_definitions + value_definitions))
+        lines.append(")")
+        lines.append(f"UNIQUE KEY({', '.join(f'`{name}`' for name in key_names)})")
+        lines.append(f"COMMENT '{data['comment']}'")
+        lines.append("PARTITION BY RANGE(`ingest_date`) ()")
+        lines.append(f"DISTRIBUTED BY HASH(`{COMPANY_KEY_COLUMN}`) BUCKETS {DORIS_BUCKETS}")
+        lines.append(f"""PROPERTIES (
+    "replication_allocation" = "{DORIS_REPLICATION_ALLOCATION}",
+    "colocate_with" = "{DORIS_COLOCATE_GROUP}",
+    "enable_unique_key_merge_on_write" = "true",
+    "dynamic_partition.enable" = "true",
+    "dynamic_partition.time_unit" = "MONTH",
+    "dynamic_partition.start" = "-{DORIS_DYNAMIC_PARTITION_HISTORY_MONTHS}",
+    "dynamic_partition.end" = "{DORIS_DYNAMIC_PARTITION_FUTURE_MONTHS}",
+    "dynamic_partition.prefix" = "p",
+    "dynamic_partition.create_history_partition" = "true"
+);""")
+        sql_list.append("\n".join(lines))
+    return "\n\n".join(sql_list)
+
+
+# 可用的 SQL 方言: 名称 -> 渲染函数 (参数为 parse_fields/add_indexes 生成的 tables 字典)
+DIALECTS = {
+    "mysql": generate_mysql_sql,
+    "doris": generate_doris_sql,
+}
+
+
+def generate_sql(tables: dict, dialect: str = "mysql"):
+    if dialect not in DIALECTS:
+        raise ValueError(f"不支持的SQL方言: {dialect}，可选值为 {', '.join(DIALECTS)}")
+    return DIALECTS[dialect](tables)
+
+
+def generate_alter_sql(old_tables: dict, new_tables: dict):
+    """
+    对比同一接口前后两次的表结构，生成把旧结构升级为新结构的 DDL。
+
+    新增的表输出 CREATE TABLE；新增/类型变化的列输出 ADD/MODIFY COLUMN；
+    被删除的列和表只以注释形式列出，避免误删已有数据。
+    """
+    statements = []
+    created = {table: data for table, data in new_tables.items() if table not in old_tables}
+    if created:
+        statements.append(generate_sql(created))
+
+    for table, data in new_tables.items():
+        if table not in old_tables:
+            continue
+        old_columns = {column["name"]: column for column in old_tables[table]["columns"]}
+        new_columns = {column["name"]: column for column in data["columns"]}
+        changes = []
+        previous = data["foreign_key"][1] if data["foreign_key"] else "id"
+        for name, column in new_columns.items():
+            if name not in old_columns:
+                changes.append(f"  ADD COLUMN {render_column(column)} AFTER `{previous}`")
+            elif (old_columns[name]["type"], old_columns[name]["comment"]) != (column["type"], column["comment"]):
+                changes.append(f"  MODIFY COLUMN {render_column(column)}")
+            previous = name
+        old_indexes = {index["name"] for index in old_tables[table].get("indexes", [])}
+        for index in data.get("indexes", []):
+            if index["name"] not in old_indexes:
+                changes.append(f"  ADD INDEX `{index['name']}` ({', '.join(index['columns'])})")
+        if changes:
+            statements.append(f"ALTER TABLE `{table}`\n" + ",\n".join(changes) + ";")
+        if data.get("partition_months") and not old_tables[table].get("partition_months"):
+            statements.append(f"-- 表 `{table}` 新配置了按入库日期分区，需要重建表后迁移数据，请参考上面的 CREATE TABLE 语句。")
+        for name in old_columns:
+            if name not in new_columns:
+                statements.append(f"-- 列 `{table}`.`{name}` 已不在接口定义中，确认后可执行: "
+                                  f"ALTER TABLE `{table}` DROP COLUMN `{name}`;")
+
+    for table in old_tables:
+        if table not in new_tables:
+            statements.append(f"-- 表 `{table}` 已不在接口定义中，确认后可执行: DROP TABLE `{table}`;")
+    return "\n\n".join(statements)
+
+
+def build_session(pool_size: int = FETCH_WORKERS):
+    """创建带连接池的会话，所有元数据请求复用 TCP/TLS 连接"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36",
         "Referer": "https://open.tianyancha.com/",
-    }
+    })
+    return session
+
+
+def process_api(api_id, session=None):
+    url = f"https://open.tianyancha.com/open-admin/interface/uni.json?id={api_id}"
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = (session or build_session(1)).get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json().get("data", {})
         return_param_str = data.get("returnParam")
-        print(return_param_str, file=sys.stderr)  # 输出到标准错误流，便于调试
+        if DEBUG_DUMP_RETURN_PARAM:
+            print(return_param_str, file=sys.stderr)  # 输出到标准错误流，便于调试
         if not return_param_str:
             raise ValueError(f"API ID {api_id} 的响应中未找到 'returnParam' 字段")
         return return_param_str
@@ -138,84 +590,235 @@ def process_api(api_id):
         return None
 
 
+# ============================= 元数据缓存 =============================
+
+def content_hash(text: str) -> str:
+    """returnParam、生成逻辑版本和类型覆盖文件共同决定的内容哈希"""
+    overrides = json.dumps(load_type_overrides(), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{SCHEMA_GENERATOR_VERSION}\n{overrides}\n{text}".encode("utf-8")).hexdigest()
+
+
+def load_cache(api_id) -> Optional[dict]:
+    path = os.path.join(CACHE_DIR, f"{api_id}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_cache(api_id, entry: dict):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{api_id}.json")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def fetch_return_params(api_ids: List[str], refresh: bool = False, workers: int = FETCH_WORKERS) -> Dict[str, Optional[str]]:
+    """
+    并发获取各接口的 returnParam。
+
+    缓存仍在有效期内的接口直接使用缓存，其余接口通过同一个连接池并发请求；
+    请求失败时回退到 (可能已过期的) 缓存。
+    """
+    results = {}
+    to_fetch = []
+    now = time.time()
+    for api_id in api_ids:
+        cached = load_cache(api_id)
+        if cached and not refresh and now - cached.get("fetched_at", 0) < CACHE_MAX_AGE_SECONDS:
+            results[api_id] = cached["return_param"]
+        else:
+            to_fetch.append(api_id)
+
+    if to_fetch:
+        print(f"--- 并发获取 {len(to_fetch)} 个接口的元数据 (缓存命中 {len(results)} 个) ---")
+        session = build_session(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = dict(zip(to_fetch, executor.map(lambda api_id: process_api(api_id, session), to_fetch)))
+        for api_id in to_fetch:
+            if fetched[api_id] is None:
+                cached = load_cache(api_id)
+                if cached:
+                    print(f"  [警告] API {api_id} 获取失败，使用本地缓存。")
+                results[api_id] = cached["return_param"] if cached else None
+            else:
+                results[api_id] = fetched[api_id]
+    return results
+
+
+def extract_result_fields(return_param_dict: dict):
+    """从 returnParam 中找出 result 的字段定义"""
+    result_node = return_param_dict.get("result", {})
+    result_fields = None
+
+    # ### 这是最终的、最完善的解析逻辑 ###
+    if result_node and isinstance(result_node, dict):
+        nested_content = result_node.get("_")
+
+        if nested_content:
+            # 检查 `_` 键的内容类型
+            if isinstance(nested_content, dict):
+                # 情况1: 内容是字典，直接使用 (适配 API 1001)
+                print("  [信息] 检测到 'result._' 字典结构，直接使用。")
+                result_fields = nested_content
+            elif isinstance(nested_content, str):
+                # 情况2: 内容是字符串，需要二次解析
+                print("  [信息] 检测到 'result._' 字符串结构，正在解析...")
+                try:
+                    result_fields = json.loads(nested_content)
+                except json.JSONDecodeError as e:
+                    print(f"  [错误] 'result._' 字符串无法被解析为JSON: {e}")
+            else:
+                print(f"  [警告] 'result._' 键的内容是无法处理的类型: {type(nested_content)}")
+        else:
+            # 情况3: `result` 键下没有 `_`，则认为 result 本身就是字段定义
+            print("  [信息] 未检测到 'result._'，尝试使用 'result' 直接结构。")
+            result_fields = result_node
+    return result_fields
+
+
+def build_interface_tables(api_id, root_table, chinese_comment, return_param_string):
+    """
+    解析一个接口的 returnParam，生成带索引定义的表结构。
+
+    :return: tables 字典；无法解析时返回 None
+    """
+    try:
+        return_param_dict = json.loads(return_param_string)
+    except json.JSONDecodeError as e:
+        print(f"  [错误] API {api_id} 的 'returnParam' 字符串不是有效的JSON: {e}")
+        return None
+
+    result_fields = extract_result_fields(return_param_dict)
+    if not result_fields:
+        print(f"  [警告] API {api_id} 中未找到有效的字段定义。")
+        print("  [调试信息] 'returnParam' 解析后的内容如下:")
+        print(json.dumps(return_param_dict, indent=2, ensure_ascii=False))
+        return None
+
+    tables = {}
+    parse_fields(result_fields, root_table, chinese_comment, ["result"], tables)
+    add_indexes(tables, api_id)
+    return tables
 
-# --- 此处是所有未发生变化的辅助函数 ---
-# 为了简洁，此处省略，请在您的文件中保留它们
-# TYPE_MAP = { ... }
-# def to_snake_case(...): ...
-# def get_table_name(...): ...
-# def gen_column(...): ...
-# def parse_fields(...): ...
-# def generate_sql(...): ...
-# def process_api(...): ...
-# -----------------------------------------
 
+def render_interface_section(api_id, chinese_comment, tables, dialect="mysql"):
+    """渲染一个接口的 SQL 段落 (带注释头)"""
+    sql = generate_sql(tables, dialect)
+    return (f"-- ==================================================\n-- SQL for {chinese_comment} (API ID: {api_id})\n"
+            f"-- ==================================================\n{sql}")
+
+
+def render_alter_section(api_id, chinese_comment, old_tables, new_tables):
+    """渲染一个接口的 ALTER 段落 (带注释头)，没有结构变更时返回 None"""
+    alter_sql = generate_alter_sql(old_tables, new_tables)
+    if not alter_sql:
+        return None
+    return (f"-- ==================================================\n-- ALTER for {chinese_comment} (API ID: {api_id})\n"
+            f"-- ==================================================\n{alter_sql}")
+
+
+def main(refresh: bool = False, workers: int = FETCH_WORKERS, dialect: str = "mysql"):
+    if dialect not in DIALECTS:
+        print(f"不支持的SQL方言: {dialect}，可选值为 {', '.join(DIALECTS)}")
+        return
+    output_file = OUTPUT_SQL_FILES[dialect]
+    return_params = fetch_return_params(list(INTERFACE_DICT), refresh, workers)
 
-def main():
     all_sql_statements = []
+    alter_statements = []
+    changed = []
     for api_id, (root_table, chinese_comment) in INTERFACE_DICT.items():
         print(f"--- 正在处理API: {api_id} ({chinese_comment}) ---")
 
-        return_param_string = process_api(api_id)
-
-        if return_param_string:
-            try:
-                return_param_dict = json.loads(return_param_string)
-                result_node = return_param_dict.get("result", {})
-                result_fields = None
-
-                # ### 这是最终的、最完善的解析逻辑 ###
-                if result_node and isinstance(result_node, dict):
-                    nested_content = result_node.get("_")
-
-                    if nested_content:
-                        # 检查 `_` 键的内容类型
-                        if isinstance(nested_content, dict):
-                            # 情况1: 内容是字典，直接使用 (适配 API 1001)
-                            print("  [信息] 检测到 'result._' 字典结构，直接使用。")
-                            result_fields = nested_content
-                        elif isinstance(nested_content, str):
-                            # 情况2: 内容是字符串，需要二次解析
-                            print("  [信息] 检测到 'result._' 字符串结构，正在解析...")
-                            try:
-                                result_fields = json.loads(nested_content)
-                            except json.JSONDecodeError as e:
-                                print(f"  [错误] 'result._' 字符串无法被解析为JSON: {e}")
-                        else:
-                            print(f"  [警告] 'result._' 键的内容是无法处理的类型: {type(nested_content)}")
-                    else:
-                        # 情况3: `result` 键下没有 `_`，则认为 result 本身就是字段定义
-                        print("  [信息] 未检测到 'result._'，尝试使用 'result' 直接结构。")
-                        result_fields = result_node
-
-                # 如果成功获取到字段定义，则生成SQL
-                if result_fields:
-                    tables = {}
-                    parse_fields(result_fields, root_table, chinese_comment, ["result"], tables)
-                    sql = generate_sql(tables)
-                    all_sql_statements.append(
-                        f"-- ==================================================\n-- SQL for {chinese_comment} (API ID: {api_id})\n-- ==================================================\n{sql}")
-                    print(f"  [成功] API {api_id} 的SQL已生成。")
-                else:
-                    print(f"  [警告] API {api_id} 中未找到有效的字段定义。")
-                    print("  [调试信息] 'returnParam' 解析后的内容如下:")
-                    print(json.dumps(return_param_dict, indent=2, ensure_ascii=False))
-
-            except json.JSONDecodeError as e:
-                print(f"  [错误] API {api_id} 的 'returnParam' 字符串不是有效的JSON: {e}")
-        else:
+        return_param_string = return_params.get(api_id)
+        cached = load_cache(api_id)
+
+        if not return_param_string:
             print(f"  [跳过] 未能从API {api_id} 获取数据。")
-        print("-" * 50)
+            print("-" * 50)
+            continue
 
-    # ... (后续的汇总和文件写入部分保持不变) ...
-    final_sql_output = "\n\n".join(all_sql_statements)
-    with open("generated_tables.sql", "w", encoding="utf-8") as f:
-        f.write(final_sql_output)
+        digest = content_hash(return_param_string)
+        if cached and cached.get("hash") == digest and cached.get("tables"):
+            # returnParam 未变化，直接复用上次解析的表结构和生成的 SQL
+            sections = cached.setdefault("sql", {})
+            if dialect == "mysql" and cached.get("mysql_tables") not in (None, cached["tables"]):
+                # 上次变更后只生成过其他方言，线上 MySQL 表仍是旧结构，补出 ALTER 语句
+                alter_section = render_alter_section(api_id, chinese_comment, cached["mysql_tables"], cached["tables"])
+                if alter_section:
+                    alter_statements.append(alter_section)
+                cached["mysql_tables"] = cached["tables"]
+                sections.pop(dialect, None)
+            if dialect in sections:
+                print(f"  [未变化] API {api_id} 的 returnParam 与上次一致，复用缓存的SQL。")
+            else:
+                sections[dialect] = render_interface_section(api_id, chinese_comment, cached["tables"], dialect)
+                changed.append(api_id)
+                print(f"  [未变化] API {api_id} 的 returnParam 与上次一致，由缓存的表结构生成 {dialect} SQL。")
+            all_sql_statements.append(sections[dialect])
+            if api_id in changed or cached.get("fetched_at", 0) < time.time() - CACHE_MAX_AGE_SECONDS:
+                cached["fetched_at"] = time.time()
+                save_cache(api_id, cached)
+            print("-" * 50)
+            continue
 
-    print("\n\n✅ 所有SQL语句已生成完毕，并保存到文件 `generated_tables.sql`。")
+        tables = build_interface_tables(api_id, root_table, chinese_comment, return_param_string)
+        if tables is None:
+            print("-" * 50)
+            continue
 
+        section = render_interface_section(api_id, chinese_comment, tables, dialect)
+        all_sql_statements.append(section)
+        changed.append(api_id)
+        # mysql_tables 记录上次生成 MySQL SQL 时的表结构，ALTER 语句是 MySQL 语法，只在生成 MySQL 时输出
+        mysql_tables = (cached.get("mysql_tables") or cached.get("tables")) if cached else None
+        if dialect == "mysql":
+            if mysql_tables:
+                alter_section = render_alter_section(api_id, chinese_comment, mysql_tables, tables)
+                if alter_section:
+                    alter_statements.append(alter_section)
+            mysql_tables = tables
+        save_cache(api_id, {
+            "hash": digest,
+            "fetched_at": time.time(),
+            "return_param": return_param_string,
+            "tables": tables,
+            "mysql_tables": mysql_tables,
+            "sql": {dialect: section},
+        })
+        print(f"  [成功] API {api_id} 的SQL已生成。")
+        print("-" * 50)
 
+    if not changed and os.path.exists(output_file):
+        print(f"\n\n✅ 所有接口的 returnParam 均未变化，`{output_file}` 无需重新生成。")
+    else:
+        final_sql_output = "\n\n".join(all_sql_statements)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(final_sql_output)
+        print(f"\n\n✅ {len(changed)} 个接口的SQL已重新生成，并保存到文件 `{output_file}`。")
+
+    if dialect != "mysql":
+        print(f"ℹ️ 结构变更语句只在生成 MySQL 方言时输出，`{OUTPUT_ALTER_FILE}` 未改动。")
+        return
+    # 每次都重写，避免残留上一次运行的 ALTER 语句被重复执行
+    with open(OUTPUT_ALTER_FILE, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(alter_statements) if alter_statements else "-- 本次运行没有需要执行的结构变更\n")
+    if alter_statements:
+        print(f"✅ 已有表的结构变更语句已保存到文件 `{OUTPUT_ALTER_FILE}`。")
+    else:
+        print(f"✅ 没有结构变更，已清空 `{OUTPUT_ALTER_FILE}`。")
 
-if __name__ == "__main__":
-    main()
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="根据天眼查接口的 returnParam 生成建表语句")
+    parser.add_argument("--refresh", action="store_true", help="忽略缓存有效期，重新请求所有接口的元数据")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, help="并发请求的线程数")
+    parser.add_argument("--dialect", choices=sorted(DIALECTS), default="mysql", help="生成的SQL方言")
+    args = parser.parse_args()
+    main(args.refresh, args.workers, args.dialect)
@@ -3,6 +3,7 @@ import mysql.connector
 import configparser
 import sys
 from typing import List, Dict, Any
+from etl_pools import mysql_pool, oracle_pool, print_pool_metrics
 
 
 # --- 1. 数据类型映射 (保持不变) ---
@@ -35,14 +36,8 @@ def map_oracle_to_doris_type(ora_type: str, precision: int, scale: int) -> str:
 def get_oracle_table_info(config: configparser.ConfigParser, owner: str, table_name: str) -> List[Dict[str, Any]]:
     """从Oracle获取表结构信息"""
     try:
-        # 使用 cx_Oracle.makedsn 来构建连接字符串
-        dsn = cx_Oracle.makedsn(config['oracle']['host'], config['oracle']['port'],
-                                service_name=config['oracle']['service_name'])
-        with cx_Oracle.connect(
-                user=config['oracle']['user'],
-                password=config['oracle']['password'],
-                dsn=dsn
-        ) as connection:
+        # 从连接池借出连接 (with 块结束时归还)，随后的数据迁移会复用同一个已认证的会话
+        with oracle_pool('oracle', dict(config['oracle'])).acquire() as connection:
             with connection.cursor() as cursor:
                 sql = """
                 SELECT column_name, data_type, data_precision, data_scale
@@ -130,13 +125,7 @@ def migrate_data(ora_config: dict, doris_config: dict, ora_owner: str, ora_table
     # 3. 连接Doris并创建表
     print("\n步骤 3/5: 连接Doris并创建表...")
     try:
-        doris_conn = mysql.connector.connect(
-            host=doris_config['doris']['host'],
-            port=doris_config['doris']['port'],
-            user=doris_config['doris']['user'],
-            password=doris_config['doris']['password'],
-            database=doris_config['doris']['database']
-        )
+        doris_conn = mysql_pool('doris', dict(doris_config['doris'])).acquire()
         with doris_conn.cursor() as cursor:
             # mysql.connector 支持一次执行多个语句
             for result in cursor.execute(doris_ddl, multi=True):
@@ -155,11 +144,8 @@ def migrate_data(ora_config: dict, doris_config: dict, ora_owner: str, ora_table
         placeholders = ', '.join(['%s'] * len(column_names))
         insert_sql = f"INSERT INTO `{ora_table}` ({', '.join([f'`{name}`' for name in column_names])}) VALUES ({placeholders})"
 
-        # 连接Oracle
-        ora_dsn = cx_Oracle.makedsn(ora_config['oracle']['host'], ora_config['oracle']['port'],
-                                    service_name=ora_config['oracle']['service_name'])
-        with cx_Oracle.connect(user=ora_config['oracle']['user'], password=ora_config['oracle']['password'],
-                               dsn=ora_dsn) as ora_conn:
+        # 连接Oracle (复用读取表结构时的连接)
+        with oracle_pool('oracle', dict(ora_config['oracle'])).acquire() as ora_conn:
             with ora_conn.cursor() as ora_cursor:
                 ora_cursor.execute(f"SELECT * FROM {ora_owner}.{ora_table}")
 
@@ -184,9 +170,9 @@ def migrate_data(ora_config: dict, doris_config: dict, ora_owner: str, ora_table
         print(f"写入Doris时出错: {e}")
         doris_conn.rollback()
     finally:
-        if 'doris_conn' in locals() and doris_conn.is_connected():
+        if 'doris_conn' in locals():
             doris_conn.close()
-            print("已关闭Doris连接。")
+            print("已将Doris连接归还连接池。")
 
 
 # --- 主程序入口 ---
@@ -211,6 +197,7 @@ if __name__ == "__main__":
     print(f"准备将Oracle表 '{oracle_schema}.{oracle_table}' 迁移到Doris...")
 
     migrate_data(config, config, oracle_schema, oracle_table)
+    print_pool_metrics()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,486 @@
+"""
+公司风险画像读取接口 (带缓存) 与本地 HTTP 服务
+
+按公司名一次性组装 generated_tables.sql 中各接口的数据 (信用评级、税务评级、失信人、破产重整 ...):
+- 多个公司的请求合并为一轮批量查询: 每个接口主表按入库时写入的 query_company IN (...) 查询一次，
+  子表按上一层的 id 逐层 <父表>_id IN (...) 查询，上一层没有数据的子表不再查询
+- 结果放在 LRU + TTL 缓存中，热点公司直接从内存返回 (同时缓存序列化后的 JSON)
+- 后台线程轮询 dataetlinsert.py 写入的 etl_company_changes 表，
+  某公司有新数据入库后立即使其缓存失效；TTL 作为兜底
+- 同一公司的并发未命中只查询一次数据库
+
+画像结构:
+    {"company": 公司名, "loaded_at": ..., "interfaces": {
+        主表名: {"interface": 接口中文名, "api_id": 接口ID, "rows": [
+            {列名: 值, ..., "<子表后缀>": [子表行, ...]}, ...]}}}
+
+使用方法:
+    python company_profile.py --port 8765
+    curl "http://127.0.0.1:8765/profile?name=上海建工集团股份有限公司"
+    curl "http://127.0.0.1:8765/profiles?name=A公司&name=B公司"
+    curl "http://127.0.0.1:8765/stats"
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from dataetlinsert import CHANGE_TABLE, COMPANY_KEY_COLUMN, DB_CONFIG
+from etl_pools import mysql_pool
+
+SCHEMA_FILE = 'generated_tables.sql'
+SECTION_PATTERN = re.compile(r'^-- SQL for (.+?) \(API ID: (\d+)\)')
+TABLE_PATTERN = re.compile(r'CREATE TABLE IF NOT EXISTS `(\w+)`')
+PARENT_PATTERN = re.compile(r"外键, 关联 `(\w+)`\.id")
+
+# IN 列表的最大长度，超过时分多次查询
+IN_CHUNK_SIZE = 1000
+
+
+# ============================= 1. 表结构 =============================
+
+def parse_schema(path: str = SCHEMA_FILE) -> Dict[str, Dict[str, Any]]:
+    """
+    从 generated_tables.sql 读取表之间的层级关系
+
+    :return: {表名: {'interface': 接口中文名, 'api_id': 接口ID, 'parent': 父表名或 None}}
+    """
+    if not os.path.exists(path):
+        # 该文件不纳入版本库，需与库中实际的表结构一起由 apijsontosql3.py 生成
+        raise FileNotFoundError(f"表结构文件 {path} 不存在，请先运行 python apijsontosql3.py 生成")
+    tables = {}
+    interface, api_id, current = None, None, None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            section = SECTION_PATTERN.match(line)
+            if section:
+                interface, api_id = section.group(1), section.group(2)
+                continue
+            table = TABLE_PATTERN.search(line)
+            if table:
+                current = table.group(1)
+                tables[current] = {'interface': interface, 'api_id': api_id, 'parent': None}
+                continue
+            parent = PARENT_PATTERN.search(line)
+            if parent and current:
+                tables[current]['parent'] = parent.group(1)
+    return tables
+
+
+def _chunks(values: List[Any], size: int = IN_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _profile_key(company: str) -> str:
+    """缓存键: 去掉首尾空白并转小写，与库的排序规则 (不区分大小写 / 忽略尾部空格) 一致"""
+    return str(company).strip().lower()
+
+
+# ============================= 2. 缓存 =============================
+
+class ProfileCache:
+    """
+    LRU + TTL 缓存，每个键带一个失效代数 (generation)
+
+    查询数据库前记下代数，写入缓存时代数已变化 (查询期间被失效) 则不写入，
+    避免把失效前读到的旧数据放回缓存。
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evicted': 0, 'invalidated': 0, 'stale_skipped': 0}
+
+    def get(self, key: str) -> Optional[tuple]:
+        """返回 (画像, JSON 字节)，未命中或已过期时返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1], entry[2]
+
+    def generation(self, key: str) -> int:
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def put(self, key: str, profile: dict, generation: int) -> bytes:
+        body = json.dumps(profile, ensure_ascii=False, default=str, separators=(',', ':')).encode('utf-8')
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                self.stats['stale_skipped'] += 1
+                return body
+            self._entries[key] = (time.monotonic() + self.ttl, profile, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evicted'] += 1
+        return body
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.stats['invalidated'] += 1
+
+    def clear(self):
+        with self._lock:
+            for key in self._entries:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else None
+        return stats
+
+
+# ============================= 3. 画像组装 =============================
+
+class ProfileService:
+    """按公司组装跨接口画像，带缓存与基于变更记录表的失效"""
+
+    def __init__(self, pool=None, schema_path: str = SCHEMA_FILE, key_column: str = COMPANY_KEY_COLUMN,
+                 cache_size: int = 10000, ttl: float = 300.0, poll_interval: float = 2.0,
+                 interfaces: Optional[Iterable[str]] = None):
+        """
+        :param pool: etl_pools.ConnectionPool，默认为 dataetlinsert 使用的 MySQL 连接池
+        :param schema_path: 表结构文件
+        :param key_column: 接口主表中保存公司名的列，默认为入库程序写入的查询公司名列
+        :param cache_size: 缓存的公司数上限
+        :param ttl: 缓存有效期 (秒)，变更记录漏掉时的兜底
+        :param poll_interval: 轮询变更记录表的间隔 (秒)
+        :param interfaces: 只组装这些主表，默认全部
+        """
+        self.pool = pool or mysql_pool('mysql', DB_CONFIG)
+        self.key_column = key_column
+        self.poll_interval = poll_interval
+        self.cache = ProfileCache(cache_size, ttl)
+        self._schema = parse_schema(schema_path)
+        self._interfaces = set(interfaces) if interfaces else None
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._last_change_id = None
+        self._stop = threading.Event()
+        self._poller = None
+        self.stats = {'db_passes': 0, 'db_queries': 0, 'db_ms_total': 0.0, 'changes_seen': 0}
+        self._stats_lock = threading.Lock()
+        self._load_columns()
+
+    def _load_columns(self):
+        """
+        查询库中实际存在的表和列 (一次查询)，确定要组装的主表和各表的子表
+
+        缺少公司名列的主表 (还没有按新的表结构补上 query_company 列) 无法按公司查询，记入 skipped_roots。
+        """
+        names = list(self._schema)
+        columns = {}
+        with self.pool.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                for chunk in _chunks(names):
+                    cursor.execute(
+                        "SELECT table_name, column_name FROM information_schema.columns "
+                        f"WHERE table_schema = DATABASE() AND table_name IN ({', '.join(['%s'] * len(chunk))})",
+                        chunk)
+                    for table_name, column_name in cursor.fetchall():
+                        columns.setdefault(table_name, set()).add(column_name.lower())
+            finally:
+                cursor.close()
+
+        self.children = {}
+        self.roots = []
+        self.skipped_roots = []
+        for table, info in self._schema.items():
+            if table not in columns:
+                continue
+            parent = info['parent']
+            if parent:
+                if parent in columns and f"{parent}_id" in columns[table]:
+                    self.children.setdefault(parent, []).append(table)
+            elif self._interfaces is None or table in self._interfaces:
+                (self.roots if self.key_column in columns[table] else self.skipped_roots).append(table)
+
+    def _query(self, cursor, sql: str, params: List[Any]) -> List[dict]:
+        cursor.execute(sql, params)
+        with self._stats_lock:
+            self.stats['db_queries'] += 1
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def _fetch_children(self, cursor, table: str, rows: List[dict]):
+        """逐层查询 table 的子表并挂到 rows 上 (键为子表名去掉父表前缀)"""
+        ids = [row['id'] for row in rows if row.get('id') is not None]
+        for child in self.children.get(table, []):
+            suffix = child[len(table) + 1:] if child.startswith(table + '_') else child
+            fk = f"{table}_id"
+            child_rows = []
+            for chunk in _chunks(ids):
+                child_rows.extend(self._query(
+                    cursor, f"SELECT * FROM `{child}` WHERE `{fk}` IN ({', '.join(['%s'] * len(chunk))}) "
+                            f"ORDER BY `id`", chunk))
+            by_parent = {}
+            for child_row in child_rows:
+                by_parent.setdefault(child_row.pop(fk), []).append(child_row)
+            for row in rows:
+                row[suffix] = by_parent.get(row.get('id'), [])
+            if child_rows:
+                self._fetch_children(cursor, child, child_rows)
+
+    def fetch_profiles(self, companies: List[str]) -> Dict[str, dict]:
+        """不经过缓存，一轮批量查询组装多个公司的画像"""
+        started = time.perf_counter()
+        loaded_at = datetime.now().isoformat(timespec='seconds')
+        profiles = {company: {'company': company, 'loaded_at': loaded_at, 'interfaces': {}} for company in companies}
+        by_key = {_profile_key(company): company for company in companies}
+        with self.pool.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                for root in self.roots:
+                    rows = []
+                    for chunk in _chunks(companies):
+                        rows.extend(self._query(
+                            cursor, f"SELECT * FROM `{root}` WHERE `{self.key_column}` IN "
+                                    f"({', '.join(['%s'] * len(chunk))}) ORDER BY `id`", chunk))
+                    if not rows:
+                        continue
+                    self._fetch_children(cursor, root, rows)
+                    info = self._schema[root]
+                    for row in rows:
+                        # 库的排序规则可能不区分大小写 / 忽略尾部空格，按规范化后的名称归属
+                        company = by_key.get(_profile_key(row[self.key_column]))
+                        if company is None:
+                            continue
+                        interface = profiles[company]['interfaces'].setdefault(
+                            root, {'interface': info['interface'], 'api_id': info['api_id'], 'rows': []})
+                        interface['rows'].append(row)
+            finally:
+                cursor.close()
+        with self._stats_lock:
+            self.stats['db_passes'] += 1
+            self.stats['db_ms_total'] += (time.perf_counter() - started) * 1000
+        return profiles
+
+    def _load(self, companies: List[str]) -> Dict[str, tuple]:
+        """
+        查询缓存未命中的公司并写入缓存；同一公司已有查询在进行时等待其结果
+
+        :param companies: 公司名，按缓存键去重 (大小写或首尾空白不同的名称只查询一次)
+        :return: {缓存键: (画像, JSON 字节)}
+        """
+        owned, waiting = {}, []
+        with self._inflight_lock:
+            for company in companies:
+                key = _profile_key(company)
+                if key in owned:
+                    continue
+                if key in self._inflight:
+                    waiting.append((key, self._inflight[key]))
+                else:
+                    self._inflight[key] = threading.Event()
+                    owned[key] = company
+
+        results = {}
+        try:
+            if owned:
+                generations = {key: self.cache.generation(key) for key in owned}
+                for company, profile in self.fetch_profiles(list(owned.values())).items():
+                    key = _profile_key(company)
+                    results[key] = (profile, self.cache.put(key, profile, generations[key]))
+        finally:
+            with self._inflight_lock:
+                for key in owned:
+                    self._inflight.pop(key).set()
+
+        for key, event in waiting:
+            event.wait()
+            cached = self.cache.get(key)
+            results[key] = cached if cached is not None else self._load([key])[key]
+        return results
+
+    def _get_cached(self, companies: List[str]) -> Dict[str, tuple]:
+        """返回 {请求的公司名: (画像, JSON 字节)}，缓存按规范化后的名称查找"""
+        keys = {company: _profile_key(company) for company in companies}
+        entries, misses = {}, {}
+        for company, key in keys.items():
+            if key in entries or key in misses:
+                continue
+            cached = self.cache.get(key)
+            if cached is None:
+                misses[key] = company
+            else:
+                entries[key] = cached
+        if misses:
+            entries.update(self._load(list(misses.values())))
+        return {company: entries[key] for company, key in keys.items()}
+
+    def get_profiles_json(self, companies: List[str]) -> Dict[str, bytes]:
+        """返回 {公司名: 画像 JSON 字节}，命中缓存时不做任何序列化"""
+        return {company: body for company, (_, body) in self._get_cached(companies).items()}
+
+    def get_profiles(self, companies: List[str]) -> Dict[str, dict]:
+        """返回 {公司名: 画像}，缓存中的画像为共享对象，调用方不应修改"""
+        return {company: profile for company, (profile, _) in self._get_cached(companies).items()}
+
+    def get_profile(self, company: str) -> dict:
+        return self.get_profiles([company])[company]
+
+    # ---------- 缓存失效 ----------
+
+    def poll_changes(self, limit: int = 1000) -> int:
+        """读取新的变更记录并使对应公司的缓存失效，返回处理的记录数"""
+        with self.pool.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                if self._last_change_id is None:
+                    # 首次轮询只记下当前位置，启动时缓存为空，之前的变更无需处理
+                    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM `{CHANGE_TABLE}`")
+                    self._last_change_id = cursor.fetchone()[0]
+                    connection.commit()
+                    return 0
+                cursor.execute(f"SELECT id, company FROM `{CHANGE_TABLE}` WHERE id > %s ORDER BY id LIMIT %s",
+                               (self._last_change_id, limit))
+                rows = cursor.fetchall()
+                # 结束只读事务，下次轮询才能看到新提交的数据 (REPEATABLE READ)
+                connection.commit()
+            finally:
+                cursor.close()
+        for change_id, company in rows:
+            self.cache.invalidate(_profile_key(company))
+            self._last_change_id = change_id
+        with self._stats_lock:
+            self.stats['changes_seen'] += len(rows)
+        return len(rows)
+
+    def _poll_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                while self.poll_changes() > 0:
+                    pass
+            except Exception as e:
+                # 读不到变更记录时无法保证缓存新鲜，清空缓存后继续重试
+                print(f"读取变更记录失败，已清空缓存: {e}")
+                self.cache.clear()
+
+    def start(self):
+        """启动后台轮询线程"""
+        self.poll_changes()
+        self._poller = threading.Thread(target=self._poll_loop, name='profile-change-poller', daemon=True)
+        self._poller.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['db_ms_total'] = round(stats['db_ms_total'], 2)
+        return {'service': stats, 'cache': self.cache.metrics(), 'roots': len(self.roots),
+                'skipped_roots': self.skipped_roots}
+
+
+# ============================= 4. HTTP 服务 =============================
+
+def make_handler(service: ProfileService):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _send(self, status: int, body: bytes):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status: int, message: str):
+            self._send(status, json.dumps({'error': message}, ensure_ascii=False).encode('utf-8'))
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            names = parse_qs(url.query).get('name', [])
+            try:
+                if url.path == '/profile':
+                    if len(names) != 1:
+                        return self._error(400, "需要且只能有一个 name 参数")
+                    return self._send(200, service.get_profiles_json(names)[names[0]])
+                if url.path == '/profiles':
+                    if not names:
+                        return self._error(400, "缺少 name 参数")
+                    bodies = service.get_profiles_json(names)
+                    # 各公司的 JSON 已缓存为字节，直接拼接，不重新序列化
+                    body = b'{' + b','.join(json.dumps(name, ensure_ascii=False).encode('utf-8') + b':' + bodies[name]
+                                            for name in dict.fromkeys(names)) + b'}'
+                    return self._send(200, body)
+                if url.path == '/stats':
+                    return self._send(200, json.dumps(service.metrics(), ensure_ascii=False).encode('utf-8'))
+                return self._error(404, f"未知路径: {url.path}")
+            except Exception as e:
+                return self._error(500, str(e))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(service: ProfileService, host: str = '127.0.0.1', port: int = 8765):
+    """启动 HTTP 服务 (阻塞)，Ctrl+C 退出"""
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    print(f"🚀 公司画像服务已启动: http://{host}:{server.server_address[1]}/profile?name=公司名 "
+          f"(接口主表 {len(service.roots)} 个)")
+    if service.skipped_roots:
+        print(f"⚠️  以下主表缺少 {service.key_column} 列，未纳入画像 "
+              f"(执行 apijsontosql3.py 生成的 generated_alters.sql 可补上该列): {', '.join(service.skipped_roots)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="公司风险画像读取服务")
+    parser.add_argument('--host', default='127.0.0.1', help="监听地址")
+    parser.add_argument('--port', type=int, default=8765, help="监听端口")
+    parser.add_argument('--schema', default=SCHEMA_FILE, help="表结构文件")
+    parser.add_argument('--cache-size', type=int, default=10000, help="缓存的公司数上限")
+    parser.add_argument('--ttl', type=float, default=300.0, help="缓存有效期 (秒)")
+    parser.add_argument('--poll-interval', type=float, default=2.0, help="轮询变更记录表的间隔 (秒)")
+    parser.add_argument('--interfaces', help="只组装这些接口主表，逗号分隔 (如 credit_ratings,dishonest_persons)")
+    args = parser.parse_args()
+    service = ProfileService(schema_path=args.schema, cache_size=args.cache_size, ttl=args.ttl,
+                             poll_interval=args.poll_interval,
+                             interfaces=args.interfaces.split(',') if args.interfaces else None)
+    serve(service.start(), args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()
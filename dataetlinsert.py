@@ -1,12 +1,15 @@
+import itertools
 import json
 import re
+import sys
+from datetime import datetime
 import requests
-import mysql.connector
 from mysql.connector import Error
+from etl_pools import http_session, mysql_pool, print_pool_metrics
 
 # ============================= 1. 用户配置区 =============================
 
-# 请在此处配置您的数据库连接信息
+# 请在此处配置您的数据库连接信息 (config.ini 的 [mysql] 节或 ETL_MYSQL_* 环境变量可覆盖，见 etl_pools.py)
 DB_CONFIG = {
     'host': 'localhost',  # 数据库主机地址
     'user': 'root',  # 数据库用户名
@@ -15,6 +18,9 @@ DB_CONFIG = {
 }
 
 
+# 业务数据接口地址
+API_URL = "http://10.50.74.8:38081/fireeyes/interface"
+
 # 您想要查询的公司列表
 COMPANIES_TO_PROCESS = [
     "上海建工集团股份有限公司"
@@ -29,6 +35,40 @@ INTERFACE_DICT = {
     "843": ("dishonest_persons", "失信人"),
 }
 
+# 抓取结果的本地预写缓冲 (spool) 配置，详见 etl_spool.py
+SPOOL_CONFIG = {
+    'spool_dir': 'spool',  # spool 目录
+    'max_segment_bytes': 64 * 1024 * 1024,  # 单个分段最大字节数
+    'flush_records': 20,  # 每多少条记录压缩写入一次
+    'fsync_policy': 'batch',  # always / batch / never
+    'fsync_interval': 1.0,  # batch 策略下两次 fsync 的最小间隔 (秒)
+}
+
+# 入库阶段每批处理的 spool 记录数，每批提交一次事务和一次位点
+LOAD_BATCH_SIZE = 50
+
+# 单条 spool 记录入库失败的次数达到该值后移到 spool/quarantine/，不再阻塞后续记录
+MAX_RECORD_ATTEMPTS = 3
+
+# 每一行 (主表和子表) 都写入查询的公司名，与 apijsontosql3.COMPANY_KEY_COLUMN 一致；
+# 接口返回的数据本身大多不含公司名，company_profile.py 按该列查找各接口的数据
+COMPANY_KEY_COLUMN = 'query_company'
+# 接口字段与生成的列 (id、ingest_date、查询公司名、外键) 重名时加上该前缀，与 apijsontosql3 的建表规则一致
+RESERVED_COLUMN_PREFIX = 'src_'
+
+# 入库变更记录表: 与业务数据在同一事务中写入 "哪个公司的哪个接口有新数据"，
+# company_profile.py 轮询该表使读缓存失效
+CHANGE_TABLE = 'etl_company_changes'
+CHANGE_TABLE_DDL = f"""
+CREATE TABLE IF NOT EXISTS `{CHANGE_TABLE}` (
+  `id` BIGINT AUTO_INCREMENT PRIMARY KEY COMMENT '主键ID',
+  `company` VARCHAR(255) NOT NULL COMMENT '公司名',
+  `table_name` VARCHAR(128) NOT NULL COMMENT '写入的接口主表',
+  `changed_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '写入时间',
+  KEY `idx_company` (`company`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='入库变更记录'
+"""
+
 
 # ============================= 2. 辅助函数和数据库操作 =============================
 
@@ -39,9 +79,9 @@ def to_snake_case(name):
 
 
 def create_db_connection():
-    """创建并返回一个数据库连接"""
+    """从连接池借出一个数据库连接，close() 时归还连接池"""
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        connection = mysql_pool('mysql', DB_CONFIG).acquire()
         if connection.is_connected():
             print("数据库连接成功。")
             return connection
@@ -56,7 +96,7 @@ def fetch_api_data(company_name: str, api_path: str,api_id: str):
 
     """
    
-    url = f"http://10.50.74.8:38081/fireeyes/interface"
+    url = API_URL
     content_type = 'application/json'
     x_scg_requestid = ''
     x_scg_servicename = 'S_XXX_XXX_XXXX'
@@ -73,7 +113,8 @@ def fetch_api_data(company_name: str, api_path: str,api_id: str):
 
     print(f"  正在从接口 '{api_path}' 获取 '{company_name}' 的数据...")
     try:
-        response = requests.post(url, data=json.dumps(params), headers=headers)
+        # 共享会话复用 keep-alive 连接，不再每次请求重新建立 TCP 连接
+        response = http_session().post(url, data=json.dumps(params), headers=headers)
 #         response="""{"err_code":0,"items":[{"name":"上海建工集团股份有限公司","row_content":{"ratingOutlook":"稳定","ratingDate":"2021-09-17","gid":24703069,"ratingCompanyName":"中债资信评估有限责任公司","bondCreditLevel":"","logo":"https://img5.tianyancha.com/logo/lll/6f0c46e529b0a2db4737c1e009d32ff4.png@!f_200x200","alias":"中债资信","subjectLevel":"AA+ pi"},"disabled":false,"last_update_time":"2025-07-04T07:45:29.950765","interface_id":1049,"interface_name":"企业信用评级"},{"name":"上海建工集团股份有限公司","row_content":{"ratingOutlook":"","ratingDate":"2015-10-26","gid":24498476,"ratingCompanyName":"中诚信国际信用评级有限责任公司","bondCreditLevel":"AAA","logo":"https://img5.tianyancha.com/logo/lll/7706e105be85a0fb10c8000ac3152e90.png@!f_200x200","alias":"中诚信","subjectLevel":""},"disabled":false,"last_update_time":"2025-07-04T07:45:29.950765","interface_id":1049,"interface_name":"企业信用评级"}]}
 # """
         # response.raise_for_status()  # 如果请求失败则抛出异常
@@ -112,7 +153,8 @@ def insert_data(cursor, table_name: str, data: dict):
 
     try:
         # 提取字典的值，并确保顺序与列名一致
-        values = list(data.values())
+        # 空字符串按 NULL 写入: 建表时日期/金额字段使用了 DATE、DECIMAL 等精确类型，严格模式下不接受 ''
+        values = [None if value == '' else value for value in data.values()]
         cursor.execute(sql, values)
         # 返回新插入行的自增 ID，用于关联子表
         return cursor.lastrowid
@@ -123,9 +165,25 @@ def insert_data(cursor, table_name: str, data: dict):
         raise  # 抛出异常，以便上层进行事务回滚
 
 
+def ensure_change_table(connection):
+    """创建入库变更记录表 (不存在时)"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CHANGE_TABLE_DDL)
+    finally:
+        cursor.close()
+
+
+def record_company_change(cursor, company: str, table_prefix: str):
+    """记录某个公司的某个接口写入了新数据 (随当前事务一起提交)"""
+    cursor.execute(f"INSERT INTO `{CHANGE_TABLE}` (company, table_name) VALUES (%s, %s)",
+                   (company, to_snake_case(table_prefix)))
+
+
 # ============================= 3. 核心处理逻辑 =============================
 
-def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None, parent_table_name=None):
+def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None, parent_table_name=None,
+                       company=None):
     """
     递归地处理 JSON 数据，并将其插入到对应的数据库表中。
 
@@ -134,11 +192,12 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
     :param table_name_prefix: 表名的前缀 (如 'base_info', 'certifications')
     :param parent_id: 父记录在数据库中的 ID
     :param parent_table_name: 父表的全名 (如 'base_info')
+    :param company: 查询的公司名，写入每一行的 COMPANY_KEY_COLUMN 列
     """
     if isinstance(json_data, list):
         # 如果是列表，遍历其中每个元素并递归处理
         for item in json_data:
-            process_and_insert(cursor, item, table_name_prefix, parent_id, parent_table_name)
+            process_and_insert(cursor, item, table_name_prefix, parent_id, parent_table_name, company)
         return
 
     if not isinstance(json_data, dict):
@@ -157,11 +216,18 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
 
     # 2. 插入当前层级的数据到主表
     current_table_name = to_snake_case(table_name_prefix)
+    foreign_key_column = f"{to_snake_case(parent_table_name)}_id" if parent_id and parent_table_name else None
+
+    # 与生成的列重名的接口字段 (如接口自带的 id) 加上前缀，避免覆盖自增主键
+    reserved = {'id', 'ingest_date', COMPANY_KEY_COLUMN, foreign_key_column}
+    simple_fields = {(RESERVED_COLUMN_PREFIX + to_snake_case(key)) if to_snake_case(key) in reserved else key: value
+                     for key, value in simple_fields.items()}
 
     # 如果存在父ID，需要将外键添加到待插入数据中
-    if parent_id and parent_table_name:
-        foreign_key_column = f"{to_snake_case(parent_table_name)}_id"
+    if foreign_key_column:
         simple_fields[foreign_key_column] = parent_id
+    if company is not None:
+        simple_fields[COMPANY_KEY_COLUMN] = company
 
     # 只有在有简单字段时才执行插入
     if not simple_fields:
@@ -176,13 +242,142 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
         # 构造子表的名称，如 base_info_staff_list
         child_table_prefix = f"{table_name_prefix}_{key}"
         # 递归处理，传入新创建的记录ID作为父ID
-        process_and_insert(cursor, value, child_table_prefix, new_id, current_table_name)
+        process_and_insert(cursor, value, child_table_prefix, new_id, current_table_name, company)
 
 
-# ============================= 4. 主执行函数 =============================
+# ============================= 4. 抓取 / 入库阶段 =============================
+
+def fetch_to_spool(writer):
+    """
+    抓取阶段: 调用接口并把结果追加到 spool，不依赖数据库。
+
+    :param writer: etl_spool.SpoolWriter
+    :return: 写入的记录数
+    """
+    written = 0
+    for company in COMPANIES_TO_PROCESS:
+        print(f"\n{'=' * 20} 开始抓取公司: {company} {'=' * 20}")
+        for api_id, (table_prefix, chinese_name) in INTERFACE_DICT.items():
+            api_data = fetch_api_data(company, table_prefix, api_id)
+            if api_data:
+                writer.append({
+                    'company': company,
+                    'api_id': api_id,
+                    'table_prefix': table_prefix,
+                    'fetched_at': datetime.now().isoformat(),
+                    'items': api_data,
+                })
+                written += 1
+        # 每个公司抓取完成后落盘一次，进程中断时最多丢失当前公司的结果
+        writer.flush()
+    return written
+
+
+def _insert_record(cursor, record: dict):
+    process_and_insert(cursor, record['items'], record['table_prefix'], company=record['company'])
+    record_company_change(cursor, record['company'], record['table_prefix'])
+
+
+def _load_one_by_one(connection, cursor, reader, count: int, max_attempts: int) -> int:
+    """
+    批次失败后从已提交位点开始逐条入库，定位出错的记录。
+
+    出错的记录累计失败 max_attempts 次后移到 quarantine 并跳过，否则抛出异常，下次运行时重试。
+
+    :return: 成功入库的记录数
+    """
+    loaded = 0
+    for next_offset, record in itertools.islice(reader.read_from(reader.committed_offset()), count):
+        try:
+            _insert_record(cursor, record)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            if not reader.record_failure(next_offset, record, e, max_attempts):
+                raise
+            print(f"spool 记录 {next_offset} 已失败 {max_attempts} 次，移到 quarantine 后跳过: {e}")
+        reader.commit(next_offset)
+        loaded += 1
+    return loaded
+
+
+def load_from_spool(connection, reader, batch_size: int = LOAD_BATCH_SIZE,
+                    max_attempts: int = MAX_RECORD_ATTEMPTS):
+    """
+    入库阶段: 按批次消费 spool，每批一个事务，数据库提交成功后再提交位点。
+
+    批次失败时回滚并逐条重试，找出出错的记录 (见 _load_one_by_one)。
+
+    :param connection: 数据库连接
+    :param reader: etl_spool.SpoolReader
+    :param batch_size: 每批处理的记录数
+    :param max_attempts: 单条记录失败多少次后移到 quarantine
+    :return: 成功入库 (或移到 quarantine) 的记录数
+    """
+    loaded = 0
+    cursor = connection.cursor()
+    try:
+        for next_offset, records in reader.read_batches(batch_size):
+            try:
+                for record in records:
+                    _insert_record(cursor, record)
+                connection.commit()
+            except Exception as e:
+                print(f"\n入库批次失败: {e}。事务将被回滚，改为逐条入库。")
+                connection.rollback()
+                loaded += _load_one_by_one(connection, cursor, reader, len(records), max_attempts)
+                continue
+            # 只有数据库提交成功后才推进位点，失败重跑时会从本批次开头重新入库
+            reader.commit(next_offset)
+            loaded += len(records)
+            print(f"已入库 {loaded} 条 spool 记录，位点推进到 {next_offset}。")
+    finally:
+        cursor.close()
+    return loaded
+
+
+def run_fetch():
+    """只运行抓取阶段"""
+    from etl_spool import SpoolWriter
+
+    with SpoolWriter(**SPOOL_CONFIG) as writer:
+        written = fetch_to_spool(writer)
+    print(f"\n抓取完成，共写入 {written} 条 spool 记录。")
+
+
+def run_load(replay: bool = False) -> bool:
+    """
+    只运行入库阶段。
+
+    :param replay: 为 True 时先把位点重置到最早的分段，重新入库全部已抓取数据
+    :return: 是否成功 (失败时 main 以非零状态码退出)
+    """
+    from etl_spool import SpoolReader
+
+    reader = SpoolReader(SPOOL_CONFIG['spool_dir'])
+    if replay:
+        reader.reset()
+        print("位点已重置，将从最早的分段开始重放。")
 
-def main():
-    """主执行函数"""
+    connection = create_db_connection()
+    if not connection:
+        return False
+    try:
+        ensure_change_table(connection)
+        loaded = load_from_spool(connection, reader)
+        print(f"\n入库完成，共处理 {loaded} 条 spool 记录。")
+        return True
+    except Exception as e:
+        print(f"\n入库过程中发生严重错误: {e}")
+        return False
+    finally:
+        if connection.is_connected():
+            connection.close()
+            print("\n数据库连接已关闭。")
+
+
+def run_direct():
+    """抓取后立即入库 (不经过 spool)，每个公司提交一次事务"""
     connection = create_db_connection()
     if not connection:
         return
@@ -190,6 +385,7 @@ def main():
     cursor = connection.cursor()
 
     try:
+        ensure_change_table(connection)
         for company in COMPANIES_TO_PROCESS:
             print(f"\n{'=' * 20} 开始处理公司: {company} {'=' * 20}")
 
@@ -201,7 +397,8 @@ def main():
 
                 if api_data:
                     # 开始递归插入过程
-                    process_and_insert(cursor, api_data, table_prefix)
+                    process_and_insert(cursor, api_data, table_prefix, company=company)
+                    record_company_change(cursor, company, table_prefix)
 
             # 处理完一个公司的所有接口后，提交事务
             print(f"完成公司 '{company}' 的所有数据处理，提交事务。")
@@ -217,8 +414,34 @@ def main():
             print("\n数据库连接已关闭。")
 
 
+# ============================= 5. 主执行函数 =============================
+
+RUN_MODES = {
+    'direct': run_direct,  # 抓取与入库在同一循环中完成 (原有方式)
+    'fetch': run_fetch,  # 只抓取到 spool
+    'load': run_load,  # 只从 spool 入库
+    'replay': lambda: run_load(replay=True),  # 重置位点后从 spool 重新入库
+    'all': lambda: (run_fetch(), run_load())[1],  # 先抓取到 spool 再入库
+}
+
+
+def main(mode: str = 'direct') -> int:
+    """
+    主执行函数
+
+    :param mode: 运行模式，见 RUN_MODES；默认与原来一样抓取后直接入库
+    :return: 进程退出码，运行模式未知或入库失败时为 1
+    """
+    if mode not in RUN_MODES:
+        print(f"未知的运行模式 '{mode}'，可选值: {', '.join(RUN_MODES)}")
+        return 1
+    ok = RUN_MODES[mode]()
+    print_pool_metrics()
+    return 1 if ok is False else 0
+
+
 if __name__ == '__main__':
     if   DB_CONFIG['user'] == 'your_username':
         print("[警告] 请先在脚本中配置您的数据库信息 (DB_CONFIG)  ！")
     else:
-        main()
+        sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else 'direct'))
@@ -1,12 +1,12 @@
 import json
 import re
 import requests
-import mysql.connector
 from mysql.connector import Error
+from etl_pools import http_session, mysql_pool
 
 # ============================= 1. 用戶配置區 =============================
 
-# 請在此處配置您的數據庫連接信息
+# 請在此處配置您的數據庫連接信息 (config.ini 的 [mysql] 節或 ETL_MYSQL_* 環境變量可覆蓋，見 etl_pools.py)
 DB_CONFIG = {
     'host': 'localhost',  # 數據庫主機地址
     'user': 'your_username',  # 數據庫用戶名
@@ -34,6 +34,12 @@ INTERFACE_DICT = {
 }
 
 
+# 每一行 (主表和子表) 都寫入查詢的公司名，與 apijsontosql3.COMPANY_KEY_COLUMN 一致
+COMPANY_KEY_COLUMN = 'query_company'
+# 接口字段與生成的列 (id、ingest_date、查詢公司名、外鍵) 重名時加上該前綴，與 apijsontosql3 的建表規則一致
+RESERVED_COLUMN_PREFIX = 'src_'
+
+
 # ============================= 2. 輔助函數和數據庫操作 =============================
 
 def to_snake_case(name):
@@ -43,9 +49,9 @@ def to_snake_case(name):
 
 
 def create_db_connection():
-    """創建並返回一個數據庫連接"""
+    """從連接池借出一個數據庫連接，close() 時歸還連接池"""
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        connection = mysql_pool('mysql', DB_CONFIG).acquire()
         if connection.is_connected():
             print("數據庫連接成功。")
             return connection
@@ -70,7 +76,7 @@ def fetch_api_data(company_name: str, api_path: str):
 
     print(f"  正在從接口 '{api_path}' 獲取 '{company_name}' 的數據...")
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=20)
+        response = http_session().get(url, headers=headers, params=params, timeout=20)
         response.raise_for_status()  # 如果請求失敗則拋出異常
 
         result = response.json()
@@ -103,7 +109,8 @@ def insert_data(cursor, table_name: str, data: dict):
 
     try:
         # 提取字典的值，並確保順序與列名一致
-        values = list(data.values())
+        # 空字符串按 NULL 寫入: 建表時日期/金額字段使用了 DATE、DECIMAL 等精確類型，嚴格模式下不接受 ''
+        values = [None if value == '' else value for value in data.values()]
         cursor.execute(sql, values)
         # 返回新插入行的自增 ID，用於關聯子表
         return cursor.lastrowid
@@ -116,7 +123,8 @@ def insert_data(cursor, table_name: str, data: dict):
 
 # ============================= 3. 核心處理邏輯 =============================
 
-def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None, parent_table_name=None):
+def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None, parent_table_name=None,
+                       company=None):
     """
     遞歸地處理 JSON 數據，並將其插入到對應的數據庫表中。
 
@@ -125,11 +133,12 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
     :param table_name_prefix: 表名的前綴 (如 'base_info', 'certifications')
     :param parent_id: 父記錄在數據庫中的 ID
     :param parent_table_name: 父表的全名 (如 'base_info')
+    :param company: 查詢的公司名，寫入每一行的 COMPANY_KEY_COLUMN 列
     """
     if isinstance(json_data, list):
         # 如果是列表，遍歷其中每個元素並遞歸處理
         for item in json_data:
-            process_and_insert(cursor, item, table_name_prefix, parent_id, parent_table_name)
+            process_and_insert(cursor, item, table_name_prefix, parent_id, parent_table_name, company)
         return
 
     if not isinstance(json_data, dict):
@@ -148,11 +157,18 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
 
     # 2. 插入當前層級的數據到主表
     current_table_name = to_snake_case(table_name_prefix)
+    foreign_key_column = f"{to_snake_case(parent_table_name)}_id" if parent_id and parent_table_name else None
+
+    # 與生成的列重名的接口字段 (如接口自帶的 id) 加上前綴，避免覆蓋自增主鍵
+    reserved = {'id', 'ingest_date', COMPANY_KEY_COLUMN, foreign_key_column}
+    simple_fields = {(RESERVED_COLUMN_PREFIX + to_snake_case(key)) if to_snake_case(key) in reserved else key: value
+                     for key, value in simple_fields.items()}
 
     # 如果存在父ID，需要將外鍵添加到待插入數據中
-    if parent_id and parent_table_name:
-        foreign_key_column = f"{to_snake_case(parent_table_name)}_id"
+    if foreign_key_column:
         simple_fields[foreign_key_column] = parent_id
+    if company is not None:
+        simple_fields[COMPANY_KEY_COLUMN] = company
 
     # 只有在有簡單字段時才執行插入
     if not simple_fields:
@@ -167,7 +183,7 @@ def process_and_insert(cursor, json_data, table_name_prefix: str, parent_id=None
         # 構造子表的名稱，如 base_info_staff_list
         child_table_prefix = f"{table_name_prefix}_{key}"
         # 遞歸處理，傳入新創建的記錄ID作为父ID
-        process_and_insert(cursor, value, child_table_prefix, new_id, current_table_name)
+        process_and_insert(cursor, value, child_table_prefix, new_id, current_table_name, company)
 
 
 # ============================= 4. 主執行函數 =============================
@@ -192,7 +208,7 @@ def main():
 
                 if api_data:
                     # 開始遞歸插入過程
-                    process_and_insert(cursor, api_data, table_prefix)
+                    process_and_insert(cursor, api_data, table_prefix, company=company)
 
             # 處理完一個公司的所有接口後，提交事務
             print(f"完成公司 '{company}' 的所有數據處理，提交事務。")
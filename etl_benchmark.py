@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+dataetlinsert.py 端到端性能基准
+
+在本地启动一个模拟 fireeyes 接口的 HTTP 服务，按 实际返回数据.md 中的样例
+回放并按需放大返回数据 (每次返回的条数、嵌套深度、接口延迟均可配置)，
+入库使用内存中的数据库替身 (可模拟每次往返的延迟)。
+对每种入库模式输出 公司数/秒、行数/秒、数据库往返次数 和 Python 堆内存峰值。
+
+使用方法:
+    python etl_benchmark.py --companies 50 --items 20 --depth 2 --latency-ms 5 --db-latency-ms 0.2
+"""
+
+import argparse
+import ast
+import contextlib
+import copy
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import dataetlinsert
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "实际返回数据.md")
+
+# 样例文件缺失时使用的兜底模板 (与 1049 企业信用评级的返回结构一致)
+FALLBACK_ITEM = {
+    'name': '上海建工集团股份有限公司',
+    'row_content': {'ratingOutlook': '稳定', 'ratingDate': '2021-09-17', 'gid': 24703069,
+                    'ratingCompanyName': '中债资信评估有限责任公司', 'bondCreditLevel': '',
+                    'logo': 'https://img5.tianyancha.com/logo/lll/6f0c46e529b0a2db4737c1e009d32ff4.png@!f_200x200',
+                    'alias': '中债资信', 'subjectLevel': 'AA+ pi'},
+    'disabled': False,
+    'last_update_time': '2025-07-07T01:09:13.199188',
+    'interface_id': 1049,
+    'interface_name': '企业信用评级',
+}
+
+# 基准使用的接口字典，接口 id 与样例中的 interface_id 对应
+BENCH_INTERFACE_DICT = {
+    "1049": ("credit_ratings", "企业信用评级"),
+    "884": ("tax_ratings", "税务评级"),
+}
+
+
+# ============================= 1. 样例数据 =============================
+
+def load_sample_items(path: str = SAMPLE_FILE) -> Dict[str, List[dict]]:
+    """从 实际返回数据.md 中解析样例返回，按 interface_id 分组"""
+    samples: Dict[str, List[dict]] = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith('{'):
+                    continue
+                try:
+                    payload = ast.literal_eval(line)
+                except (ValueError, SyntaxError):
+                    # 样例可能被截断，跳过无法解析的行
+                    continue
+                for item in payload.get('items', []):
+                    samples.setdefault(str(item.get('interface_id')), []).append(item)
+    if not samples:
+        samples[str(FALLBACK_ITEM['interface_id'])] = [FALLBACK_ITEM]
+    return samples
+
+
+def _nested_detail(depth: int, fanout: int, seq: int) -> List[dict]:
+    """生成 depth 层、每层 fanout 条的嵌套明细，模拟接口中的子列表"""
+    if depth <= 0:
+        return []
+    details = []
+    for i in range(fanout):
+        node = {'detailNo': seq * 100 + i, 'detailName': f'明细{seq}-{i}', 'amount': 1000 + i}
+        children = _nested_detail(depth - 1, fanout, seq * 10 + i)
+        if children:
+            node['detailList'] = children
+        details.append(node)
+    return details
+
+
+def build_payload(samples: Dict[str, List[dict]], company: str, interface_id: str,
+                  items: int, depth: int, fanout: int) -> dict:
+    """按样例放大生成一次接口返回"""
+    templates = samples.get(interface_id) or next(iter(samples.values()))
+    result = []
+    for i in range(items):
+        item = copy.deepcopy(templates[i % len(templates)])
+        item['name'] = company
+        row = item.get('row_content')
+        if isinstance(row, dict):
+            if 'gid' in row:
+                row['gid'] = row['gid'] + i
+            if depth > 0:
+                row['detailList'] = _nested_detail(depth, fanout, i)
+        result.append(item)
+    return {'err_code': 0, 'items': result}
+
+
+# ============================= 2. 本地 fireeyes 替身 =============================
+
+class FireeyesStub:
+    """在本地线程中运行的 fireeyes 接口替身"""
+
+    def __init__(self, items: int = 10, depth: int = 0, fanout: int = 2, latency_ms: float = 0.0):
+        self.items = items
+        self.depth = depth
+        self.fanout = fanout
+        self.latency_ms = latency_ms
+        self.samples = load_sample_items()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                params = json.loads(self.rfile.read(length) or b'{}')
+                if stub.latency_ms:
+                    time.sleep(stub.latency_ms / 1000)
+                payload = build_payload(stub.samples, params.get('name', ''), str(params.get('interface_id')),
+                                        stub.items, stub.depth, stub.fanout)
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                with stub._lock:
+                    stub.requests += 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/fireeyes/interface"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+# ============================= 3. 数据库替身 =============================
+
+class StandInCursor:
+    """记录往返次数和写入行数的游标替身"""
+
+    def __init__(self, connection: 'StandInConnection'):
+        self.connection = connection
+        self.lastrowid = None
+        self.rowcount = 0
+
+    def execute(self, sql: str, params=None):
+        self.connection._round_trip()
+        self.lastrowid = self.connection._next_id()
+        self.rowcount = 1
+        self.connection.rows += 1
+
+    def executemany(self, sql: str, seq_params):
+        self.connection._round_trip()
+        count = 0
+        for _ in seq_params:
+            self.lastrowid = self.connection._next_id()
+            count += 1
+        self.rowcount = count
+        self.connection.rows += count
+
+    def close(self):
+        pass
+
+
+class StandInConnection:
+    """
+    mysql.connector 连接替身，不做持久化，只统计。
+
+    :param round_trip_ms: 每次往返模拟的网络/执行延迟 (毫秒)
+    """
+
+    def __init__(self, round_trip_ms: float = 0.0):
+        self.round_trip_ms = round_trip_ms
+        self.round_trips = 0
+        self.rows = 0
+        self.commits = 0
+        self._last_id = 0
+        self._connected = True
+
+    def _round_trip(self):
+        self.round_trips += 1
+        if self.round_trip_ms:
+            time.sleep(self.round_trip_ms / 1000)
+
+    def _next_id(self) -> int:
+        self._last_id += 1
+        return self._last_id
+
+    def cursor(self, *args, **kwargs):
+        return StandInCursor(self)
+
+    def commit(self):
+        self._round_trip()
+        self.commits += 1
+
+    def rollback(self):
+        self._round_trip()
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def close(self):
+        self._connected = False
+
+
+# ============================= 4. 基准执行 =============================
+
+def _run_direct():
+    dataetlinsert.run_direct()
+
+
+def _run_spool():
+    dataetlinsert.run_fetch()
+    dataetlinsert.run_load()
+
+
+LOADER_MODES = {
+    'direct': _run_direct,
+    'spool': _run_spool,
+}
+
+
+def run_mode(mode: str, stub: FireeyesStub, companies: List[str], db_latency_ms: float) -> Dict[str, Any]:
+    """在替身环境中运行一种入库模式并收集指标"""
+    connection = StandInConnection(db_latency_ms)
+    spool_dir = tempfile.mkdtemp(prefix='etl_bench_spool_')
+    saved = (dataetlinsert.API_URL, dataetlinsert.COMPANIES_TO_PROCESS, dataetlinsert.INTERFACE_DICT,
+             dataetlinsert.create_db_connection, dict(dataetlinsert.SPOOL_CONFIG))
+    dataetlinsert.API_URL = stub.url
+    dataetlinsert.COMPANIES_TO_PROCESS = companies
+    dataetlinsert.INTERFACE_DICT = BENCH_INTERFACE_DICT
+    dataetlinsert.create_db_connection = lambda: connection
+    dataetlinsert.SPOOL_CONFIG['spool_dir'] = spool_dir
+    requests_before = stub.requests
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        # 脚本本身的逐行打印会严重干扰计时，基准期间全部丢弃
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            LOADER_MODES[mode]()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        (dataetlinsert.API_URL, dataetlinsert.COMPANIES_TO_PROCESS, dataetlinsert.INTERFACE_DICT,
+         dataetlinsert.create_db_connection, spool_config) = saved
+        dataetlinsert.SPOOL_CONFIG.clear()
+        dataetlinsert.SPOOL_CONFIG.update(spool_config)
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    return {
+        'mode': mode,
+        'seconds': round(elapsed, 3),
+        'companies_per_sec': round(len(companies) / elapsed, 2) if elapsed else None,
+        'rows': connection.rows,
+        'rows_per_sec': round(connection.rows / elapsed, 1) if elapsed else None,
+        'db_round_trips': connection.round_trips,
+        'db_commits': connection.commits,
+        'api_requests': stub.requests - requests_before,
+        'peak_python_mem_mb': round(peak / 1024 / 1024, 2),
+    }
+
+
+def print_report(results: List[Dict[str, Any]]):
+    headers = ['mode', 'seconds', 'companies_per_sec', 'rows', 'rows_per_sec',
+               'db_round_trips', 'db_commits', 'api_requests', 'peak_python_mem_mb']
+    widths = [max(len(h), *(len(str(r[h])) for r in results)) for h in headers]
+    print('  '.join(h.ljust(w) for h, w in zip(headers, widths)))
+    for r in results:
+        print('  '.join(str(r[h]).ljust(w) for h, w in zip(headers, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dataetlinsert.py 端到端性能基准")
+    parser.add_argument('--companies', type=int, default=20, help="模拟处理的公司数量")
+    parser.add_argument('--items', type=int, default=10, help="每次接口返回的条数")
+    parser.add_argument('--depth', type=int, default=0, help="每条记录中嵌套明细的层数")
+    parser.add_argument('--fanout', type=int, default=2, help="嵌套明细每层的条数")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="接口替身每次请求的延迟 (毫秒)")
+    parser.add_argument('--db-latency-ms', type=float, default=0.0, help="数据库替身每次往返的延迟 (毫秒)")
+    parser.add_argument('--modes', default=','.join(LOADER_MODES), help="要测试的入库模式，逗号分隔")
+    parser.add_argument('--json', dest='json_path', help="把结果另存为 JSON 文件")
+    args = parser.parse_args()
+
+    companies = [f"基准测试公司{i:05d}" for i in range(args.companies)]
+    stub = FireeyesStub(args.items, args.depth, args.fanout, args.latency_ms).start()
+    print(f"接口替身已启动: {stub.url}")
+    try:
+        results = [run_mode(mode.strip(), stub, companies, args.db_latency_ms)
+                   for mode in args.modes.split(',') if mode.strip()]
+    finally:
+        stub.stop()
+
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'params': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,437 @@
+"""
+ETL 脚本共用的连接池与配置
+
+各脚本原来各自用硬编码的字典建立连接，每次调用都重新握手和认证。
+这里按配置提供进程内共享的连接池:
+- mysql_pool  MySQL / Doris (mysql.connector)
+- oracle_pool Oracle (cx_Oracle)
+- http_session 带连接池的 requests.Session (keep-alive 复用 TCP / TLS 连接)
+
+配置优先级 (后者覆盖前者):
+    1. 脚本传入的默认值 (原来的 DB_CONFIG 等字典，保持原有行为)
+    2. 配置文件的同名节，默认为当前目录的 config.ini，可用环境变量 ETL_CONFIG 指定
+    3. 环境变量 ETL_<节名>_<键名>，如 ETL_MYSQL_PASSWORD、ETL_ORACLE_HOST
+
+config.ini 示例:
+    [mysql]
+    host = localhost
+    user = root
+    password = ...
+    database = rsk_mail
+    pool_size = 4
+
+    [oracle]
+    host = 10.36.201.123
+    port = 1521
+    service_name = scgec
+    user = zjw
+    password = ...
+
+    [http]
+    pool_size = 8
+    max_retries = 2
+
+配置在每个连接池首次创建时读取一次 (之后的调用直接返回已有的连接池)，
+修改 config.ini 或环境变量后需要重启进程才会生效。
+
+池中连接以代理对象借出，调用 close() 或退出 with 块时归还连接池 (未提交的事务先回滚)，
+因此原来 "connect ... close" 形式的调用方无需改动。pool_metrics() 返回各连接池的
+新建 / 复用 / 等待次数等统计。
+"""
+
+import atexit
+import configparser
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_CONFIG_PATH = 'config.ini'
+ENV_PREFIX = 'ETL_'
+
+# 连接池参数，不会传给数据库驱动
+POOL_KEYS = ('pool_size', 'acquire_timeout', 'ping_after')
+DEFAULT_POOL_SIZE = 4
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+# 连接空闲超过该秒数后，借出前先 ping 一次，断开的连接丢弃重建
+DEFAULT_PING_AFTER = 60.0
+
+_registry_lock = threading.Lock()
+_pools: Dict[tuple, Any] = {}
+
+
+# ============================= 1. 配置 =============================
+
+def load_settings(section: str, defaults: Optional[Dict[str, Any]] = None,
+                  config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    读取一个节的配置: 默认值 < 配置文件 < 环境变量
+
+    :param section: 节名 (mysql / doris / oracle / http ...)
+    :param defaults: 脚本内置的默认值
+    :param config_path: 配置文件路径，默认取环境变量 ETL_CONFIG 或 config.ini
+    :return: 合并后的配置字典 (键名统一小写)
+    """
+    settings = {str(k).lower(): v for k, v in (defaults or {}).items()}
+    parser = configparser.ConfigParser()
+    parser.read(config_path or os.environ.get('ETL_CONFIG', DEFAULT_CONFIG_PATH), encoding='utf-8')
+    if parser.has_section(section):
+        settings.update(parser[section])
+    prefix = f"{ENV_PREFIX}{section.upper()}_"
+    for name, value in os.environ.items():
+        if name.startswith(prefix):
+            settings[name[len(prefix):].lower()] = value
+    return settings
+
+
+def _split_pool_options(settings: Dict[str, Any]):
+    options = {
+        'size': int(settings.get('pool_size', DEFAULT_POOL_SIZE)),
+        'acquire_timeout': float(settings.get('acquire_timeout', DEFAULT_ACQUIRE_TIMEOUT)),
+        'ping_after': float(settings.get('ping_after', DEFAULT_PING_AFTER)),
+    }
+    return {k: v for k, v in settings.items() if k not in POOL_KEYS}, options
+
+
+# ============================= 2. 数据库连接池 =============================
+
+class PooledConnection:
+    """从连接池借出的连接代理，close() 归还而不是断开，其余属性和方法转发给原连接"""
+
+    def __init__(self, pool: 'ConnectionPool', connection):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise RuntimeError(f"连接已归还连接池 {self._pool.name}，不能再使用")
+        return getattr(self._connection, name)
+
+    def close(self):
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection)
+
+    def discard(self):
+        """连接已不可用 (如网络中断) 时调用，直接断开，不放回连接池"""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection, discard=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    线程安全的通用连接池
+
+    - 连接按需创建，最多 size 个；空闲连接后进先出，优先借出最近使用过的 (最"热"的) 连接
+    - 空闲超过 ping_after 秒的连接借出前先检查，失效则重建
+    - 池满时等待归还，超过 acquire_timeout 抛出 TimeoutError
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], size: int = DEFAULT_POOL_SIZE,
+                 acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT, ping_after: float = DEFAULT_PING_AFTER,
+                 ping: Optional[Callable[[Any], bool]] = None, reset: Optional[Callable[[Any], None]] = None):
+        """
+        :param name: 连接池名称 (用于统计输出)
+        :param factory: 新建一个连接的函数
+        :param ping: 检查连接是否可用的函数，返回 False 或抛出异常时视为失效
+        :param reset: 归还前清理连接状态的函数 (如回滚未提交的事务)
+        """
+        self.name = name
+        self.factory = factory
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.ping_after = ping_after
+        self.ping = ping
+        self.reset = reset
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._all = set()
+        self.stats = {
+            'created': 0,  # 新建的连接数 (即握手 + 认证次数)
+            'reused': 0,  # 直接借出空闲连接的次数
+            'acquired': 0,
+            'waits': 0,  # 池满需要等待的次数
+            'wait_ms_total': 0.0,
+            'wait_ms_max': 0.0,
+            'connect_ms_total': 0.0,
+            'ping_failures': 0,
+            'discarded': 0,
+            'in_use': 0,
+            'peak_in_use': 0,
+        }
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """借出一个连接，用完后 close() 或以 with 块归还"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        if not self._slots.acquire(blocking=False):
+            if not self._slots.acquire(timeout=timeout):
+                raise TimeoutError(f"连接池 {self.name} 在 {timeout:g} 秒内没有可用连接 (上限 {self.size})")
+            waited = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self.stats['waits'] += 1
+                self.stats['wait_ms_total'] += waited
+                self.stats['wait_ms_max'] = max(self.stats['wait_ms_max'], waited)
+        try:
+            connection = self._take_idle()
+            if connection is None:
+                connecting = time.perf_counter()
+                connection = self.factory()
+                with self._lock:
+                    self._all.add(connection)
+                    self.stats['created'] += 1
+                    self.stats['connect_ms_total'] += (time.perf_counter() - connecting) * 1000
+            else:
+                with self._lock:
+                    self.stats['reused'] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats['acquired'] += 1
+            self.stats['in_use'] += 1
+            self.stats['peak_in_use'] = max(self.stats['peak_in_use'], self.stats['in_use'])
+        return PooledConnection(self, connection)
+
+    def _take_idle(self):
+        """取出一个可用的空闲连接，没有时返回 None"""
+        while True:
+            try:
+                connection, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self.ping is None or time.monotonic() - idle_since < self.ping_after:
+                return connection
+            try:
+                alive = self.ping(connection)
+            except Exception:
+                alive = False
+            if alive is not False:
+                return connection
+            with self._lock:
+                self.stats['ping_failures'] += 1
+            self._close_quietly(connection)
+
+    def release(self, connection, discard: bool = False):
+        """归还连接 (由 PooledConnection.close 调用)"""
+        if not discard and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                discard = True
+        with self._lock:
+            self.stats['in_use'] -= 1
+        if discard:
+            with self._lock:
+                self.stats['discarded'] += 1
+            self._close_quietly(connection)
+        else:
+            self._idle.put((connection, time.monotonic()))
+        self._slots.release()
+
+    def _close_quietly(self, connection):
+        with self._lock:
+            self._all.discard(connection)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['open'] = len(self._all)
+        stats['idle'] = self._idle.qsize()
+        stats['size'] = self.size
+        stats['reuse_ratio'] = round(stats['reused'] / stats['acquired'], 4) if stats['acquired'] else None
+        for key in ('wait_ms_total', 'wait_ms_max', 'connect_ms_total'):
+            stats[key] = round(stats[key], 2)
+        return stats
+
+    def close(self):
+        """关闭所有空闲连接 (借出中的连接归还后才会关闭)"""
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_quietly(connection)
+
+
+def _get_or_create(kind: str, section: str, defaults: Optional[Dict[str, Any]], config_path: Optional[str],
+                   create: Callable[[Dict[str, Any]], Any]):
+    """
+    同一类型、节名和默认值只创建一个连接池；配置文件和环境变量只在创建时读取一次
+
+    :param create: 接收合并后的配置 (见 load_settings)，返回连接池
+    """
+    frozen_defaults = tuple(sorted((str(k).lower(), str(v)) for k, v in (defaults or {}).items()))
+    key = (kind, section, (config_path, frozen_defaults))
+    with _registry_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = create(load_settings(section, defaults, config_path))
+        return pool
+
+
+def _mysql_ping(connection) -> bool:
+    connection.ping(reconnect=False)
+    return True
+
+
+def _mysql_reset(connection):
+    if getattr(connection, 'in_transaction', True):
+        connection.rollback()
+
+
+def mysql_pool(section: str = 'mysql', defaults: Optional[Dict[str, Any]] = None,
+               config_path: Optional[str] = None) -> ConnectionPool:
+    """
+    MySQL / Doris 连接池 (Doris 使用 MySQL 协议，节名用 doris 即可)
+
+    :param section: 配置节名
+    :param defaults: 脚本内置的连接参数 (host / port / user / password / database ...)
+    """
+    def create(settings):
+        import mysql.connector
+
+        connect_args, options = _split_pool_options(settings)
+        if 'port' in connect_args:
+            connect_args['port'] = int(connect_args['port'])
+        return ConnectionPool(section, lambda: mysql.connector.connect(**connect_args),
+                              ping=_mysql_ping, reset=_mysql_reset, **options)
+
+    return _get_or_create('mysql', section, defaults, config_path, create)
+
+
+def _oracle_ping(connection) -> bool:
+    connection.ping()
+    return True
+
+
+def oracle_pool(section: str = 'oracle', defaults: Optional[Dict[str, Any]] = None,
+                config_path: Optional[str] = None) -> ConnectionPool:
+    """
+    Oracle 连接池
+
+    :param section: 配置节名
+    :param defaults: 脚本内置的连接参数 (host / port / service_name / user 或 username / password)
+    """
+    def create(settings):
+        import cx_Oracle
+
+        connect_args, options = _split_pool_options(settings)
+        dsn = connect_args.get('dsn') or cx_Oracle.makedsn(connect_args['host'], int(connect_args['port']),
+                                                          service_name=connect_args['service_name'])
+        user = connect_args.get('user') or connect_args.get('username')
+
+        def connect():
+            return cx_Oracle.connect(user=user, password=connect_args['password'], dsn=dsn)
+
+        # 归还时回滚，避免把未提交的事务带给下一个使用者
+        return ConnectionPool(section, connect, ping=_oracle_ping, reset=lambda c: c.rollback(), **options)
+
+    return _get_or_create('oracle', section, defaults, config_path, create)
+
+
+# ============================= 3. HTTP 会话 =============================
+
+class HttpSessionPool:
+    """共享的 requests.Session 及其连接复用统计"""
+
+    def __init__(self, name: str, pool_size: int, max_retries: int):
+        import requests
+        from http_timing import TimingHTTPAdapter
+
+        self.name = name
+        self.size = pool_size
+        self.session = requests.Session()
+        # TimingHTTPAdapter 在响应上标记连接是否复用 (request_timing['reused'])
+        adapter = TimingHTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=max_retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.hooks['response'].append(self._count)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'new_connections': 0, 'reused_connections': 0}
+
+    def _count(self, response, *args, **kwargs):
+        timing = getattr(response, 'request_timing', None) or {}
+        with self._lock:
+            self.stats['requests'] += 1
+            if timing.get('reused'):
+                self.stats['reused_connections'] += 1
+            else:
+                self.stats['new_connections'] += 1
+        return response
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats['size'] = self.size
+        stats['reuse_ratio'] = round(stats['reused_connections'] / stats['requests'], 4) if stats['requests'] else None
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+def http_session(section: str = 'http', defaults: Optional[Dict[str, Any]] = None,
+                 config_path: Optional[str] = None):
+    """
+    返回共享的 requests.Session (keep-alive 复用连接)
+
+    配置项: pool_size (每个主机的最大连接数)、max_retries (连接失败时的重试次数)
+    """
+    pool = _get_or_create('http', section, defaults, config_path, lambda settings: HttpSessionPool(
+        section, int(settings.get('pool_size', DEFAULT_POOL_SIZE)), int(settings.get('max_retries', 0))))
+    return pool.session
+
+
+# ============================= 4. 统计与关闭 =============================
+
+def pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """返回所有连接池的统计，键为 "类型:节名" """
+    with _registry_lock:
+        pools = list(_pools.items())
+    metrics = {}
+    for (kind, section, _), pool in pools:
+        name = f"{kind}:{section}"
+        suffix = 2
+        while name in metrics:
+            name, suffix = f"{kind}:{section}#{suffix}", suffix + 1
+        metrics[name] = pool.metrics()
+    return metrics
+
+
+def print_pool_metrics():
+    for name, stats in pool_metrics().items():
+        if 'requests' in stats:
+            print(f"连接池 {name}: 请求 {stats['requests']} 次, 新建连接 {stats['new_connections']}, "
+                  f"复用 {stats['reused_connections']}")
+        else:
+            print(f"连接池 {name}: 借出 {stats['acquired']} 次, 新建连接 {stats['created']}, "
+                  f"复用 {stats['reused']}, 等待 {stats['waits']} 次 (最长 {stats['wait_ms_max']} ms), "
+                  f"峰值占用 {stats['peak_in_use']}/{stats['size']}")
+
+
+@atexit.register
+def close_all():
+    """关闭所有连接池的空闲连接 (进程退出时自动调用)"""
+    with _registry_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception:
+            pass
@@ -0,0 +1,321 @@
+"""
+抓取与入库之间的本地预写缓冲 (spool)
+
+抓取阶段把接口返回结果追加到分段的 gzip JSON-lines 文件中，
+入库阶段按批次消费，并在数据库提交成功后再提交消费位点 (offset)。
+这样抓取和入库可以各自按自己的速度运行，数据库故障时已抓取的数据也不会丢失，
+需要时还可以重置位点重新入库而无需重新调用接口。
+
+目录结构:
+    spool/
+        segment-000001.jsonl.gz
+        segment-000002.jsonl.gz
+        offsets.json          # 各消费者已提交的位点
+        failures.json         # 各消费者处理失败的记录及失败次数
+        quarantine/           # 多次处理失败后移出的记录 (<消费者>-<分段>-<行号>.json)
+
+每个分段由若干个完整的 gzip member 首尾相接组成，每次 flush 写入一个 member，
+因此进程崩溃最多只会在分段末尾留下一个不完整的 member，读取时会被安全地忽略。
+"""
+
+import gzip
+import json
+import os
+import re
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SEGMENT_PATTERN = re.compile(r'^segment-(\d{6})\.jsonl\.gz$')
+OFFSET_FILE = 'offsets.json'
+FAILURE_FILE = 'failures.json'
+QUARANTINE_DIR = 'quarantine'
+
+# fsync 策略: always = 每次 flush 都落盘; batch = 每 fsync_interval 秒最多一次; never = 交给操作系统
+FSYNC_POLICIES = ('always', 'batch', 'never')
+
+
+def _segment_name(segment_no: int) -> str:
+    return f"segment-{segment_no:06d}.jsonl.gz"
+
+
+def list_segments(spool_dir: str) -> List[int]:
+    """返回 spool 目录中所有分段编号 (升序)"""
+    if not os.path.isdir(spool_dir):
+        return []
+    numbers = []
+    for name in os.listdir(spool_dir):
+        match = SEGMENT_PATTERN.match(name)
+        if match:
+            numbers.append(int(match.group(1)))
+    return sorted(numbers)
+
+
+def _fsync_dir(path: str):
+    """目录项变更 (新建/重命名) 后同步目录本身，保证崩溃后文件仍可见"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# ============================= 1. 写入端 =============================
+
+class SpoolWriter:
+    """
+    追加写入 spool。
+
+    记录先缓存在内存中，达到 flush_records 条或调用 flush() 时压缩成一个 gzip member
+    追加到当前分段；当前分段超过 max_segment_bytes 后滚动到新分段。
+    """
+
+    def __init__(self, spool_dir: str = "spool", max_segment_bytes: int = 64 * 1024 * 1024,
+                 flush_records: int = 100, fsync_policy: str = 'batch', fsync_interval: float = 1.0,
+                 compress_level: int = 6):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"未知的 fsync 策略: {fsync_policy}，可选值为 {FSYNC_POLICIES}")
+        self.spool_dir = spool_dir
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_records = flush_records
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.compress_level = compress_level
+
+        os.makedirs(spool_dir, exist_ok=True)
+        # 每次启动都从新分段开始写，避免追加到上次崩溃时可能残留的半个 member 之后
+        segments = list_segments(spool_dir)
+        self.segment_no = segments[-1] + 1 if segments else 1
+        self._buffer: List[bytes] = []
+        self._last_fsync = time.monotonic()
+        self._file = None
+        self._open_segment()
+
+    def _open_segment(self):
+        path = os.path.join(self.spool_dir, _segment_name(self.segment_no))
+        self._file = open(path, 'ab')
+        _fsync_dir(self.spool_dir)
+
+    def append(self, record: Dict[str, Any]):
+        """追加一条记录 (必须可被 JSON 序列化)"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str)
+        self._buffer.append(line.encode('utf-8') + b'\n')
+        if len(self._buffer) >= self.flush_records:
+            self.flush()
+
+    def flush(self, force_fsync: bool = False):
+        """把缓存的记录压缩为一个 gzip member 写入当前分段"""
+        if self._buffer:
+            member = gzip.compress(b''.join(self._buffer), compresslevel=self.compress_level)
+            self._buffer = []
+            self._file.write(member)
+            self._file.flush()
+
+            now = time.monotonic()
+            if force_fsync or self.fsync_policy == 'always' or (
+                    self.fsync_policy == 'batch' and now - self._last_fsync >= self.fsync_interval):
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+            if self._file.tell() >= self.max_segment_bytes:
+                self._roll()
+        elif force_fsync:
+            os.fsync(self._file.fileno())
+
+    def _roll(self):
+        """关闭当前分段并开启下一个分段"""
+        if self.fsync_policy != 'never':
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self.segment_no += 1
+        self._open_segment()
+
+    def close(self):
+        self.flush(force_fsync=self.fsync_policy != 'never')
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# ============================= 2. 读取端 =============================
+
+def _read_segment(path: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+    """
+    逐行流式读取一个分段，内存占用与分段大小无关。
+
+    只有完整的 gzip member 中的行才会被返回；分段末尾如果有未写完的 member
+    (写入端崩溃)，会被安全地忽略。
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pending = b''
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                return
+            while data:
+                try:
+                    pending += decompressor.decompress(data)
+                except zlib.error:
+                    return
+                if not decompressor.eof:
+                    break
+                # 一个 member 完整结束，输出其中的行并继续解析后续 member
+                for line in pending.splitlines():
+                    if line:
+                        yield line
+                pending = b''
+                data = decompressor.unused_data
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+class SpoolReader:
+    """
+    按位点消费 spool。
+
+    位点为 (分段编号, 分段内行号)，表示下一条待处理记录的位置。
+    只有调用 commit() 后位点才会持久化，因此入库失败时重新运行会从上次提交处继续。
+    """
+
+    def __init__(self, spool_dir: str = "spool", consumer: str = "mysql_loader"):
+        self.spool_dir = spool_dir
+        self.consumer = consumer
+        os.makedirs(spool_dir, exist_ok=True)
+
+    # --- 位点管理 ---
+
+    def _load_offsets(self) -> Dict[str, List[int]]:
+        path = os.path.join(self.spool_dir, OFFSET_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def committed_offset(self) -> Tuple[int, int]:
+        """返回已提交的位点；从未提交过时从第一个分段开头开始"""
+        offsets = self._load_offsets()
+        if self.consumer in offsets:
+            segment_no, line_no = offsets[self.consumer]
+            return segment_no, line_no
+        segments = list_segments(self.spool_dir)
+        return (segments[0] if segments else 1), 0
+
+    def commit(self, offset: Tuple[int, int]):
+        """原子地持久化位点 (写临时文件后 rename)"""
+        offsets = self._load_offsets()
+        offsets[self.consumer] = list(offset)
+        self._write_json(OFFSET_FILE, offsets)
+
+    def _write_json(self, name: str, data: Any):
+        path = os.path.join(self.spool_dir, name)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _fsync_dir(self.spool_dir)
+
+    def record_failure(self, offset: Tuple[int, int], record: Dict[str, Any], error: Exception,
+                       max_attempts: int = 3) -> bool:
+        """
+        记录一条记录处理失败；累计失败 max_attempts 次后把它移到 quarantine/ 目录。
+
+        :param offset: 该记录的位点 (read_from 返回的位点)
+        :param max_attempts: 允许的失败次数
+        :return: 是否已移出 (True 时调用方应提交该位点跳过此记录，否则应停止并在下次运行时重试)
+        """
+        path = os.path.join(self.spool_dir, FAILURE_FILE)
+        failures = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                failures = json.load(f)
+        key = f"{offset[0]}:{offset[1]}"
+        consumer_failures = failures.setdefault(self.consumer, {})
+        attempts = consumer_failures.get(key, 0) + 1
+        if attempts < max_attempts:
+            consumer_failures[key] = attempts
+            self._write_json(FAILURE_FILE, failures)
+            return False
+
+        quarantine_dir = os.path.join(self.spool_dir, QUARANTINE_DIR)
+        os.makedirs(quarantine_dir, exist_ok=True)
+        with open(os.path.join(quarantine_dir, f"{self.consumer}-{offset[0]:06d}-{offset[1]:06d}.json"), 'w',
+                  encoding='utf-8') as f:
+            json.dump({'offset': list(offset), 'attempts': attempts, 'error': f"{type(error).__name__}: {error}",
+                       'record': record}, f, ensure_ascii=False, default=str)
+        consumer_failures.pop(key, None)
+        self._write_json(FAILURE_FILE, failures)
+        return True
+
+    def reset(self, offset: Optional[Tuple[int, int]] = None):
+        """重置位点用于重放；默认回到最早的分段开头"""
+        if offset is None:
+            segments = list_segments(self.spool_dir)
+            offset = ((segments[0] if segments else 1), 0)
+        self.commit(offset)
+
+    # --- 读取 ---
+
+    def read_from(self, offset: Tuple[int, int]) -> Iterator[Tuple[Tuple[int, int], Dict[str, Any]]]:
+        """
+        从给定位点开始读取记录。
+
+        :return: 迭代 (下一条记录的位点, 记录)，提交该位点即表示此记录已处理完毕
+        """
+        start_segment, start_line = offset
+        for segment_no in list_segments(self.spool_dir):
+            if segment_no < start_segment:
+                continue
+            path = os.path.join(self.spool_dir, _segment_name(segment_no))
+            skip = start_line if segment_no == start_segment else 0
+            for line_no, line in enumerate(_read_segment(path)):
+                if line_no < skip:
+                    continue
+                yield (segment_no, line_no + 1), json.loads(line)
+
+    def read_batches(self, batch_size: int = 200) -> Iterator[Tuple[Tuple[int, int], List[Dict[str, Any]]]]:
+        """
+        从已提交位点开始按批次读取。
+
+        :return: 迭代 (批次结束后的位点, 记录列表)
+        """
+        batch = []
+        next_offset = self.committed_offset()
+        for next_offset, record in self.read_from(next_offset):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield next_offset, batch
+                batch = []
+        if batch:
+            yield next_offset, batch
+
+    def purge_consumed(self, keep_segments: int = 0) -> int:
+        """
+        删除所有消费者都已完整消费的分段 (总是保留最新分段，它可能仍在写入)。
+
+        :param keep_segments: 额外保留的已消费分段数量，便于短期重放
+        :return: 删除的分段数量
+        """
+        offsets = self._load_offsets()
+        if not offsets:
+            return 0
+        min_segment = min(segment_no for segment_no, _ in offsets.values())
+        segments = list_segments(self.spool_dir)
+        removable = [n for n in segments[:-1] if n < min_segment]
+        if keep_segments:
+            removable = removable[:-keep_segments]
+        for segment_no in removable:
+            os.remove(os.path.join(self.spool_dir, _segment_name(segment_no)))
+        return len(removable)
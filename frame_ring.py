@@ -0,0 +1,300 @@
+"""
+共享内存帧环形缓冲区: 每路摄像头只解码一次，多个消费者共享
+
+生产者进程打开视频源，把解码后的帧依次写入 multiprocessing.shared_memory 中的
+固定形状环形缓冲区 (slots 个 高 x 宽 x 通道 的 uint8 帧)，每一帧带递增的序号和采集时间。
+姿态推理、录像、预览等消费者按名称 attach 同一块共享内存，直接得到指向缓冲区的
+NumPy 视图 (不经过 pickle / 管道复制)，因此解码开销与消费者数量无关。
+
+共享内存布局 (均为 little-endian):
+    [0, 64)     头部 int64 x 8: magic, 版本, slots, 高, 宽, 通道, 最新序号, 是否已关闭
+    [64, 72)    float64: 源帧率 (未知为 0)
+    [128, ...)  每个槽位的序号 int64 x slots、采集时间 float64 x slots，之后 64 字节对齐的帧数据
+
+只有一个写入方，不加锁: 写入时先把槽位序号置为 -1，写完帧数据后再写入新序号和最新序号。
+读取方以槽位序号判断数据是否完整、是否已被覆盖 (is_current)。
+零拷贝视图在生产者绕回该槽位前有效 (约 slots 帧的时间)，处理较慢的消费者应加大 slots
+或读取时 copy=True。
+
+使用方法:
+    python frame_ring.py --source 0 --name cam0 --slots 16      # 生产者
+    python humanposetest.py --source ring:cam0                   # 消费者之一
+"""
+
+import argparse
+import time
+
+import cv2 as cv
+import numpy as np
+from multiprocessing import resource_tracker, shared_memory
+
+RING_MAGIC = int.from_bytes(b'FRMRING1', 'little')
+RING_VERSION = 1
+RING_PREFIX = 'ring:'
+_HEADER_BYTES = 128
+_MAGIC, _VERSION, _SLOTS, _HEIGHT, _WIDTH, _CHANNELS, _WRITE_SEQ, _CLOSED = range(8)
+
+
+def _layout(slots, height, width, channels):
+    """返回 (槽位序号偏移, 采集时间偏移, 帧数据偏移, 总字节数)"""
+    seq_offset = _HEADER_BYTES
+    time_offset = seq_offset + 8 * slots
+    frame_offset = (time_offset + 8 * slots + 63) // 64 * 64
+    return seq_offset, time_offset, frame_offset, frame_offset + slots * height * width * channels
+
+
+def _open_shared_memory(name):
+    """attach 已有的共享内存，且不让本进程的 resource_tracker 在退出时把它删除"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class FrameRing:
+    """共享内存中的帧环形缓冲区，由 create (生产者) 或 attach (消费者) 得到"""
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+        self.name = shm.name
+        self._header = np.ndarray((8,), dtype='<i8', buffer=shm.buf, offset=0)
+        if self._header[_MAGIC] != RING_MAGIC or self._header[_VERSION] != RING_VERSION:
+            raise ValueError(f"共享内存 {shm.name} 不是有效的帧环形缓冲区")
+        self.slots = int(self._header[_SLOTS])
+        self.shape = (int(self._header[_HEIGHT]), int(self._header[_WIDTH]), int(self._header[_CHANNELS]))
+        seq_offset, time_offset, frame_offset, _ = _layout(self.slots, *self.shape)
+        self._fps = np.ndarray((1,), dtype='<f8', buffer=shm.buf, offset=64)
+        self._slot_seq = np.ndarray((self.slots,), dtype='<i8', buffer=shm.buf, offset=seq_offset)
+        self._slot_time = np.ndarray((self.slots,), dtype='<f8', buffer=shm.buf, offset=time_offset)
+        self._frames = np.ndarray((self.slots,) + self.shape, dtype=np.uint8, buffer=shm.buf, offset=frame_offset)
+        if not owner:
+            # 消费者拿到的视图只读，避免在共享帧上画图影响其他消费者
+            self._frames.flags.writeable = False
+
+    @classmethod
+    def create(cls, name, shape, slots=8, fps=0.0):
+        """
+        生产者创建环形缓冲区
+
+        Args:
+            name (str): 共享内存名称，消费者按此名称 attach
+            shape (tuple): 帧形状 (高, 宽) 或 (高, 宽, 通道)
+            slots (int): 槽位数
+            fps (float): 源帧率，仅供消费者参考
+        """
+        height, width = shape[:2]
+        channels = shape[2] if len(shape) > 2 else 1
+        size = _layout(slots, height, width, channels)[3]
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((8,), dtype='<i8', buffer=shm.buf, offset=0)
+        header[:] = (RING_MAGIC, RING_VERSION, slots, height, width, channels, 0, 0)
+        ring = cls(shm, owner=True)
+        ring._fps[0] = fps or 0.0
+        ring._slot_seq[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name):
+        """消费者按名称 attach 已有的环形缓冲区 (不存在时抛出 FileNotFoundError)"""
+        return cls(_open_shared_memory(name), owner=False)
+
+    # ---------- 写入 (生产者) ----------
+
+    def write(self, frame, captured=None):
+        """
+        写入一帧 (形状须与创建时一致)，返回其序号
+
+        Args:
+            captured (float): 采集时间 (time.perf_counter())，默认为当前时间
+        """
+        seq = int(self._header[_WRITE_SEQ]) + 1
+        slot = seq % self.slots
+        self._slot_seq[slot] = -1
+        self._frames[slot] = frame.reshape(self.shape)
+        self._slot_time[slot] = time.perf_counter() if captured is None else captured
+        self._slot_seq[slot] = seq
+        self._header[_WRITE_SEQ] = seq
+        return seq
+
+    def mark_closed(self):
+        """生产者结束写入，等待中的消费者随即返回"""
+        self._header[_CLOSED] = 1
+
+    # ---------- 读取 (消费者) ----------
+
+    @property
+    def latest_seq(self):
+        return int(self._header[_WRITE_SEQ])
+
+    @property
+    def closed(self):
+        return bool(self._header[_CLOSED])
+
+    @property
+    def fps(self):
+        return float(self._fps[0])
+
+    def is_current(self, seq):
+        """序号为 seq 的帧是否仍完整地留在缓冲区中 (零拷贝视图用完后可据此确认未被覆盖)"""
+        return seq > 0 and int(self._slot_seq[seq % self.slots]) == seq
+
+    def read(self, seq, copy=False):
+        """
+        读取序号为 seq 的帧
+
+        Returns:
+            tuple: (帧, 采集时间)；该帧已被覆盖或尚未写入时返回 (None, None)
+        """
+        slot = seq % self.slots
+        if int(self._slot_seq[slot]) != seq:
+            return None, None
+        frame = self._frames[slot].copy() if copy else self._frames[slot]
+        captured = float(self._slot_time[slot])
+        if int(self._slot_seq[slot]) != seq:  # 读取期间被覆盖
+            return None, None
+        return frame, captured
+
+    def get(self, after_seq=0, latest=True, copy=False, timeout=None, poll_interval=0.001):
+        """
+        等待序号大于 after_seq 的一帧
+
+        Args:
+            latest (bool): True 取最新一帧 (跳过中间的帧，适合推理/预览)；
+                           False 取 after_seq 的下一帧 (录像等不希望丢帧的消费者)，
+                           下一帧已被覆盖时从缓冲区中最旧的一帧继续
+            copy (bool): 返回帧的副本而不是共享内存视图
+            timeout (float): 等待秒数，None 为一直等待
+
+        Returns:
+            tuple: (序号, 帧, 采集时间)；超时或生产者已结束时返回 (None, None, None)
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            newest = self.latest_seq
+            if newest > after_seq:
+                if latest:
+                    seq = newest
+                else:
+                    seq = max(after_seq + 1, newest - self.slots + 1)
+                frame, captured = self.read(seq, copy)
+                if frame is not None:
+                    return seq, frame, captured
+                continue  # 读取时被覆盖，重新取
+            if self.closed or (deadline is not None and time.perf_counter() >= deadline):
+                return None, None, None
+            time.sleep(poll_interval)
+
+    def close(self):
+        """断开与共享内存的连接 (视图在此之后不可再使用)"""
+        self._header = self._fps = self._slot_seq = self._slot_time = self._frames = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # 仍有帧视图在使用中，映射在这些视图释放后随进程退出解除
+
+    def unlink(self):
+        """生产者删除共享内存 (已 attach 的消费者在各自 close 之前仍可访问)"""
+        self._shm.unlink()
+
+
+class RingCapture:
+    """
+    以 cv.VideoCapture 的接口读取环形缓冲区，使现有的采集循环可以直接使用 ring:<名称> 作为视频源
+
+    read() 等待并返回最新一帧；copy=False 时返回只读的共享内存视图。
+    """
+
+    def __init__(self, name, copy=False, timeout=5.0):
+        self.ring = FrameRing.attach(name)
+        self.copy = copy
+        self.timeout = timeout
+        self.seq = 0
+        self.captured = None
+
+    def isOpened(self):
+        return self.ring is not None
+
+    def read(self):
+        """等待最新一帧；生产者已结束或 timeout 秒内没有新帧 (视为视频源中断) 时返回 (False, None)"""
+        if self.ring is None:
+            return False, None
+        seq, frame, captured = self.ring.get(self.seq, latest=True, copy=self.copy, timeout=self.timeout)
+        if seq is None:
+            return False, None
+        self.seq, self.captured = seq, captured
+        return True, frame
+
+    def get(self, prop):
+        if self.ring is None:
+            return 0.0
+        return {cv.CAP_PROP_FPS: self.ring.fps, cv.CAP_PROP_FRAME_HEIGHT: float(self.ring.shape[0]),
+                cv.CAP_PROP_FRAME_WIDTH: float(self.ring.shape[1]),
+                cv.CAP_PROP_POS_FRAMES: float(self.seq)}.get(prop, 0.0)
+
+    def release(self):
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+
+def run_producer(source, name, slots=8, report_interval=10.0):
+    """
+    生产者: 解码视频源并写入环形缓冲区，直到视频源结束或 Ctrl+C
+
+    视频文件按其帧率匀速写入 (模拟实时摄像头)。帧尺寸变化时缩放到第一帧的尺寸。
+    """
+    from humanposetest import file_fps, open_capture
+
+    cap = open_capture(source)
+    hasFrame, frame = cap.read()
+    if not hasFrame:
+        raise RuntimeError(f"无法从视频源读取帧: {source}")
+    pace_fps = file_fps(source, cap)
+    ring = FrameRing.create(name, frame.shape, slots, pace_fps or cap.get(cv.CAP_PROP_FPS))
+    print(f"📡 {source} -> 共享内存 {name}: {frame.shape[1]}x{frame.shape[0]}, {slots} 个槽位, "
+          f"{ring._shm.size / 1024 / 1024:.1f} MB")
+
+    interval = 1.0 / pace_fps if pace_fps else 0.0
+    next_at = started = next_report = time.perf_counter()
+    written = 0
+    try:
+        while hasFrame:
+            if frame.shape != ring.shape:
+                frame = cv.resize(frame, (ring.shape[1], ring.shape[0]))
+            ring.write(frame)
+            written += 1
+            now = time.perf_counter()
+            if report_interval and now >= next_report + report_interval:
+                next_report = now
+                print(f"已写入 {written} 帧，平均 {written / (now - started):.1f} FPS")
+            if interval:
+                next_at += interval
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            hasFrame, frame = cap.read()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ring.mark_closed()
+        cap.release()
+        ring.close()
+        ring.unlink()
+    print(f"✅ 生产者结束，共写入 {written} 帧")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把视频源解码到共享内存环形缓冲区，供多个消费者共享")
+    parser.add_argument('--source', default='0', help="摄像头编号、视频文件或 RTSP 地址")
+    parser.add_argument('--name', required=True, help="共享内存名称，消费者使用 ring:<名称> 读取")
+    parser.add_argument('--slots', type=int, default=8, help="槽位数 (零拷贝读取时应覆盖最慢消费者的处理时间)")
+    args = parser.parse_args()
+    run_producer(args.source, args.name, args.slots)
+
+
+if __name__ == '__main__':
+    main()
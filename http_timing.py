@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+带耗时分解的 requests 适配器，供 PDFDownloader (pdf_metrics) 和 ETL 共享会话 (etl_pools) 使用
+
+TimingHTTPAdapter 在响应上附加 request_timing: DNS 解析 / TCP 连接 / TLS 握手 / 首字节 (TTFB，收到响应头) 耗时，
+以及连接是否复用；复用连接池中的已有连接时 DNS、连接、握手耗时为 0。
+"""
+
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+_local = threading.local()
+
+
+def _current_timing():
+    timing = getattr(_local, 'timing', None)
+    if timing is None:
+        timing = _local.timing = {}
+    return timing
+
+
+class _TimingConnectionMixin:
+    """在建立新连接时分别记录 DNS 解析和 TCP 连接耗时，并记录收到响应头的时间"""
+
+    def _new_conn(self):
+        timing = _current_timing()
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 交给 urllib3 重新解析，抛出它自己的 NameResolutionError
+            timing['dns'] = time.perf_counter() - start
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timing['dns'] = resolved - start
+
+        # 与 urllib3.util.connection.create_connection 一样依次尝试解析出的每个地址，全部失败时抛出最后一个错误；
+        # 连接时临时把主机名换成地址，返回前恢复，TLS 的 SNI 和证书校验仍使用原主机名
+        original_host = self._dns_host
+        error = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in infos):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+                    continue
+                timing['connect'] = time.perf_counter() - resolved
+                return sock
+        finally:
+            self._dns_host = original_host
+        raise error
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        _current_timing()['headers_at'] = time.perf_counter()
+        return response
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        timing = _current_timing()
+        elapsed = time.perf_counter() - start
+        timing['tls'] = max(0.0, elapsed - timing.get('dns', 0.0) - timing.get('connect', 0.0)) \
+            if isinstance(self, HTTPSConnection) else 0.0
+
+
+class _TimingHTTPConnection(_TimingConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimingHTTPSConnection(_TimingConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimingHTTPConnection
+
+
+class _TimingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimingHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """
+    requests 适配器: 在响应上附加 request_timing 字典
+
+    request_timing = {'dns', 'connect', 'tls', 'ttfb', 'reused'}，单位为秒；
+    ttfb 为从发出请求到收到响应头 (不含读取响应体)，与是否 stream=True 无关
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimingHTTPConnectionPool,
+            'https': _TimingHTTPSConnectionPool,
+        }
+
+    def send(self, request, *args, **kwargs):
+        _local.timing = {}
+        start = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        timing = _local.timing
+        response.request_timing = {
+            'dns': timing.get('dns', 0.0),
+            'connect': timing.get('connect', 0.0),
+            'tls': timing.get('tls', 0.0),
+            'ttfb': timing.get('headers_at', time.perf_counter()) - start,
+            'reused': 'connect' not in timing,
+        }
+        return response
@@ -7,23 +7,147 @@
 import os
 import re
 import json
+import queue
+import threading
 import requests
-import cx_Oracle
 from urllib.parse import urlparse, parse_qs
 import time
-from datetime import datetime
 from urllib.parse import quote
+from datetime import datetime
+from etl_pools import oracle_pool, print_pool_metrics
+from http_timing import TimingHTTPAdapter
+from pdf_store import DownloadManifest, ContentStore, ShardStore
+from pdf_metrics import RequestMetrics
+from pdf_text_index import index_new_documents
+
+
+class HostRateLimiter:
+    """
+    按主机的令牌桶限速器，根据服务端响应自适应调整速率 (AIMD)。
+
+    - 每个主机一个令牌桶，速率从 initial_rate (请求/秒) 开始
+    - 收到 429 / 5xx 时速率减半 (不低于 min_rate)，并遵守 Retry-After 暂停该主机
+    - 连续成功时每次加 increase_step，直到 max_rate
+    """
+
+    def __init__(self, initial_rate=2.0, min_rate=0.2, max_rate=10.0, increase_step=0.1, burst=2):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = {'rate': self.initial_rate, 'tokens': float(self.burst),
+                      'updated': time.monotonic(), 'paused_until': 0.0}
+            self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url):
+        """阻塞直到该 URL 所在主机有可用令牌"""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                if now < bucket['paused_until']:
+                    wait = bucket['paused_until'] - now
+                else:
+                    bucket['tokens'] = min(self.burst, bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+                    bucket['updated'] = now
+                    if bucket['tokens'] >= 1:
+                        bucket['tokens'] -= 1
+                        return
+                    wait = (1 - bucket['tokens']) / bucket['rate']
+            time.sleep(wait)
+
+    def feedback(self, url, status_code, retry_after=None):
+        """
+        根据响应状态调整该主机的速率
+
+        Returns:
+            bool: 是否属于需要退避重试的响应 (429 / 5xx)
+        """
+        host = urlparse(url).netloc
+        throttled = self.is_throttled(status_code)
+        with self._lock:
+            bucket = self._bucket(host)
+            if throttled:
+                bucket['rate'] = max(self.min_rate, bucket['rate'] / 2)
+                bucket['tokens'] = 0.0
+                pause = retry_after if retry_after is not None else 1 / bucket['rate']
+                bucket['paused_until'] = max(bucket['paused_until'], time.monotonic() + pause)
+            elif status_code is not None and status_code < 400:
+                bucket['rate'] = min(self.max_rate, bucket['rate'] + self.increase_step)
+        return throttled
+
+    @staticmethod
+    def is_throttled(status_code):
+        """429 / 5xx 表示服务器过载，需要降速后重试"""
+        return status_code == 429 or (status_code is not None and status_code >= 500)
+
+    def current_rate(self, url):
+        with self._lock:
+            return self._bucket(urlparse(url).netloc)['rate']
+
+# 增量抽取配置
+DEFAULT_EXTRACT_CONFIG = {
+    'source_table': 'zjw_jyzx_data',  # 公告源表
+    'key_column': 'ID',  # 源表主键
+    'watermark_column': 'ID',  # 水位列: 递增主键，或入库时间列
+    'category': '中标候选人公示',
+    'work_table': 'zjw_jyzx_pdf_work',  # 物化的待处理工作表
+    'arraysize': 2000,  # 读取工作表时每次往返取回的行数
+}
+
 
 class PDFDownloader:
-    def __init__(self, db_config):
+    def __init__(self, db_config, resolve_workers=4, download_workers=4, rate_limiter=None, max_retries=3,
+                 extract_config=None, index_text=True, index_workers=None, collect_metrics=True,
+                 storage_backend='files', max_shard_bytes=1024 * 1024 * 1024):
         """
         初始化PDF下载器
 
         Args:
             db_config (dict): 数据库配置信息
+            resolve_workers (int): 调用 CheckHaveGsFile 解析 data 字符串的线程数
+            download_workers (int): 下载 PDF 的线程数
+            rate_limiter (HostRateLimiter): 按主机的限速器，默认新建一个
+            max_retries (int): 遇到 429 / 5xx / 网络错误时的最大重试次数
+            extract_config (dict): 增量抽取配置，覆盖 DEFAULT_EXTRACT_CONFIG 中的同名项
+            index_text (bool): 下载完成后是否抽取新 PDF 的文本并建立索引
+            index_workers (int): 抽取文本的进程数，默认为可用核数
+            collect_metrics (bool): 是否记录每次请求的耗时分解，写入 <output_dir>/metrics/
+            storage_backend (str): 'files' 每份文档一个文件; 'shards' 追加写入分片文件
+            max_shard_bytes (int): 分片存储时单个分片的大小上限
         """
         self.db_config = db_config
+        self.resolve_workers = resolve_workers
+        self.download_workers = download_workers
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_retries = max_retries
+        self.extract_config = {**DEFAULT_EXTRACT_CONFIG, **(extract_config or {})}
+        self.index_text = index_text
+        self.index_workers = index_workers
+        self.collect_metrics = collect_metrics
+        self.metrics = None
+        if storage_backend not in ('files', 'shards'):
+            raise ValueError(f"未知的存储方式: {storage_backend}，可选值为 files / shards")
+        self.storage_backend = storage_backend
+        self.max_shard_bytes = max_shard_bytes
+        self._storages = {}
+        self._storage_lock = threading.Lock()
         self.session = requests.Session()
+        # 连接池大小与线程数匹配，避免并发时反复建立连接
+        pool_size = resolve_workers + download_workers
+        # TimingHTTPAdapter 在响应上附加 DNS / 连接 / TLS / 首字节耗时，供 metrics 使用
+        adapter = TimingHTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -31,49 +155,177 @@ class PDFDownloader:
             'Content-Type': 'application/json'
         })
 
+    def storage(self, output_dir="downloads"):
+        """
+        返回输出目录对应的 (下载清单, 内容存储)
+
+        目录结构:
+            <output_dir>/manifest.sqlite   下载清单
+            <output_dir>/objects/          按 sha256 存放的 PDF (storage_backend='files')
+            <output_dir>/shards/           分片文件及其索引 (storage_backend='shards')
+            <output_dir>/.parts/           下载中的临时文件
+        """
+        with self._storage_lock:
+            if output_dir not in self._storages:
+                manifest = DownloadManifest(os.path.join(output_dir, "manifest.sqlite"))
+                if self.storage_backend == 'shards':
+                    store = ShardStore(os.path.join(output_dir, "shards"), self.max_shard_bytes)
+                else:
+                    store = ContentStore(os.path.join(output_dir, "objects"))
+                self._storages[output_dir] = (manifest, store)
+            return self._storages[output_dir]
+
     def connect_oracle(self):
-        """连接Oracle数据库"""
+        """从连接池借出Oracle连接 (close() 时归还，下次调用复用已认证的会话)"""
         try:
-            connection_str = f"{self.db_config['username']}/{self.db_config['password']}@{self.db_config['host']}:{self.db_config['port']}/{self.db_config['service_name']}"
-            connection = cx_Oracle.connect(connection_str)
+            connection = oracle_pool('oracle', self.db_config).acquire()
             print(f"✅ 成功连接到Oracle数据库")
             return connection
         except Exception as e:
             print(f"❌ 连接Oracle数据库失败: {str(e)}")
             return None
 
-    def get_urls_from_db(self):
-        """从数据库获取URL列表"""
+    def ensure_work_table(self, cursor):
+        """
+        创建待处理公告的工作表 (不存在时)
+
+        工作表通过 CTAS 建立，watermark 列自动继承源表水位列的类型 (主键 NUMBER 或入库时间 DATE/TIMESTAMP)。
+        downloaded_at 记录 zbgcid 下载完成的时间，读取时只取尚未完成的 ID；旧的工作表缺少该列时补上。
+        """
+        cfg = self.extract_config
+        cursor.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :name", name=cfg['work_table'].upper())
+        if cursor.fetchone()[0]:
+            cursor.execute("SELECT COUNT(*) FROM user_tab_columns "
+                           "WHERE table_name = :name AND column_name = 'DOWNLOADED_AT'", name=cfg['work_table'].upper())
+            if not cursor.fetchone()[0]:
+                cursor.execute(f"ALTER TABLE {cfg['work_table']} ADD (downloaded_at DATE)")
+                cursor.execute(f"CREATE INDEX idx_{cfg['work_table']}_id ON {cfg['work_table']} (zbgcid)")
+                print(f"🆕 已为工作表 {cfg['work_table']} 增加 downloaded_at 列")
+            return
+        cursor.execute(f"""
+            CREATE TABLE {cfg['work_table']} AS
+            SELECT d.{cfg['key_column']} AS source_key,
+                   d.{cfg['watermark_column']} AS watermark,
+                   CAST(NULL AS VARCHAR2(32)) AS zbgcid,
+                   CAST(NULL AS VARCHAR2(2000)) AS source_url,
+                   SYSDATE AS extracted_at,
+                   CAST(NULL AS DATE) AS downloaded_at
+            FROM {cfg['source_table']} d
+            WHERE 1 = 0
+        """)
+        cursor.execute(f"ALTER TABLE {cfg['work_table']} ADD CONSTRAINT pk_{cfg['work_table']} PRIMARY KEY (source_key)")
+        cursor.execute(f"CREATE INDEX idx_{cfg['work_table']}_wm ON {cfg['work_table']} (watermark)")
+        cursor.execute(f"CREATE INDEX idx_{cfg['work_table']}_id ON {cfg['work_table']} (zbgcid)")
+        print(f"🆕 已创建工作表 {cfg['work_table']}")
+
+    def refresh_work_table(self, connection):
+        """
+        增量抽取: 只扫描水位之后的新公告，在 Oracle 端解析出 URL 和 zbgcid 写入工作表
+
+        水位取工作表中已有的最大 watermark，与写入在同一事务中提交，无需额外保存状态。
+        使用 >= 并配合 NOT EXISTS，以免遗漏与水位值相同的后到记录 (按入库时间做水位时)。
+        没有 URL 的公告也会写入 (zbgcid 为空)，使水位能够越过它们。
+
+        Returns:
+            int: 本次新增的公告数
+        """
+        cfg = self.extract_config
+        cursor = connection.cursor()
+        try:
+            self.ensure_work_table(cursor)
+            cursor.execute(f"SELECT MAX(watermark) FROM {cfg['work_table']}")
+            watermark = cursor.fetchone()[0]
+
+            watermark_filter = f"AND d.{cfg['watermark_column']} >= :watermark" if watermark is not None else ""
+            # 内层只对 CLOB 做一次正则匹配，外层从 URL 中取最后一个等号后的数字作为 zbgcid
+            # (与 extract_id_from_url 的规则一致)
+            sql = f"""
+            INSERT INTO {cfg['work_table']} (source_key, watermark, zbgcid, source_url, extracted_at)
+            SELECT source_key, watermark,
+                   CASE WHEN INSTR(url, '=') > 0
+                        THEN REGEXP_REPLACE(REGEXP_SUBSTR(url, '[^=]*$'), '[^0-9]', '') END,
+                   url, SYSDATE
+            FROM (
+                SELECT d.{cfg['key_column']} AS source_key,
+                       d.{cfg['watermark_column']} AS watermark,
+                       TRIM(REGEXP_SUBSTR(d.content, '公示源URL[:：](.*?)公示类型', 1, 1, 'i', 1)) AS url
+                FROM {cfg['source_table']} d
+                WHERE d.CATEGORY_NAME = :category
+                {watermark_filter}
+                AND NOT EXISTS (SELECT 1 FROM {cfg['work_table']} w WHERE w.source_key = d.{cfg['key_column']})
+            )
+            """
+            params = {'category': cfg['category']}
+            if watermark is not None:
+                params['watermark'] = watermark
+            cursor.execute(sql, params)
+            inserted = cursor.rowcount
+            connection.commit()
+            print(f"📋 增量抽取完成 (水位: {watermark})，新增 {inserted} 条公告")
+            return inserted
+        finally:
+            cursor.close()
+
+    def iter_work_items(self):
+        """
+        先增量刷新工作表，再流式读取尚未下载完成的 (zbgcid, URL)
+
+        多条公告可能指向同一个 zbgcid，按 zbgcid 去重后每个 ID 只返回一次，
+        避免同一 ID 被多个下载线程同时处理 (共用同一个 part 文件和清单记录)。
+        已下载完成的 ID 由 mark_downloaded 在工作表中标记，在 SQL 中过滤。
+        """
         connection = self.connect_oracle()
         if not connection:
-            return []
+            return
 
         try:
+            self.refresh_work_table(connection)
             cursor = connection.cursor()
-            # 使用您提供的SQL查询
-            sql = """
-            select REGEXP_SUBSTR(content, '(.*)公示源URL[:：](.*?)公示类型', 1, 1, 'i', 2) as winner_category 
-            from zjw_jyzx_data 
-            where CATEGORY_NAME='中标候选人公示'
-            and REGEXP_SUBSTR(content, '(.*)公示源URL[:：](.*?)公示类型', 1, 1, 'i', 2) is not null
-            """
+            # 增大每次网络往返取回的行数，减少大结果集的往返次数
+            cursor.arraysize = self.extract_config['arraysize']
+            cursor.prefetchrows = self.extract_config['arraysize'] + 1
+            cursor.execute(f"""
+                SELECT zbgcid, MIN(source_url) FROM {self.extract_config['work_table']}
+                WHERE zbgcid IS NOT NULL AND downloaded_at IS NULL
+                GROUP BY zbgcid
+                ORDER BY MIN(source_key)
+            """)
+            for zbgcid, url in cursor:
+                yield zbgcid, url
+            cursor.close()
 
-            cursor.execute(sql)
-            urls = []
-            for row in cursor:
-                url = row[0]
-                if url and url.strip():
-                    urls.append(url.strip())
+        except Exception as e:
+            print(f"❌ 查询数据库失败: {str(e)}")
+        finally:
+            connection.close()
 
-            print(f"📋 从数据库获取到 {len(urls)} 个URL")
-            return urls
+    def mark_downloaded(self, ids, batch_size=1000):
+        """
+        在工作表中标记已下载完成的 zbgcid，下次运行时 iter_work_items 不再读出
 
+        Args:
+            ids (list): 已完成的 zbgcid
+            batch_size (int): 每次 executemany 的行数
+        """
+        if not ids:
+            return
+        connection = self.connect_oracle()
+        if not connection:
+            return
+        try:
+            cursor = connection.cursor()
+            for start in range(0, len(ids), batch_size):
+                cursor.executemany(
+                    f"UPDATE {self.extract_config['work_table']} SET downloaded_at = SYSDATE "
+                    f"WHERE zbgcid = :1 AND downloaded_at IS NULL",
+                    [(str(id_value),) for id_value in ids[start:start + batch_size]])
+            connection.commit()
+            cursor.close()
         except Exception as e:
-            print(f"❌ 查询数据库失败: {str(e)}")
-            return []
+            # 标记失败不影响结果，下次运行时这些 ID 会再次读出并由下载清单跳过
+            print(f"⚠️  标记已下载的ID失败: {str(e)}")
         finally:
-            if connection:
-                connection.close()
+            connection.close()
 
     def extract_id_from_url(self, url):
         """
@@ -98,12 +350,78 @@ class PDFDownloader:
             print(f"❌ 解析URL失败 {url}: {str(e)}")
             return None
 
-    def check_gs_file(self, id_value):
+    def _record(self, endpoint, started, wait, response=None, error=None, nbytes=0, **extra):
+        """
+        记录一次请求的指标 (未开启 metrics 时忽略)
+
+        Args:
+            endpoint (str): 接口名称
+            started (float): 发出请求时的 time.perf_counter()
+            wait (float): 发出请求前在限速器中等待的秒数
+            response (requests.Response): 响应，网络错误时为 None
+            error (str): 错误类型，未给出时按状态码推断 (http_<状态码>)
+            nbytes (int): 响应体字节数
+        """
+        if self.metrics is None:
+            return
+        status = response.status_code if response is not None else None
+        if error is None and status is not None and status >= 400:
+            error = f"http_{status}"
+        self.metrics.record(endpoint, status=status, error=error,
+                            timing=getattr(response, 'request_timing', None),
+                            total=time.perf_counter() - started, wait=wait, nbytes=nbytes, **extra)
+
+    def _request(self, method, url, endpoint=None, retries=None, **kwargs):
+        """
+        经过限速器发送请求，遇到 429 / 5xx / 网络错误时按限速器的退避重试
+
+        被重试的请求和网络错误在这里直接记入 metrics；最后一次的响应由调用方在读完响应体后记录，
+        为此在响应上附加 request_started / request_wait。
+
+        Args:
+            endpoint (str): 记入 metrics 的接口名称，默认为 URL 路径
+            retries (int): 最大重试次数，默认为 max_retries；调用方自己负责重试时传 0，
+                           每次请求只向限速器反馈一次
+
+        Returns:
+            requests.Response: 最后一次的响应
+        """
+        endpoint = endpoint or urlparse(url).path
+        retries = self.max_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            wait_started = time.perf_counter()
+            self.rate_limiter.acquire(url)
+            started = time.perf_counter()
+            wait = started - wait_started
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self._record(endpoint, started, wait, error=type(e).__name__, attempt=attempt)
+                self.rate_limiter.feedback(url, 599)
+                if attempt == retries:
+                    raise
+                continue
+            response.request_started = started
+            response.request_wait = wait
+
+            retry_after = response.headers.get('Retry-After')
+            retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+            if not self.rate_limiter.feedback(url, response.status_code, retry_after) or attempt == retries:
+                response.request_attempt = attempt
+                return response
+            self._record(endpoint, started, wait, response, nbytes=len(response.content), attempt=attempt)
+            print(f"⏳ {urlparse(url).netloc} 返回 HTTP {response.status_code}，降速后重试 "
+                  f"(当前 {self.rate_limiter.current_rate(url):.2f} 次/秒)")
+            response.close()
+        return response
+
+    def check_gs_file(self, id_value, output_dir=None):
         """
         调用API检查文件并获取data字符串
 
         Args:
             id_value (str): 要查询的ID
+            output_dir (str): 给出时把解析结果记录到该目录的下载清单
 
         Returns:
             str: 返回的data字符串，失败返回None
@@ -113,12 +431,16 @@ class PDFDownloader:
             payload = {"id": int(id_value)}
 
             print(f"🔍 正在查询ID: {id_value}")
-            response = self.session.post(api_url, json=payload, timeout=30)
+            response = self._request('POST', api_url, endpoint='CheckHaveGsFile', json=payload, timeout=30)
+            self._record('CheckHaveGsFile', response.request_started, response.request_wait, response,
+                         nbytes=len(response.content), attempt=response.request_attempt)
 
             if response.status_code == 200:
                 result = response.json()
                 if result.get('code') == 0 and result.get('data'):
                     print(f"✅ 成功获取data字符串 (ID: {id_value})")
+                    if output_dir is not None:
+                        self.storage(output_dir)[0].record_resolved(id_value, result['data'])
                     return result['data']
                 else:
                     print(f"⚠️  API返回错误 (ID: {id_value}): {result.get('message', '未知错误')}")
@@ -131,10 +453,95 @@ class PDFDownloader:
             print(f"❌ 调用API失败 (ID: {id_value}): {str(e)}")
             return None
 
+    def _stream_to_file(self, url, part_path, chunk_size=64 * 1024, attempt=0):
+        """
+        把 URL 的内容流式写入 part_path，已有部分内容时用 Range 请求续传
+
+        每次只在内存中保留一个 chunk，内存占用与文件大小无关。
+        服务器不支持 Range 时 (返回 200 而不是 206) 从头重新下载。
+        只发送一次请求，重试 (和续传) 由 download_pdf 负责。
+
+        Args:
+            attempt (int): 第几次尝试，记入 metrics
+
+        Returns:
+            tuple: (是否完整下载, HTTP 状态码, 文件字节数)
+        """
+        existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {'Range': f'bytes={existing}-'} if existing else {}
+        response = self._request('GET', url, endpoint='pdf_download', retries=0, timeout=60, stream=True,
+                                 headers=headers)
+        received, disk_seconds, error = 0, 0.0, None
+        try:
+            status = response.status_code
+            if status == 416 and existing:
+                # 请求的起点已超出文件末尾: 要么 part 文件已完整，要么服务器上的文件变了
+                total = self._content_range_total(response.headers.get('Content-Range'))
+                if total == existing:
+                    return True, status, existing
+                os.remove(part_path)
+                return False, status, 0
+            if status == 206 and existing:
+                start = self._content_range_start(response.headers.get('Content-Range'))
+                if start != existing:
+                    # 服务器返回的区间与续传位置不一致，放弃已有部分
+                    os.remove(part_path)
+                    return False, status, 0
+                mode = 'ab'
+                total = self._content_range_total(response.headers.get('Content-Range'))
+            elif status == 200:
+                mode, existing = 'wb', 0
+                length = response.headers.get('Content-Length')
+                total = int(length) if length and length.isdigit() else None
+            else:
+                return False, status, existing
+
+            size = existing
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        write_started = time.perf_counter()
+                        f.write(chunk)
+                        disk_seconds += time.perf_counter() - write_started
+                        size += len(chunk)
+                        received += len(chunk)
+                write_started = time.perf_counter()
+                f.flush()
+                os.fsync(f.fileno())
+                disk_seconds += time.perf_counter() - write_started
+
+            if total is not None and size != total:
+                print(f"⚠️  文件长度不符: 期望 {total} 字节，实际 {size} 字节，保留已下载部分用于续传")
+                return False, status, size
+            return True, status, size
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            response.close()
+            self._record('pdf_download', response.request_started, response.request_wait, response,
+                         error=error, nbytes=received, attempt=attempt,
+                         resumed_from=existing, disk_ms=round(disk_seconds * 1000, 2))
+
+    @staticmethod
+    def _content_range_start(content_range):
+        # Content-Range: bytes 1000-1999/5000
+        match = re.match(r'bytes (\d+)-\d+/(?:\d+|\*)', content_range or '')
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _content_range_total(content_range):
+        # Content-Range: bytes 1000-1999/5000 或 bytes */5000
+        match = re.search(r'/(\d+)$', content_range or '')
+        return int(match.group(1)) if match else None
+
     def download_pdf(self, data_string, id_value, output_dir="downloads"):
         """
         下载PDF文件
 
+        内容先流式写入 `.parts/` 下的临时文件，中断后可用 Range 续传；
+        长度校验通过后按 sha256 原子地移入内容存储，并记录到下载清单。
+
         Args:
             data_string (str): API返回的data字符串
             id_value (str): 对应的ID
@@ -158,24 +565,41 @@ class PDFDownloader:
             # 注意：实际的PDF下载可能需要不同的URL端点
             #pdf_content_url = f"https://ciac.zjw.sh.gov.cn/JGBFileViewInterWeb/api/pdf/download?params={data_string}"
             pdf_content_url=f"https://ciac.zjw.sh.gov.cn/JGBFileViewInterWeb/file/pdf/download?params={data_string}"
-            time.sleep(2)
-            response = self.session.get(pdf_content_url, timeout=60)
-
-            if response.status_code == 200:
-                # 生成文件名
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"pdf_{id_value}_{timestamp}.pdf"
-                filepath = os.path.join(output_dir, filename)
-
-                # 保存文件
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
 
-                file_size = len(response.content)
-                print(f"✅ PDF下载成功 (ID: {id_value}): {filepath} ({file_size} bytes)")
+            manifest, store = self.storage(output_dir)
+            part_dir = os.path.join(output_dir, ".parts")
+            os.makedirs(part_dir, exist_ok=True)
+            part_path = os.path.join(part_dir, f"pdf_{id_value}.pdf.part")
+            status, file_size, complete = None, 0, False
+            # 唯一的重试循环: 每次尝试只发一次请求，429 / 5xx 的退避由限速器在下一次 acquire 时完成
+            for attempt in range(self.max_retries + 1):
+                try:
+                    complete, status, file_size = self._stream_to_file(pdf_content_url, part_path, attempt=attempt)
+                except requests.exceptions.RequestException as e:
+                    # 连接中途断开，已写入的部分保留在 part 文件中，下次从断点续传
+                    print(f"⚠️  下载中断 (ID: {id_value})，将续传: {str(e)}")
+                    continue
+                if complete:
+                    break
+                if self.rate_limiter.is_throttled(status):
+                    print(f"⏳ {urlparse(pdf_content_url).netloc} 返回 HTTP {status}，降速后重试 "
+                          f"(当前 {self.rate_limiter.current_rate(pdf_content_url):.2f} 次/秒)")
+                elif status not in (200, 206, 416):
+                    break
+
+            if complete:
+                # 校验通过后按内容哈希原子地移入存储，相同内容只保存一份
+                filepath, sha256, is_new = store.put_file(part_path, doc_id=id_value)
+                manifest.record_done(id_value, sha256, file_size, filepath)
+
+                if self.metrics is not None:
+                    self.metrics.document_done()
+                note = "" if is_new else " (内容与已有文档相同，未重复保存)"
+                print(f"✅ PDF下载成功 (ID: {id_value}): {filepath} ({file_size} bytes){note}")
                 return True
             else:
-                print(f"❌ PDF下载失败 (ID: {id_value}): HTTP {response.status_code}")
+                print(f"❌ PDF下载失败 (ID: {id_value}): HTTP {status}")
+                manifest.record_failed(id_value, f"HTTP {status}")
 
                 # 如果直接下载失败，保存data字符串供手动处理
                 data_file = os.path.join(output_dir, f"data_{id_value}.txt")
@@ -188,58 +612,124 @@ class PDFDownloader:
 
         except Exception as e:
             print(f"❌ 下载PDF失败 (ID: {id_value}): {str(e)}")
+            self.storage(output_dir)[0].record_failed(id_value, e)
             return False
 
     def process_all(self, output_dir="downloads"):
         """
         处理所有URL的完整流程
 
+        待处理的ID由 iter_work_items 从 Oracle 增量抽取并流式读出；
+        解析 data 字符串和下载 PDF 分为两个阶段，各自由一组线程处理，
+        阶段之间通过有界队列衔接；请求频率由按主机的限速器控制。
+
         Args:
             output_dir (str): 输出目录
         """
         print("🚀 开始处理...")
 
-        # 1. 从数据库获取URL
-        urls = self.get_urls_from_db()
-        if not urls:
-            print("❌ 没有获取到任何URL")
-            return
-
-        success_count = 0
-        failed_count = 0
-
-        # 2. 处理每个URL
-        for i, url in enumerate(urls, 1):
-            print(f"\n📍 处理进度: {i}/{len(urls)} - {url}")
-
-            # 解析ID
-            id_value = self.extract_id_from_url(url)
-            if not id_value:
-                print(f"⚠️  无法从URL解析ID: {url}")
-                failed_count += 1
+        metrics_path = None
+        if self.collect_metrics:
+            # 每次运行一个 JSON lines 文件，每行一次请求
+            metrics_path = os.path.join(output_dir, "metrics",
+                                        f"requests-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl")
+            self.metrics = RequestMetrics(metrics_path)
+
+        manifest, _ = self.storage(output_dir)
+        completed = manifest.completed_ids()
+        counters = {'success': 0, 'failed': 0, 'done': 0, 'skipped': 0}
+        # 本次下载成功或清单中早已完成的 ID，结束时在工作表中标记
+        downloaded = []
+        counter_lock = threading.Lock()
+        # 有界队列提供背压: 下载跟不上时解析阶段会自动等待，解析跟不上时读取数据库会等待
+        resolve_queue = queue.Queue(maxsize=self.resolve_workers * 4)
+        download_queue = queue.Queue(maxsize=self.download_workers * 4)
+
+        def finish(ok):
+            with counter_lock:
+                counters['success' if ok else 'failed'] += 1
+                counters['done'] += 1
+                done = counters['done']
+            if done % 20 == 0:
+                print(f"\n📍 处理进度: 已完成 {done} 个")
+
+        def resolve_worker():
+            while True:
+                item = resolve_queue.get()
+                if item is None:
+                    return
+                id_value, url = item
+                if not id_value:
+                    print(f"⚠️  无法从URL解析ID: {url}")
+                    finish(False)
+                    continue
+                # 调用API获取data
+                data_string = self.check_gs_file(id_value, output_dir)
+                if not data_string:
+                    print(f"⚠️  无法获取data字符串 (ID: {id_value})")
+                    manifest.record_failed(id_value, "CheckHaveGsFile 未返回 data")
+                    finish(False)
+                    continue
+                download_queue.put((data_string, id_value))
+
+        def download_worker():
+            while True:
+                item = download_queue.get()
+                if item is None:
+                    return
+                data_string, id_value = item
+                ok = self.download_pdf(data_string, id_value, output_dir)
+                if ok:
+                    with counter_lock:
+                        downloaded.append(id_value)
+                finish(ok)
+
+        # 启动两个阶段的线程
+        resolvers = [threading.Thread(target=resolve_worker, daemon=True) for _ in range(self.resolve_workers)]
+        downloaders = [threading.Thread(target=download_worker, daemon=True) for _ in range(self.download_workers)]
+        for thread in resolvers + downloaders:
+            thread.start()
+
+        # 1. 从数据库流式读取待处理的ID，跳过清单中已成功下载的ID，只处理新ID和之前失败的ID
+        seen = set()
+        for id_value, url in self.iter_work_items():
+            # 工作表已按 zbgcid 去重，这里再防一次，同一ID在一次运行中只入队一次
+            if id_value in seen:
                 continue
-
-            # 调用API获取data
-            data_string = self.check_gs_file(id_value)
-            if not data_string:
-                print(f"⚠️  无法获取data字符串 (ID: {id_value})")
-                failed_count += 1
+            seen.add(id_value)
+            if id_value in completed:
+                counters['skipped'] += 1
+                downloaded.append(id_value)
                 continue
-
-            # 下载PDF
-            if self.download_pdf(data_string, id_value, output_dir):
-                success_count += 1
-            else:
-                failed_count += 1
-
-            # 添加延迟避免请求过频
-            time.sleep(1)
+            resolve_queue.put((id_value, url))
+        for _ in resolvers:
+            resolve_queue.put(None)
+        for thread in resolvers:
+            thread.join()
+        for _ in downloaders:
+            download_queue.put(None)
+        for thread in downloaders:
+            thread.join()
+        self.mark_downloaded(downloaded)
 
         print(f"\n📊 处理完成:")
-        print(f"   ✅ 成功: {success_count}")
-        print(f"   ❌ 失败: {failed_count}")
+        print(f"   ✅ 成功: {counters['success']}")
+        print(f"   ❌ 失败: {counters['failed']}")
+        print(f"   ⏭️  跳过: {counters['skipped']}")
         print(f"   📁 输出目录: {output_dir}")
 
+        if self.metrics is not None:
+            self.metrics.print_summary()
+            self.metrics.write_summary(metrics_path[:-len('.jsonl')] + '.summary.json')
+            self.metrics.close()
+            print(f"   📈 请求明细: {metrics_path}")
+            self.metrics = None
+        print_pool_metrics()
+
+        # 3. 抽取新下载文档的文本和关键字段，写入全文索引
+        if self.index_text:
+            index_new_documents(output_dir, self.index_workers)
+
 
 def main():
     """主函数"""
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDFDownloader 的请求耗时与吞吐统计
+
+- 每次请求的 DNS 解析 / TCP 连接 / TLS 握手 / 首字节耗时由 http_timing.TimingHTTPAdapter 记录，
+  读完响应体的总耗时由调用方记录 (total)
+- RequestMetrics: 每次请求输出一行 JSON (耗时分解、字节数、状态码、错误类型)，
+  并在结束时按接口汇总 p50/p95/p99 延迟、状态分布和每分钟完成的文档数
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from array import array
+from collections import Counter
+
+
+LATENCY_FIELDS = ('wait_ms', 'dns_ms', 'connect_ms', 'tls_ms', 'ttfb_ms', 'total_ms')
+
+
+def _percentile(sorted_values, pct):
+    """最近秩 (nearest-rank) 百分位数: 第 ceil(pct/100 * n) 小的值"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class RequestMetrics:
+    """
+    线程安全的请求指标收集器，可选地把每条记录写入 JSON lines 文件
+
+    内存中只按接口保留计数和各阶段耗时 (array 存放)，几十万次请求也只占几十 MB。
+    """
+
+    def __init__(self, jsonl_path=None):
+        self.jsonl_path = jsonl_path
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._file = None
+        self.started_at = time.time()
+        self.documents = 0
+        if jsonl_path:
+            os.makedirs(os.path.dirname(os.path.abspath(jsonl_path)), exist_ok=True)
+            self._file = open(jsonl_path, 'a', encoding='utf-8', buffering=1)
+
+    def _endpoint(self, endpoint):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = {'requests': 0, 'bytes': 0, 'status': Counter(), 'errors': Counter(),
+                     'reused_connections': 0, 'latency': {field: array('d') for field in LATENCY_FIELDS}}
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def record(self, endpoint, status=None, error=None, timing=None, total=None, wait=0.0, nbytes=0, **extra):
+        """
+        记录一次请求
+
+        Args:
+            endpoint (str): 接口名称 (如 CheckHaveGsFile / pdf_download)
+            status (int): HTTP 状态码，请求未得到响应时为 None
+            error (str): 错误类型 (异常类名或 http_<状态码>)，成功时为 None
+            timing (dict): TimingHTTPAdapter 附加的耗时分解
+            total (float): 从发出请求到读完响应体的总耗时 (秒)
+            wait (float): 发出请求前在限速器中等待的时间 (秒)
+            nbytes (int): 响应体字节数
+        """
+        timing = timing or {}
+        entry = {
+            'ts': round(time.time(), 3),
+            'endpoint': endpoint,
+            'status': status,
+            'error': error,
+            'wait_ms': round(wait * 1000, 2),
+            'dns_ms': round(timing.get('dns', 0.0) * 1000, 2),
+            'connect_ms': round(timing.get('connect', 0.0) * 1000, 2),
+            'tls_ms': round(timing.get('tls', 0.0) * 1000, 2),
+            'ttfb_ms': round(timing.get('ttfb', 0.0) * 1000, 2) if timing else None,
+            'total_ms': round(total * 1000, 2) if total is not None else None,
+            'bytes': nbytes,
+            'reused': timing.get('reused'),
+            **extra,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats['requests'] += 1
+            stats['bytes'] += nbytes or 0
+            stats['status'][str(status)] += 1
+            if error:
+                stats['errors'][error] += 1
+            if entry['reused']:
+                stats['reused_connections'] += 1
+            for field in LATENCY_FIELDS:
+                if entry[field] is not None:
+                    stats['latency'][field].append(entry[field])
+            if self._file:
+                self._file.write(line + '\n')
+
+    def document_done(self):
+        with self._lock:
+            self.documents += 1
+
+    def summary(self):
+        """按接口汇总: 请求数、错误分布、字节数、各阶段与总耗时的 p50/p95/p99，以及每分钟完成的文档数"""
+        with self._lock:
+            endpoints = {
+                endpoint: {**{k: v for k, v in stats.items() if k != 'latency'},
+                           'status': dict(stats['status']), 'errors': dict(stats['errors']),
+                           'latency': {field: sorted(values) for field, values in stats['latency'].items()}}
+                for endpoint, stats in self._endpoints.items()
+            }
+            documents = self.documents
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        result = {'elapsed_s': round(elapsed, 1), 'documents': documents,
+                  'docs_per_minute': round(documents / elapsed * 60, 2), 'endpoints': {}}
+        for endpoint, stats in endpoints.items():
+            latency = stats.pop('latency')
+            for field in LATENCY_FIELDS:
+                stats[field] = {f"p{pct}": _percentile(latency[field], pct) for pct in (50, 95, 99)}
+            result['endpoints'][endpoint] = stats
+        return result
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"\n⏱️  耗时统计 (共 {summary['elapsed_s']} 秒，{summary['docs_per_minute']} 份/分钟):")
+        for endpoint, stats in summary['endpoints'].items():
+            print(f"   [{endpoint}] 请求 {stats['requests']} 次，{stats['bytes']} 字节，"
+                  f"状态 {stats['status']}，错误 {stats['errors'] or '无'}")
+            for field in LATENCY_FIELDS:
+                p = stats[field]
+                print(f"      {field:<11} p50={p['p50']}  p95={p['p95']}  p99={p['p99']}")
+        return summary
+
+    def write_summary(self, path):
+        """把汇总结果另存为 JSON 文件"""
+        summary = self.summary()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        return summary
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
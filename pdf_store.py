@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF 下载结果的存储与清单
+
+- DownloadManifest: 基于 SQLite 的下载清单，按 zbgcid 记录解析出的 data 字符串、
+  sha256、大小和状态，重跑时跳过已完成的 ID、只重试失败的 ID
+- ContentStore: 按内容寻址的文件存储，路径由 sha256 决定，相同内容的文档只保存一份
+- ShardStore: 把文档追加写入大小有上限的分片文件，并为每个分片维护一个索引文件
+  (zbgcid / sha256 -> 偏移, 长度)，通过内存映射随机读取单个文档；语料库只由少数大文件组成，
+  不依赖下载清单即可按 zbgcid 取出文档，便于迁移、备份和 rsync
+
+两种存储的 put_file 返回的路径 (ShardStore 为 "分片路径#偏移+长度" 形式的位置串)
+写入下载清单，用 read_document() 统一读取。
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from datetime import datetime
+
+STATUS_RESOLVED = 'resolved'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    """分块计算文件的 sha256，内存占用与文件大小无关"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DownloadManifest:
+    """线程安全的下载清单 (单个 SQLite 连接 + 锁)"""
+
+    def __init__(self, db_path):
+        """
+        Args:
+            db_path (str): SQLite 文件路径
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS downloads (
+                zbgcid      TEXT PRIMARY KEY,
+                data_string TEXT,
+                sha256      TEXT,
+                size        INTEGER,
+                path        TEXT,
+                status      TEXT NOT NULL,
+                attempts    INTEGER NOT NULL DEFAULT 0,
+                last_error  TEXT,
+                updated_at  TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_downloads_status ON downloads(status)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_downloads_sha256 ON downloads(sha256)")
+        self._conn.commit()
+
+    def _upsert(self, zbgcid, **fields):
+        fields['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' * len(fields))
+        updates = ', '.join(f"{name} = excluded.{name}" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO downloads (zbgcid, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(zbgcid) DO UPDATE SET {updates}",
+                [str(zbgcid), *fields.values()])
+            self._conn.commit()
+
+    def get(self, zbgcid):
+        """返回一条记录 (dict)，不存在时返回 None"""
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM downloads WHERE zbgcid = ?", (str(zbgcid),))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(zip([d[0] for d in cursor.description], row))
+
+    def completed_ids(self):
+        """返回所有已成功下载的 zbgcid 集合"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute(
+                "SELECT zbgcid FROM downloads WHERE status = ?", (STATUS_DONE,))}
+
+    def record_resolved(self, zbgcid, data_string):
+        self._upsert(zbgcid, data_string=data_string, status=STATUS_RESOLVED)
+
+    def record_done(self, zbgcid, sha256, size, path):
+        self._upsert(zbgcid, sha256=sha256, size=size, path=path, status=STATUS_DONE, last_error=None)
+
+    def unpacked_documents(self):
+        """返回尚未打包进分片的已完成记录 [(zbgcid, sha256, path)]"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT zbgcid, sha256, path FROM downloads WHERE status = ? AND path NOT LIKE '%.pack#%'",
+                (STATUS_DONE,)).fetchall()
+
+    def relocate(self, sha256, pack_path, offset, length):
+        """把内容为 sha256 的所有记录改指向分片中的位置"""
+        with self._lock:
+            self._conn.execute("UPDATE downloads SET path = ? WHERE sha256 = ?",
+                               (f"{pack_path}#{offset}+{length}", sha256))
+            self._conn.commit()
+
+    def record_failed(self, zbgcid, error):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO downloads (zbgcid, status, attempts, last_error, updated_at) VALUES (?, ?, 1, ?, ?) "
+                "ON CONFLICT(zbgcid) DO UPDATE SET status = excluded.status, attempts = attempts + 1, "
+                "last_error = excluded.last_error, updated_at = excluded.updated_at",
+                (str(zbgcid), STATUS_FAILED, str(error), datetime.now().isoformat(timespec='seconds')))
+            self._conn.commit()
+
+    def summary(self):
+        """按状态统计记录数"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM downloads GROUP BY status").fetchall())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ContentStore:
+    """
+    按内容寻址的文件存储: <root>/<sha256前两位>/<sha256>.pdf
+
+    两级目录避免单个目录下文件过多；写入通过 os.replace 完成，是原子的。
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def path_for(self, sha256, suffix='.pdf'):
+        return os.path.join(self.root, sha256[:2], f"{sha256}{suffix}")
+
+    def put_file(self, src_path, sha256=None, doc_id=None):
+        """
+        把已写完的临时文件移入存储
+
+        Args:
+            src_path (str): 临时文件路径 (与存储位于同一文件系统)
+            sha256 (str): 文件的 sha256，未给出时现场计算
+            doc_id (str): 文档的 zbgcid，与 ShardStore 的接口一致；文件存储只按内容寻址，不使用
+
+        Returns:
+            tuple: (存储路径, sha256, 是否为新内容)
+        """
+        sha256 = sha256 or sha256_file(src_path)
+        target = self.path_for(sha256)
+        if os.path.exists(target):
+            # 相同内容已存在，丢弃这一份
+            os.remove(src_path)
+            return target, sha256, False
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(src_path, target)
+        return target, sha256, True
+
+    def exists(self, sha256):
+        return os.path.exists(self.path_for(sha256))
+
+
+SHARD_PATTERN = re.compile(r'^shard-(\d{6})\.pack$')
+# 分片内文档的位置串: <分片路径>#<偏移>+<长度>
+LOCATION_PATTERN = re.compile(r'^(.*\.pack)#(\d+)\+(\d+)$')
+
+
+def _shard_name(shard_no):
+    return f"shard-{shard_no:06d}.pack"
+
+
+class ShardStore:
+    """
+    分片存储: <root>/shard-000001.pack + <root>/shard-000001.idx
+
+    - .pack 由文档内容首尾相接组成，写满 max_shard_bytes 后滚动到下一个分片
+    - .idx 每行一个 JSON {"id", "sha256", "offset", "length"}，与分片一一对应，两者一起即可完整迁移；
+      内容相同的多个 zbgcid 各有一行，指向同一段内容 (旧版本写入的行没有 id)
+    - 先写入并 fsync 文档内容，再追加索引行；崩溃最多在分片末尾留下没有索引的孤立字节，
+      不影响已有文档，索引末尾不完整的行在加载时忽略
+    """
+
+    def __init__(self, root, max_shard_bytes=1024 * 1024 * 1024):
+        """
+        Args:
+            root (str): 分片目录
+            max_shard_bytes (int): 单个分片的大小上限 (单个文档超过上限时独占一个分片)
+        """
+        self.root = root
+        self.max_shard_bytes = max_shard_bytes
+        self._lock = threading.Lock()
+        self._index = {}
+        self._ids = {}
+        self._maps = {}
+        os.makedirs(root, exist_ok=True)
+
+        shards = self._list_shards()
+        for shard_no in shards:
+            self._load_index(shard_no)
+        # 总是从最后一个分片继续追加，它未写满时可以继续使用
+        self.shard_no = shards[-1] if shards else 1
+
+    def _list_shards(self):
+        numbers = []
+        for name in os.listdir(self.root):
+            match = SHARD_PATTERN.match(name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def shard_path(self, shard_no):
+        return os.path.join(self.root, _shard_name(shard_no))
+
+    def _index_path(self, shard_no):
+        return os.path.join(self.root, f"shard-{shard_no:06d}.idx")
+
+    def _load_index(self, shard_no):
+        path = self._index_path(shard_no)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self._index[entry['sha256']] = (shard_no, entry['offset'], entry['length'])
+                if entry.get('id') is not None:
+                    # 同一 zbgcid 重新下载过时以最后一行为准
+                    self._ids[entry['id']] = entry['sha256']
+
+    def _append_index(self, shard_no, entry):
+        with open(self._index_path(shard_no), 'a', encoding='utf-8') as idx:
+            idx.write(json.dumps(entry) + '\n')
+            idx.flush()
+            os.fsync(idx.fileno())
+
+    def _link(self, doc_id, sha256):
+        """为已在分片中的内容记录 zbgcid (调用方持有锁)"""
+        if doc_id is None or self._ids.get(str(doc_id)) == sha256:
+            return
+        shard_no, offset, length = self._index[sha256]
+        self._append_index(shard_no, {'id': str(doc_id), 'sha256': sha256, 'offset': offset, 'length': length})
+        self._ids[str(doc_id)] = sha256
+
+    def link(self, doc_id, sha256):
+        """为已在分片中的内容记录 zbgcid，之后可用 read_id 按 zbgcid 读取"""
+        with self._lock:
+            self._link(doc_id, sha256)
+
+    def locate(self, sha256):
+        """返回 (分片路径, 偏移, 长度)，不存在时返回 None"""
+        entry = self._index.get(sha256)
+        if entry is None:
+            return None
+        shard_no, offset, length = entry
+        return self.shard_path(shard_no), offset, length
+
+    def locate_id(self, doc_id):
+        """按 zbgcid 返回 (分片路径, 偏移, 长度)，不存在时返回 None"""
+        sha256 = self._ids.get(str(doc_id))
+        return self.locate(sha256) if sha256 else None
+
+    def location(self, sha256):
+        """返回文档的位置串，不存在时返回 None"""
+        entry = self.locate(sha256)
+        if entry is None:
+            return None
+        return "{}#{}+{}".format(*entry)
+
+    def exists(self, sha256):
+        return sha256 in self._index
+
+    def put_file(self, src_path, sha256=None, remove_source=True, doc_id=None):
+        """
+        把已写完的临时文件追加到当前分片，完成后删除临时文件
+
+        Args:
+            src_path (str): 临时文件路径
+            sha256 (str): 文件的 sha256，未给出时现场计算
+            remove_source (bool): 完成后删除源文件；为 False 时由调用方在记录新位置后自行删除
+            doc_id (str): 文档的 zbgcid，写入索引后可用 read_id 按 zbgcid 读取
+
+        Returns:
+            tuple: (位置串, sha256, 是否为新内容)
+        """
+        sha256 = sha256 or sha256_file(src_path)
+        length = os.path.getsize(src_path)
+        with self._lock:
+            if sha256 in self._index:
+                self._link(doc_id, sha256)
+                if remove_source:
+                    os.remove(src_path)
+                return self.location(sha256), sha256, False
+
+            path = self.shard_path(self.shard_no)
+            if os.path.exists(path) and os.path.getsize(path) and \
+                    os.path.getsize(path) + length > self.max_shard_bytes:
+                self.shard_no += 1
+                path = self.shard_path(self.shard_no)
+
+            with open(path, 'ab') as shard, open(src_path, 'rb') as src:
+                offset = shard.tell()
+                shutil.copyfileobj(src, shard, 1024 * 1024)
+                shard.flush()
+                os.fsync(shard.fileno())
+            entry = {'sha256': sha256, 'offset': offset, 'length': length}
+            if doc_id is not None:
+                entry = {'id': str(doc_id), **entry}
+            self._append_index(self.shard_no, entry)
+            self._index[sha256] = (self.shard_no, offset, length)
+            if doc_id is not None:
+                self._ids[str(doc_id)] = sha256
+
+        if remove_source:
+            os.remove(src_path)
+        return self.location(sha256), sha256, True
+
+    def _map(self, shard_no, end):
+        """返回分片的只读内存映射；正在追加的分片超出已映射长度时重新映射"""
+        mapped = self._maps.get(shard_no)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(self.shard_path(shard_no), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[shard_no] = mapped
+        return mapped
+
+    def read(self, sha256):
+        """按 sha256 随机读取一份文档的内容 (bytes)，无需解包分片"""
+        with self._lock:
+            shard_no, offset, length = self._index[sha256]
+            if not length:
+                return b''
+            return self._map(shard_no, offset + length)[offset:offset + length]
+
+    def read_id(self, doc_id):
+        """按 zbgcid 读取一份文档的内容 (bytes)，不存在时抛出 KeyError"""
+        return self.read(self._ids[str(doc_id)])
+
+    def close(self):
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+
+
+def read_document(path):
+    """
+    读取下载清单中记录的文档内容
+
+    Args:
+        path (str): ContentStore 的文件路径，或 ShardStore 的位置串 (分片路径#偏移+长度)
+
+    Returns:
+        bytes: 文档内容
+    """
+    match = LOCATION_PATTERN.match(path)
+    if not match:
+        with open(path, 'rb') as f:
+            return f.read()
+    shard_path, offset, length = match.group(1), int(match.group(2)), int(match.group(3))
+    if not length:
+        return b''
+    with open(shard_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return mapped[offset:offset + length]
+
+
+def pack_content_store(output_dir, max_shard_bytes=1024 * 1024 * 1024):
+    """
+    把 <output_dir>/objects/ 中的散文件打包进 <output_dir>/shards/，并更新下载清单中的路径
+
+    每份文档先追加到分片并提交清单中的新位置，再删除原文件，中断后重新运行会从剩余的文件继续；
+    原文件已不存在但内容已在分片中的记录 (旧版本中断留下的) 直接改指向分片。
+    内容相同的每个 zbgcid 都写入分片索引。
+
+    Returns:
+        int: 打包的文档数
+    """
+    manifest = DownloadManifest(os.path.join(output_dir, "manifest.sqlite"))
+    shards = ShardStore(os.path.join(output_dir, "shards"), max_shard_bytes)
+    packed = 0
+    try:
+        documents = {}
+        for zbgcid, sha256, path in manifest.unpacked_documents():
+            documents.setdefault((sha256, path), []).append(zbgcid)
+        for (sha256, path), ids in documents.items():
+            if os.path.exists(path):
+                shards.put_file(path, sha256, remove_source=False, doc_id=ids[0])
+            elif not shards.exists(sha256):
+                continue
+            for zbgcid in ids:
+                shards.link(zbgcid, sha256)
+            manifest.relocate(sha256, *shards.locate(sha256))
+            if os.path.exists(path):
+                os.remove(path)
+            packed += 1
+        return packed
+    finally:
+        shards.close()
+        manifest.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="把已下载的 PDF 散文件打包为分片存储")
+    parser.add_argument("output_dir", nargs="?", default="downloads", help="PDFDownloader 的输出目录")
+    parser.add_argument("--max-shard-mb", type=int, default=1024, help="单个分片的大小上限 (MB)")
+    args = parser.parse_args()
+    count = pack_content_store(args.output_dir, args.max_shard_mb * 1024 * 1024)
+    print(f"📦 已打包 {count} 份文档到 {os.path.join(args.output_dir, 'shards')}")
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+已下载公示 PDF 的文本抽取与全文索引
+
+下载完成后，用进程池并行抽取每份新 PDF 的文本 (CPU 密集，按可用核数并行)，
+再把全文和关键字段 (中标候选人名称、投标报价) 写入 SQLite:
+
+    documents        每份文档一行 (zbgcid, sha256, 页数, 字数, 错误信息)
+    documents_fts    FTS5 全文索引 (trigram 分词，支持中文子串检索)
+    bid_candidates   解析出的候选人及报价
+
+相同内容 (sha256 相同) 的文档只抽取一次，结果写入所有对应的 zbgcid。
+
+使用方法:
+    python pdf_text_index.py [输出目录]            # 为新下载的 PDF 建索引
+    python pdf_text_index.py [输出目录] --search 上海建工
+"""
+
+import argparse
+import io
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from pdf_store import read_document
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+RANK_NUMERALS = {'一': 1, '二': 2, '三': 3, '四': 4, '五': 5, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5}
+
+# 第一中标候选人：xxx公司 / 第1名：xxx公司 (贪婪匹配后回溯到最后一个单位后缀，取完整名称)
+CANDIDATE_PATTERN = re.compile(
+    r'第\s*([一二三四五12345])\s*(?:中标)?(?:候选人|名)\s*(?:名称)?\s*[:：]?\s*'
+    r'([一-龥（）()A-Za-z·]{2,60}(?:公司|研究院|设计院|研究所|事务所|集团|中心))')
+# 投标报价：1,234.56 万元 / 投标报价(元)：1234567
+AMOUNT_PATTERN = re.compile(
+    r'(?:投标报价|投标价格|中标价|报价)\s*[（(]?\s*(万元|元)?\s*[)）]?\s*[:：]?\s*(?:人民币)?\s*'
+    r'([0-9][0-9,]*(?:\.[0-9]+)?)\s*(万元|元)?')
+
+
+def default_workers():
+    """进程数取当前进程可用的 CPU 核数"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def extract_key_fields(text):
+    """
+    从公示全文中解析候选人及其报价
+
+    报价按出现顺序与候选人一一对应 (公示表格按名次排列)，统一换算为元。
+
+    Returns:
+        list: [{'rank': 1, 'name': 'xxx公司', 'amount_yuan': 123456.0}, ...]
+    """
+    compact = re.sub(r'[ \t\r\f\v]+', ' ', text)
+    candidates = []
+    seen = set()
+    for match in CANDIDATE_PATTERN.finditer(compact):
+        rank = RANK_NUMERALS.get(match.group(1))
+        name = match.group(2).strip()
+        if (rank, name) in seen:
+            continue
+        seen.add((rank, name))
+        candidates.append({'rank': rank, 'name': name, 'amount_yuan': None})
+
+    amounts = []
+    for match in AMOUNT_PATTERN.finditer(compact):
+        unit = match.group(1) or match.group(3) or '元'
+        try:
+            value = float(match.group(2).replace(',', ''))
+        except ValueError:
+            continue
+        amounts.append(value * 10000 if unit == '万元' else value)
+
+    for candidate, amount in zip(candidates, amounts):
+        candidate['amount_yuan'] = amount
+    return candidates
+
+
+def extract_document(task):
+    """
+    进程池中执行: 抽取一份 PDF 的文本和关键字段
+
+    Args:
+        task (tuple): (sha256, 文件路径或分片位置串)
+
+    Returns:
+        dict: sha256 / pages / text / fields / error
+    """
+    sha256, path = task
+    result = {'sha256': sha256, 'pages': 0, 'text': '', 'fields': [], 'error': None}
+    if PdfReader is None:
+        result['error'] = "未安装 pypdf，无法抽取文本 (pip install pypdf)"
+        return result
+    try:
+        # 文件和分片中的文档统一读入内存后解析，分片通过内存映射只读取该文档的字节
+        reader = PdfReader(io.BytesIO(read_document(path)))
+        pages = [page.extract_text() or '' for page in reader.pages]
+        result['pages'] = len(pages)
+        result['text'] = '\n'.join(pages)
+        result['fields'] = extract_key_fields(result['text'])
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+class PdfTextIndex:
+    """基于 SQLite FTS5 的文本索引"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                zbgcid      TEXT PRIMARY KEY,
+                sha256      TEXT,
+                pages       INTEGER,
+                chars       INTEGER,
+                error       TEXT,
+                indexed_at  TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_documents_sha256 ON documents(sha256);
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                zbgcid UNINDEXED, text, tokenize = 'trigram'
+            );
+            CREATE TABLE IF NOT EXISTS bid_candidates (
+                zbgcid      TEXT NOT NULL,
+                rank        INTEGER,
+                name        TEXT NOT NULL,
+                amount_yuan REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_bid_candidates_zbgcid ON bid_candidates(zbgcid);
+            CREATE INDEX IF NOT EXISTS idx_bid_candidates_name ON bid_candidates(name);
+        """)
+
+    def pending_documents(self, manifest_path):
+        """
+        返回下载清单中已完成、但尚未建索引或上次抽取失败的文档 (失败的文档每次运行都会重试)
+
+        Returns:
+            dict: sha256 -> (文件路径, [zbgcid, ...])
+        """
+        self.conn.execute("ATTACH DATABASE ? AS manifest", (manifest_path,))
+        try:
+            rows = self.conn.execute("""
+                SELECT m.zbgcid, m.sha256, m.path FROM manifest.downloads m
+                WHERE m.status = 'done'
+                  AND NOT EXISTS (SELECT 1 FROM documents d WHERE d.zbgcid = m.zbgcid AND d.sha256 = m.sha256
+                                  AND d.error IS NULL)
+            """).fetchall()
+        finally:
+            self.conn.execute("DETACH DATABASE manifest")
+        pending = {}
+        for zbgcid, sha256, path in rows:
+            pending.setdefault(sha256, (path, []))[1].append(zbgcid)
+        return pending
+
+    def add(self, zbgcids, result):
+        """写入一份文档的抽取结果 (对所有共享该内容的 zbgcid)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            for zbgcid in zbgcids:
+                self.conn.execute("DELETE FROM documents_fts WHERE zbgcid = ?", (zbgcid,))
+                self.conn.execute("DELETE FROM bid_candidates WHERE zbgcid = ?", (zbgcid,))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO documents (zbgcid, sha256, pages, chars, error, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (zbgcid, result['sha256'], result['pages'], len(result['text']), result['error'], now))
+                if result['text']:
+                    self.conn.execute("INSERT INTO documents_fts (zbgcid, text) VALUES (?, ?)",
+                                      (zbgcid, result['text']))
+                self.conn.executemany(
+                    "INSERT INTO bid_candidates (zbgcid, rank, name, amount_yuan) VALUES (?, ?, ?, ?)",
+                    [(zbgcid, f['rank'], f['name'], f['amount_yuan']) for f in result['fields']])
+
+    def search(self, query, limit=20):
+        """全文检索，返回 [(zbgcid, 摘要), ...]；查询词至少 3 个字符 (trigram 分词)"""
+        return self.conn.execute(
+            "SELECT zbgcid, snippet(documents_fts, 1, '[', ']', '…', 16) FROM documents_fts "
+            "WHERE documents_fts MATCH ? ORDER BY rank LIMIT ?",
+            ('"' + query.replace('"', '""') + '"', limit)).fetchall()
+
+    def candidates_by_name(self, name):
+        """按候选人名称 (子串) 查询其出现过的公示及报价"""
+        return self.conn.execute(
+            "SELECT zbgcid, rank, name, amount_yuan FROM bid_candidates WHERE name LIKE ? ORDER BY zbgcid",
+            (f"%{name}%",)).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def index_new_documents(output_dir="downloads", workers=None):
+    """
+    为输出目录中新下载的 PDF 建立文本索引
+
+    Args:
+        output_dir (str): PDFDownloader 的输出目录 (含 manifest.sqlite)
+        workers (int): 进程数，默认为可用核数
+
+    Returns:
+        int: 本次建索引的文档数 (按 zbgcid 计)
+    """
+    manifest_path = os.path.join(output_dir, "manifest.sqlite")
+    if not os.path.exists(manifest_path):
+        print(f"⚠️  未找到下载清单: {manifest_path}")
+        return 0
+    if PdfReader is None:
+        print("⚠️  未安装 pypdf，无法抽取文本 (pip install pypdf)，本次不建索引")
+        return 0
+
+    index = PdfTextIndex(os.path.join(output_dir, "text_index.sqlite"))
+    try:
+        pending = index.pending_documents(manifest_path)
+        if not pending:
+            print("📚 没有需要建索引的新文档")
+            return 0
+
+        workers = workers or default_workers()
+        tasks = [(sha256, path) for sha256, (path, _) in pending.items()]
+        print(f"📚 开始抽取 {len(tasks)} 份文档的文本 (进程数: {workers})")
+
+        indexed = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 主进程负责写 SQLite，子进程只做解析，避免多进程写库竞争
+            for result in executor.map(extract_document, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+                zbgcids = pending[result['sha256']][1]
+                index.add(zbgcids, result)
+                indexed += len(zbgcids)
+                if result['error']:
+                    print(f"⚠️  文本抽取失败 ({result['sha256'][:12]}): {result['error']}")
+        print(f"📚 文本索引完成，共 {indexed} 个ID")
+        return indexed
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="公示 PDF 文本抽取与检索")
+    parser.add_argument("output_dir", nargs="?", default="downloads", help="PDFDownloader 的输出目录")
+    parser.add_argument("--workers", type=int, help="抽取文本的进程数，默认为可用核数")
+    parser.add_argument("--search", help="全文检索关键词")
+    parser.add_argument("--candidate", help="按候选人名称查询")
+    args = parser.parse_args()
+
+    if not args.search and not args.candidate:
+        index_new_documents(args.output_dir, args.workers)
+        return
+
+    index = PdfTextIndex(os.path.join(args.output_dir, "text_index.sqlite"))
+    try:
+        if args.search:
+            for zbgcid, snippet in index.search(args.search):
+                print(f"{zbgcid}\t{snippet}")
+        if args.candidate:
+            for zbgcid, rank, name, amount in index.candidates_by_name(args.candidate):
+                print(f"{zbgcid}\t第{rank}名\t{name}\t{amount if amount is not None else ''}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
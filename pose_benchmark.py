@@ -0,0 +1,228 @@
+"""
+OpenPose 推理配置基准 (仅 CPU)
+
+在一段录制好的视频上，依次测试以下组合:
+- 后端 / 目标: OpenCV 原生 FP32、OpenCV 原生 FP16 (DNN_TARGET_CPU_FP16，OpenCV 4.9+)、
+  OpenVINO (安装了带 Inference Engine 的 OpenCV 时)；不可用的组合自动跳过
+- 线程数 (cv.setNumThreads)
+- 输入分辨率
+
+对每个组合输出端到端 FPS、单帧耗时 p50/p95、net.getPerfProfile() 的逐层耗时 (最慢的几层)，
+以及与基准配置 (第一组组合) 的关键点一致率，用于选出足够准确的最快配置。
+
+使用方法:
+    python pose_benchmark.py recorded.mp4 --frames 100 --threads 1,4,8 --sizes 368x368,256x256
+"""
+
+import argparse
+import json
+import time
+
+import cv2 as cv
+import numpy as np
+
+from humanposetest import BODY_PARTS, heatmap_points, load_net, model, protoc
+
+# (名称, 后端常量名, 目标常量名)；常量在当前 OpenCV 中不存在时跳过
+BACKEND_TARGETS = [
+    ('opencv-fp32', 'DNN_BACKEND_OPENCV', 'DNN_TARGET_CPU'),
+    ('opencv-fp16', 'DNN_BACKEND_OPENCV', 'DNN_TARGET_CPU_FP16'),
+    ('openvino-fp32', 'DNN_BACKEND_INFERENCE_ENGINE', 'DNN_TARGET_CPU'),
+]
+
+
+def available_backend_targets(names=None):
+    """返回当前 OpenCV 构建支持的 [(名称, 后端, 目标), ...]"""
+    available = []
+    for name, backend_name, target_name in BACKEND_TARGETS:
+        if names and name not in names:
+            continue
+        backend = getattr(cv.dnn, backend_name, None)
+        target = getattr(cv.dnn, target_name, None)
+        if backend is None or target is None:
+            continue
+        try:
+            targets = cv.dnn.getAvailableTargets(backend)
+        except cv.error:
+            continue
+        if target in targets:
+            available.append((name, backend, target))
+    return available
+
+
+def read_frames(video_path, max_frames):
+    """读取视频的前 max_frames 帧到内存，保证各组合处理的是完全相同的输入"""
+    cap = cv.VideoCapture(video_path)
+    frames = []
+    while len(frames) < max_frames:
+        hasFrame, frame = cap.read()
+        if not hasFrame:
+            break
+        frames.append(frame)
+    cap.release()
+    if not frames:
+        raise RuntimeError(f"无法从视频读取帧: {video_path}")
+    return frames
+
+
+def keypoint_agreement(points, baseline, frame_shape, tolerance=0.02):
+    """
+    两组关键点的一致率
+
+    只比较真实的身体部位 (不含背景)。同一部位两者都未检出，或都检出且距离不超过 tolerance * 图像长边，视为一致。
+    """
+    limit = tolerance * max(frame_shape[:2])
+    parts = [i for name, i in BODY_PARTS.items() if name != 'Background']
+    agree = 0
+    for i in parts:
+        p, b = points[i], baseline[i]
+        if p is None and b is None:
+            agree += 1
+        elif p is not None and b is not None and np.hypot(p[0] - b[0], p[1] - b[1]) <= limit:
+            agree += 1
+    return agree / len(parts)
+
+
+def run_config(frames, backend, target, threads, size, net_factory, warmup=3):
+    """
+    用一个组合处理全部帧
+
+    Returns:
+        dict: 每帧耗时 (ms)、每帧关键点、逐层平均耗时 (ms)
+    """
+    cv.setNumThreads(threads)
+    net = net_factory()
+    net.setPreferableBackend(backend)
+    net.setPreferableTarget(target)
+    width, height = size
+
+    def infer(frame):
+        blob = cv.dnn.blobFromImage(frame, 1.0 / 255, (width, height), (0, 0, 0), swapRB=False, crop=False)
+        net.setInput(blob)
+        return net.forward()
+
+    for frame in frames[:warmup]:
+        infer(frame)
+
+    freq = cv.getTickFrequency() / 1000
+    layer_names = list(net.getLayerNames())
+    layer_totals = np.zeros(len(layer_names))
+    latencies, keypoints = [], []
+    for frame in frames:
+        started = time.perf_counter()
+        out = infer(frame)
+        points = heatmap_points(out[0], frame.shape[1], frame.shape[0])
+        latencies.append((time.perf_counter() - started) * 1000)
+        keypoints.append(points)
+        _, layer_ticks = net.getPerfProfile()
+        layer_ticks = np.asarray(layer_ticks, dtype=np.float64).ravel()
+        if len(layer_ticks) == len(layer_names):
+            layer_totals += layer_ticks
+    layers = {name: total / len(frames) / freq for name, total in zip(layer_names, layer_totals)}
+    return {'latencies': latencies, 'keypoints': keypoints, 'layers': layers}
+
+
+def run_benchmark(video_path, max_frames=100, threads_list=(0,), sizes=((368, 368),), backend_names=None,
+                  net_factory=None, top_layers=5):
+    """
+    扫描所有可用组合，第一组为基准
+
+    Args:
+        threads_list (list): 线程数列表，0 表示 OpenCV 默认
+        sizes (list): 输入分辨率 [(宽, 高), ...]
+        backend_names (list): 只测试这些后端/目标名称，默认全部可用的
+        net_factory (callable): 创建网络的函数，默认加载 humanposetest 中的模型
+
+    Returns:
+        list: 每个组合的结果 dict
+    """
+    net_factory = net_factory or load_net
+    frames = read_frames(video_path, max_frames)
+    combos = available_backend_targets(backend_names)
+    if not combos:
+        raise RuntimeError("没有可用的后端/目标组合")
+    default_threads = cv.getNumThreads()
+
+    results = []
+    baseline = None
+    for name, backend, target in combos:
+        for threads in threads_list:
+            for size in sizes:
+                label = f"{name} threads={threads or default_threads} {size[0]}x{size[1]}"
+                try:
+                    run = run_config(frames, backend, target, threads or default_threads, size, net_factory)
+                except cv.error as e:
+                    print(f"跳过 {label}: {e}")
+                    continue
+                if baseline is None:
+                    baseline = run['keypoints']
+                latencies = sorted(run['latencies'])
+                agreement = np.mean([keypoint_agreement(p, b, f.shape)
+                                     for p, b, f in zip(run['keypoints'], baseline, frames)])
+                slowest = sorted(run['layers'].items(), key=lambda item: item[1], reverse=True)[:top_layers]
+                result = {
+                    'config': label,
+                    'backend': name,
+                    'threads': threads or default_threads,
+                    'size': f"{size[0]}x{size[1]}",
+                    'fps': round(len(frames) / (sum(latencies) / 1000), 2),
+                    'p50_ms': round(latencies[len(latencies) // 2], 2),
+                    'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+                    'agreement': round(float(agreement), 4),
+                    'slowest_layers_ms': {layer: round(float(ms), 2) for layer, ms in slowest},
+                }
+                print(f"{label}: {result['fps']} FPS, p50 {result['p50_ms']} ms, "
+                      f"一致率 {result['agreement']:.1%}")
+                results.append(result)
+    cv.setNumThreads(default_threads)
+    return results
+
+
+def pick_fastest(results, min_agreement):
+    """一致率不低于 min_agreement 的组合中 FPS 最高的一个"""
+    candidates = [r for r in results if r['agreement'] >= min_agreement]
+    return max(candidates, key=lambda r: r['fps']) if candidates else None
+
+
+def _parse_size(text):
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenPose 推理配置基准 (CPU)")
+    parser.add_argument('video', help="录制好的视频文件")
+    parser.add_argument('--frames', type=int, default=100, help="参与测试的帧数")
+    parser.add_argument('--threads', default='0', help="线程数列表，逗号分隔，0 表示 OpenCV 默认")
+    parser.add_argument('--sizes', default='368x368', help="输入分辨率列表，如 368x368,256x256")
+    parser.add_argument('--backends', help="只测试这些后端，逗号分隔 (" +
+                        ', '.join(name for name, _, _ in BACKEND_TARGETS) + ")")
+    parser.add_argument('--min-agreement', type=float, default=0.9, help="推荐配置要求的最低关键点一致率")
+    parser.add_argument('--proto', default=protoc, help="prototxt 路径")
+    parser.add_argument('--model', default=model, help="caffemodel 路径")
+    parser.add_argument('--json', dest='json_path', help="把结果另存为 JSON 文件")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        args.video, args.frames,
+        threads_list=[int(t) for t in args.threads.split(',')],
+        sizes=[_parse_size(s) for s in args.sizes.split(',')],
+        backend_names=args.backends.split(',') if args.backends else None,
+        net_factory=lambda: load_net(args.proto, args.model))
+
+    print()
+    for r in results:
+        print(f"{r['config']:<40} {r['fps']:>8} FPS  p50 {r['p50_ms']:>8} ms  p95 {r['p95_ms']:>8} ms  "
+              f"一致率 {r['agreement']:.1%}")
+        print(f"{'':<40} 最慢的层: {r['slowest_layers_ms']}")
+    best = pick_fastest(results, args.min_agreement)
+    if best:
+        print(f"\n推荐配置 (一致率 >= {args.min_agreement:.0%}): {best['config']}")
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'params': vars(args), 'parts': list(BODY_PARTS), 'results': results},
+                      f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
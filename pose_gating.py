@@ -0,0 +1,153 @@
+"""
+推理前的运动门控与感兴趣区域 (ROI) 裁剪
+
+在缩小后的灰度图上做帧差或背景建模 (MOG2)，判断画面是否有变化:
+- 静止画面直接跳过，不执行 blobFromImage / forward，空闲摄像头几乎不消耗算力
+- 有运动时，只对运动区域及上一次检测到的人周围 (加边距) 裁剪后推理，
+  远处的小目标在 368x368 输入中能保留更多像素；关键点再映射回整帧坐标
+
+每个 ROI 都缩放到同样的网络输入尺寸，推理耗时与整帧相同，N 个 ROI 的耗时约为整帧的 N 倍
+(即使放在同一个 batch 中)。因此算力的节省只来自跳过静止帧: 默认只保留一个 ROI，
+运动分散成多个区域 (超过 max_rois) 或 ROI 占画面大部分 (超过 max_roi_fraction) 时改用整帧。
+"""
+
+import cv2 as cv
+import numpy as np
+
+GATE_METHODS = ('diff', 'mog2')
+
+
+class MotionGate:
+    """按帧判断是否需要推理以及推理哪些区域"""
+
+    def __init__(self, method='diff', analysis_width=160, diff_threshold=25, min_motion_ratio=0.002,
+                 padding=0.25, max_roi_fraction=0.6, max_rois=1, min_roi_size=64, max_skip_frames=None):
+        """
+        Args:
+            method (str): 'diff' 与上一次分析的帧做差; 'mog2' 背景建模 (适合有光照缓变的场景)
+            analysis_width (int): 运动分析用的缩小宽度
+            diff_threshold (int): 帧差模式下像素变化的阈值 (0-255)
+            min_motion_ratio (float): 运动像素占比低于该值时视为静止
+            padding (float): ROI 四周按自身尺寸加的边距比例
+            max_roi_fraction (float): ROI 合计面积超过整帧的该比例时改用整帧
+            max_rois (int): ROI 数量上限，超过时改用整帧 (每个 ROI 单独占一份 forward 的算力)
+            min_roi_size (int): ROI 的最小边长 (原图像素)
+            max_skip_frames (int): 连续跳过的帧数上限，达到后强制推理一次；None 为不限
+        """
+        if method not in GATE_METHODS:
+            raise ValueError(f"未知的门控方式: {method}，可选值为 {GATE_METHODS}")
+        self.method = method
+        self.analysis_width = analysis_width
+        self.diff_threshold = diff_threshold
+        self.min_motion_ratio = min_motion_ratio
+        self.padding = padding
+        self.max_roi_fraction = max_roi_fraction
+        self.max_rois = max_rois
+        self.min_roi_size = min_roi_size
+        self.max_skip_frames = max_skip_frames
+
+        self._previous = None
+        self._subtractor = cv.createBackgroundSubtractorMOG2(history=300, detectShadows=False) \
+            if method == 'mog2' else None
+        self._kernel = cv.getStructuringElement(cv.MORPH_ELLIPSE, (5, 5))
+        self.skipped_in_row = 0
+        self.stats = {'frames': 0, 'skipped': 0, 'roi_frames': 0, 'full_frames': 0}
+
+    def _motion_mask(self, frame):
+        scale = self.analysis_width / frame.shape[1]
+        small = cv.resize(frame, (self.analysis_width, max(1, int(round(frame.shape[0] * scale)))),
+                          interpolation=cv.INTER_AREA)
+        gray = cv.GaussianBlur(cv.cvtColor(small, cv.COLOR_BGR2GRAY), (5, 5), 0)
+        if self._subtractor is not None:
+            mask = self._subtractor.apply(gray)
+        elif self._previous is None:
+            mask = np.full(gray.shape, 255, np.uint8)  # 第一帧视为全画面运动
+        else:
+            _, mask = cv.threshold(cv.absdiff(gray, self._previous), self.diff_threshold, 255, cv.THRESH_BINARY)
+        self._previous = gray
+        return cv.dilate(mask, self._kernel, iterations=2), scale
+
+    def _pad(self, box, frame_shape):
+        x, y, w, h = box
+        pad_x, pad_y = w * self.padding, h * self.padding
+        x0, y0 = max(0, int(x - pad_x)), max(0, int(y - pad_y))
+        x1 = min(frame_shape[1], int(x + w + pad_x))
+        y1 = min(frame_shape[0], int(y + h + pad_y))
+        # 太小的区域扩大到最小边长，保证裁剪后仍有足够的上下文
+        if x1 - x0 < self.min_roi_size:
+            cx = (x0 + x1) // 2
+            x0, x1 = max(0, cx - self.min_roi_size // 2), min(frame_shape[1], cx + self.min_roi_size // 2)
+        if y1 - y0 < self.min_roi_size:
+            cy = (y0 + y1) // 2
+            y0, y1 = max(0, cy - self.min_roi_size // 2), min(frame_shape[0], cy + self.min_roi_size // 2)
+        return [x0, y0, x1, y1]
+
+    @staticmethod
+    def _merge(boxes):
+        """合并相交的矩形 [x0, y0, x1, y1]，直到没有相交为止"""
+        boxes = [list(b) for b in boxes]
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    a, b = boxes[i], boxes[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        boxes[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        return boxes
+
+    def analyze(self, frame, people=None):
+        """
+        分析一帧
+
+        Args:
+            frame (ndarray): BGR 原图
+            people (ndarray): 上一次检测到的人 (人数, 部位数, 3)，其周围区域总会被包含在 ROI 中
+
+        Returns:
+            tuple: (是否跳过, ROI 列表 [(x, y, w, h), ...])；ROI 为 None 表示推理整帧
+        """
+        self.stats['frames'] += 1
+        mask, scale = self._motion_mask(frame)
+        ratio = cv.countNonZero(mask) / mask.size
+        forced = self.max_skip_frames is not None and self.skipped_in_row >= self.max_skip_frames
+        if ratio < self.min_motion_ratio and not forced:
+            self.skipped_in_row += 1
+            self.stats['skipped'] += 1
+            return True, []
+        self.skipped_in_row = 0
+
+        boxes = []
+        contours, _ = cv.findContours(mask, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            x, y, w, h = cv.boundingRect(contour)
+            boxes.append(self._pad((x / scale, y / scale, w / scale, h / scale), frame.shape))
+        if people is not None:
+            for person in people:
+                visible = person[person[:, 2] > 0]
+                if len(visible):
+                    x0, y0 = visible[:, 0].min(), visible[:, 1].min()
+                    x1, y1 = visible[:, 0].max(), visible[:, 1].max()
+                    boxes.append(self._pad((x0, y0, x1 - x0, y1 - y0), frame.shape))
+
+        boxes = self._merge(boxes)
+        area = sum((b[2] - b[0]) * (b[3] - b[1]) for b in boxes)
+        if not boxes or len(boxes) > self.max_rois or area > self.max_roi_fraction * frame.shape[0] * frame.shape[1]:
+            self.stats['full_frames'] += 1
+            return False, None
+        self.stats['roi_frames'] += 1
+        return False, [(b[0], b[1], b[2] - b[0], b[3] - b[1]) for b in boxes]
+
+
+def offset_people(people, x, y):
+    """把 ROI 内的关键点坐标平移回整帧坐标 (缺失部位保持为 0)"""
+    people = np.array(people, dtype=np.float32, copy=True)
+    visible = people[..., 2] > 0
+    people[..., 0][visible] += x
+    people[..., 1][visible] += y
+    return people
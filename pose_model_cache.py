@@ -0,0 +1,191 @@
+"""
+OpenPose 模型的预处理缓存与预热，缩短摄像头进程重启到输出首个关键点的时间
+
+启动慢的两部分:
+- readNetFromCaffe 解析约 200 MB 的 pose_iter_440000.caffemodel
+- 第一次 forward 时才分配各层内存、做层融合和卷积算法选择
+
+prepare_model 预先把 caffemodel 转成 FP16 权重 (cv.dnn.shrinkCaffeModel，文件减半，
+加载时再展开为 FP32，精度损失可忽略) 并与 prototxt 一起存入缓存目录；
+manifest.json 记录源文件的大小和修改时间，源文件变化后自动重新生成。
+load_cached_net 从缓存加载网络，按实际输入尺寸预热 forward 后才返回，并报告各阶段耗时。
+
+OpenCV DNN 不能把已优化的内部图序列化，因此缓存的是缩小后的权重，层融合等工作仍在预热中完成。
+
+使用方法:
+    python pose_model_cache.py                           # 生成缓存并对比冷启动耗时
+    python humanposetest.py --model-cache model_cache    # 从缓存启动
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import cv2 as cv
+import numpy as np
+
+DEFAULT_CACHE_DIR = 'model_cache'
+MANIFEST_NAME = 'manifest.json'
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _cache_paths(proto_path, model_path, cache_dir, fp16):
+    """缓存目录按模型文件名区分，返回 (模型缓存目录, 缓存的 prototxt, 缓存的 caffemodel)"""
+    model_dir = os.path.join(cache_dir, os.path.splitext(os.path.basename(model_path))[0])
+    suffix = '.fp16.caffemodel' if fp16 else '.caffemodel'
+    return (model_dir, os.path.join(model_dir, os.path.basename(proto_path)),
+            os.path.join(model_dir, os.path.splitext(os.path.basename(model_path))[0] + suffix))
+
+
+def prepare_model(proto_path, model_path, cache_dir=DEFAULT_CACHE_DIR, fp16=True):
+    """
+    生成 (或重新生成) 模型缓存
+
+    Args:
+        proto_path (str): 原始 prototxt
+        model_path (str): 原始 caffemodel
+        cache_dir (str): 缓存根目录
+        fp16 (bool): 权重转为 FP16 存储
+
+    Returns:
+        dict: 写入的 manifest
+    """
+    model_dir, cached_proto, cached_model = _cache_paths(proto_path, model_path, cache_dir, fp16)
+    os.makedirs(model_dir, exist_ok=True)
+    started = time.perf_counter()
+
+    # 先写临时文件再替换，多个进程同时准备缓存时不会读到半个文件
+    tmp_proto, tmp_model = cached_proto + f'.{os.getpid()}.tmp', cached_model + f'.{os.getpid()}.tmp'
+    shutil.copyfile(proto_path, tmp_proto)
+    if fp16:
+        cv.dnn.shrinkCaffeModel(model_path, tmp_model)
+    else:
+        shutil.copyfile(model_path, tmp_model)
+    os.replace(tmp_proto, cached_proto)
+    os.replace(tmp_model, cached_model)
+
+    manifest = {
+        'proto': _signature(proto_path),
+        'model': _signature(model_path),
+        'fp16': fp16,
+        'cached_proto': os.path.basename(cached_proto),
+        'cached_model': os.path.basename(cached_model),
+        'cached_model_bytes': os.path.getsize(cached_model),
+        'opencv': cv.__version__,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    tmp_manifest = os.path.join(model_dir, MANIFEST_NAME + f'.{os.getpid()}.tmp')
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_manifest, os.path.join(model_dir, MANIFEST_NAME))
+    print(f"📦 模型缓存已生成: {cached_model} ({manifest['model']['size'] / 1024 / 1024:.1f} MB -> "
+          f"{manifest['cached_model_bytes'] / 1024 / 1024:.1f} MB, "
+          f"{(time.perf_counter() - started) * 1000:.0f} ms)", file=sys.stderr)
+    return manifest
+
+
+def cached_model_paths(proto_path, model_path, cache_dir=DEFAULT_CACHE_DIR, fp16=True):
+    """
+    返回有效的缓存文件 (prototxt, caffemodel)；没有缓存或源文件已变化时返回 None
+
+    源文件不存在 (只部署了缓存) 时直接使用缓存。
+    """
+    model_dir, cached_proto, cached_model = _cache_paths(proto_path, model_path, cache_dir, fp16)
+    try:
+        with open(os.path.join(model_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('fp16') != fp16 or not (os.path.exists(cached_proto) and os.path.exists(cached_model)):
+        return None
+    for key, path in (('proto', proto_path), ('model', model_path)):
+        if os.path.exists(path):
+            current = _signature(path)
+            if (current['size'], current['mtime_ns']) != (manifest[key]['size'], manifest[key]['mtime_ns']):
+                return None
+    return cached_proto, cached_model
+
+
+def warm_up(net, input_size=(368, 368), runs=1):
+    """用全零输入按实际尺寸执行 forward，使层分配与融合在开始服务前完成，返回每次耗时 (ms)"""
+    width, height = input_size
+    blob = cv.dnn.blobFromImage(np.zeros((height, width, 3), np.uint8), 1.0 / 255, (width, height),
+                                (0, 0, 0), swapRB=False, crop=False)
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        net.setInput(blob)
+        net.forward()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def load_cached_net(proto_path, model_path, cache_dir=DEFAULT_CACHE_DIR, fp16=True, backend=None, target=None,
+                    input_size=(368, 368), warmup_runs=1):
+    """
+    从缓存加载网络并预热；缓存缺失或过期时先生成
+
+    Args:
+        backend (int): cv.dnn 后端，None 为默认
+        target (int): cv.dnn 目标，None 为默认 (可用 pose_benchmark.py 选出的组合)
+        input_size (tuple): 预热用的输入尺寸 (宽, 高)，应与实际推理一致
+        warmup_runs (int): 预热 forward 次数
+
+    Returns:
+        tuple: (net, 耗时 dict: prepare_ms / load_ms / warmup_ms / ready_ms)
+    """
+    started = time.perf_counter()
+    timings = {'prepare_ms': 0.0}
+    paths = cached_model_paths(proto_path, model_path, cache_dir, fp16)
+    if paths is None:
+        prepare_model(proto_path, model_path, cache_dir, fp16)
+        paths = cached_model_paths(proto_path, model_path, cache_dir, fp16)
+        timings['prepare_ms'] = (time.perf_counter() - started) * 1000
+
+    loading = time.perf_counter()
+    net = cv.dnn.readNetFromCaffe(*paths)
+    if backend is not None:
+        net.setPreferableBackend(backend)
+    if target is not None:
+        net.setPreferableTarget(target)
+    timings['load_ms'] = (time.perf_counter() - loading) * 1000
+    timings['warmup_ms'] = sum(warm_up(net, input_size, warmup_runs))
+    timings['ready_ms'] = (time.perf_counter() - started) * 1000
+    print(f"✅ 模型就绪: 加载 {timings['load_ms']:.0f} ms, 预热 {timings['warmup_ms']:.0f} ms, "
+          f"共 {timings['ready_ms']:.0f} ms", file=sys.stderr)
+    return net, {name: round(value, 1) for name, value in timings.items()}
+
+
+def main():
+    from humanposetest import inHeight, inWidth, model, protoc
+
+    parser = argparse.ArgumentParser(description="生成 OpenPose 模型缓存并对比冷启动耗时")
+    parser.add_argument('--proto', default=protoc, help="prototxt 路径")
+    parser.add_argument('--model', default=model, help="caffemodel 路径")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="缓存目录")
+    parser.add_argument('--no-fp16', action='store_true', help="权重保持 FP32 (只做预热)")
+    args = parser.parse_args()
+    fp16 = not args.no_fp16
+
+    prepare_model(args.proto, args.model, args.cache_dir, fp16)
+
+    started = time.perf_counter()
+    net = cv.dnn.readNetFromCaffe(args.proto, args.model)
+    load_ms = (time.perf_counter() - started) * 1000
+    first_ms = warm_up(net, (inWidth, inHeight))[0]
+    print(f"原始模型: 加载 {load_ms:.0f} ms + 首次 forward {first_ms:.0f} ms = {load_ms + first_ms:.0f} ms")
+
+    _, timings = load_cached_net(args.proto, args.model, args.cache_dir, fp16, input_size=(inWidth, inHeight))
+    print(f"缓存模型: 加载 {timings['load_ms']:.0f} ms + 预热 {timings['warmup_ms']:.0f} ms = "
+          f"{timings['ready_ms']:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+多路摄像头批量姿态检测
+
+每路视频源 (RTSP 地址或视频文件) 一个采集线程，只保留最新一帧；
+推理线程每轮从有新帧的视频源中各取一帧，用 blobFromImages 组成一个 batch，
+只执行一次 forward，再把各自的关键点分发回对应的视频源。
+
+batch 大小在启动时按本机 CPU 的实际吞吐自动选择 (也可手动指定)：
+视频源多于 batch 大小时，按“最久未处理优先”轮流处理。
+
+使用方法:
+    python pose_multicam.py rtsp://cam1/stream rtsp://cam2/stream video3.mp4
+    python pose_multicam.py --batch-size 4 --show cam*.mp4
+"""
+
+import argparse
+import threading
+import time
+
+import cv2 as cv
+import numpy as np
+
+from humanposetest import (LatestSlot, capture_loop, draw_pose, file_fps, heatmap_points,
+                           inHeight, inWidth, load_net, open_capture, protoc, model)
+
+
+class StreamState:
+    """一路视频源的采集槽位与统计"""
+
+    def __init__(self, index, source):
+        self.index = index
+        self.source = source
+        self.cap = open_capture(source)
+        self.frames = LatestSlot()
+        self.results = LatestSlot()
+        self.seq = 0  # 最近一次送入推理的帧序号
+        self.served_at = 0.0  # 最近一次送入推理的时间，用于轮转
+        self.latencies_ms = []  # 采集到出结果的延迟 (只保留最近的若干个)
+        self.thread = None
+
+    def record_latency(self, latency_ms, window):
+        self.latencies_ms.append(latency_ms)
+        if len(self.latencies_ms) > window:
+            del self.latencies_ms[:len(self.latencies_ms) - window]
+
+    def stats(self):
+        latencies = sorted(self.latencies_ms)
+        p50 = latencies[len(latencies) // 2] if latencies else None
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None
+        return {'source': self.source, 'capture_fps': round(self.frames.meter.rate, 1),
+                'pose_fps': round(self.results.meter.rate, 1),
+                'latency_p50_ms': round(p50, 1) if p50 is not None else None,
+                'latency_p95_ms': round(p95, 1) if p95 is not None else None,
+                'dropped': self.frames.dropped}
+
+
+# ============================= 1. 批量推理 =============================
+
+def forward_batch(net, frames):
+    """
+    对多帧执行一次 forward
+
+    Args:
+        frames (list): BGR 图像列表，尺寸可以不同 (统一缩放到 inWidth x inHeight)
+
+    Returns:
+        list: 每帧的关键点列表 (见 heatmap_points)
+    """
+    blob = cv.dnn.blobFromImages(frames, 1.0 / 255, (inWidth, inHeight), (0, 0, 0), swapRB=False, crop=False)
+    net.setInput(blob)
+    out = net.forward()
+    return [heatmap_points(out[i], frame.shape[1], frame.shape[0]) for i, frame in enumerate(frames)]
+
+
+def tune_batch_size(net, sample_frame, max_batch, max_latency_ms=None, repeats=3):
+    """
+    按本机吞吐选择 batch 大小
+
+    依次测量 1, 2, 4 ... max_batch 的单次 forward 耗时，选每秒处理帧数最高的一个；
+    给出 max_latency_ms 时只在单次 forward 不超过该值的候选中选择。
+
+    Returns:
+        tuple: (batch 大小, {batch 大小: 帧/秒})
+    """
+    candidates = sorted({min(max_batch, 1 << i) for i in range(max_batch.bit_length() + 1)} | {max_batch})
+    throughput = {}
+    best, best_fps = 1, 0.0
+    forward_batch(net, [sample_frame])  # 预热，首次 forward 包含层的初始化
+    for size in candidates:
+        frames = [sample_frame] * size
+        started = time.perf_counter()
+        for _ in range(repeats):
+            forward_batch(net, frames)
+        per_batch = (time.perf_counter() - started) / repeats
+        fps = size / per_batch
+        throughput[size] = round(fps, 2)
+        if max_latency_ms is not None and per_batch * 1000 > max_latency_ms:
+            continue
+        if fps > best_fps:
+            best, best_fps = size, fps
+    return best, throughput
+
+
+def batch_loop(net, streams, batch_size, stop, stats_window=200):
+    """
+    推理线程: 每轮从有新帧的视频源中取最多 batch_size 帧，一次 forward 后分发结果
+
+    results 中的每一项为 dict: seq / points / captured (采集时间) / batch (本轮 batch 大小)
+    """
+    try:
+        while not stop.is_set():
+            ready = []
+            for stream in streams:
+                seq, item = stream.frames.latest()
+                if seq > stream.seq and item is not None:
+                    ready.append((stream.served_at, stream, seq, item))
+            if not ready:
+                if all(stream.frames.closed for stream in streams):
+                    break
+                time.sleep(0.002)
+                continue
+
+            # 最久未处理的视频源优先，避免 batch 小于视频源数量时某一路饿死
+            ready.sort(key=lambda entry: entry[0])
+            chosen = ready[:batch_size]
+            started = time.perf_counter()
+            points_list = forward_batch(net, [item[0] for _, _, _, item in chosen])
+            finished = time.perf_counter()
+            for (_, stream, seq, item), points in zip(chosen, points_list):
+                stream.seq = seq
+                stream.frames.mark_read(seq)
+                stream.served_at = started
+                stream.record_latency((finished - item[1]) * 1000, stats_window)
+                stream.results.put({'seq': seq, 'points': points, 'captured': item[1], 'batch': len(chosen)})
+    finally:
+        for stream in streams:
+            stream.results.close()
+
+
+# ============================= 2. 运行 =============================
+
+def run_multicam(sources, net=None, batch_size=None, max_latency_ms=None, show=False, report_interval=5.0):
+    """
+    多路视频源批量检测
+
+    Args:
+        sources (list): 视频源列表 (摄像头编号 / 视频文件 / RTSP 地址)
+        batch_size (int): 每次 forward 的最大帧数，None 时按本机吞吐自动选择
+        max_latency_ms (float): 自动选择 batch 时单次 forward 的耗时上限
+        show (bool): 是否为每路视频源打开一个窗口显示
+        report_interval (float): 打印各路统计的间隔 (秒)
+    """
+    net = net or load_net()
+    streams = [StreamState(i, source) for i, source in enumerate(sources)]
+    for stream in streams:
+        if not stream.cap.isOpened():
+            raise RuntimeError(f"无法打开视频源: {stream.source}")
+
+    stop = threading.Event()
+    for stream in streams:
+        # 视频文件按原帧率匀速读取，模拟实时摄像头
+        stream.thread = threading.Thread(target=capture_loop,
+                                         args=(stream.cap, stream.frames, stop, file_fps(stream.source, stream.cap)),
+                                         name=f'capture-{stream.index}', daemon=True)
+        stream.thread.start()
+
+    if batch_size is None:
+        # 用第一路的真实画面测量，取不到时用同尺寸的空白帧
+        _, item = streams[0].frames.get(0, timeout=5.0)
+        sample = item[0] if item is not None else np.zeros((inHeight, inWidth, 3), np.uint8)
+        batch_size, throughput = tune_batch_size(net, sample, len(streams), max_latency_ms)
+        print(f"batch 吞吐 (帧/秒): {throughput}，选择 batch 大小 {batch_size}")
+
+    worker = threading.Thread(target=batch_loop, args=(net, streams, batch_size, stop), name='inference', daemon=True)
+    worker.start()
+    next_report = time.monotonic() + report_interval
+    try:
+        while worker.is_alive():
+            if show:
+                for stream in streams:
+                    _, item = stream.frames.latest()
+                    _, result = stream.results.latest()
+                    if item is None:
+                        continue
+                    frame = item[0].copy()
+                    if result is not None:
+                        draw_pose(frame, result['points'])
+                    cv.imshow(f'OpenPose #{stream.index}', frame)
+                if cv.waitKey(1) >= 0:
+                    break
+            else:
+                time.sleep(0.1)
+            if time.monotonic() >= next_report:
+                next_report += report_interval
+                for stream in streams:
+                    print(f"[{stream.index}] {stream.stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        worker.join()
+        for stream in streams:
+            stream.thread.join()
+            stream.cap.release()
+        if show:
+            cv.destroyAllWindows()
+    return [stream.stats() for stream in streams]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多路摄像头批量姿态检测")
+    parser.add_argument('sources', nargs='+', help="RTSP 地址、视频文件或摄像头编号")
+    parser.add_argument('--batch-size', type=int, help="每次 forward 的最大帧数，默认按本机吞吐自动选择")
+    parser.add_argument('--max-latency-ms', type=float, help="自动选择 batch 时单次 forward 的耗时上限")
+    parser.add_argument('--show', action='store_true', help="为每路视频源打开显示窗口")
+    parser.add_argument('--proto', default=protoc, help="prototxt 路径")
+    parser.add_argument('--model', default=model, help="caffemodel 路径")
+    parser.add_argument('--model-cache', help="模型缓存目录 (见 pose_model_cache.py)")
+    args = parser.parse_args()
+    for stats in run_multicam(args.sources, load_net(args.proto, args.model, args.model_cache), args.batch_size,
+                              args.max_latency_ms, args.show):
+        print(stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+录像文件的离线姿态提取
+
+每个视频按帧区间切分为若干任务，由进程池并行处理 (每个进程各自加载一个 cv.dnn 网络，
+OpenCV 内部线程数设为 1，避免进程数 x 线程数超过核数)，处理速度随核数增加，
+不再受实时回放速度限制。结果按帧序写入列式文件:
+
+    frame, time_s, person, <部位>_x, <部位>_y, <部位>_score, ...
+
+安装了 pyarrow 时写 Parquet (每个帧区间一个 row group)，否则写 NumPy .npz (每列一个数组)。
+
+使用方法:
+    python pose_offline.py archive/*.mp4 --output-dir poses --workers 8 --chunk-frames 300
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+import humanposetest
+from humanposetest import BODY_PARTS, detect_keypoints, detect_people, model, protoc
+from pose_model_cache import cached_model_paths, prepare_model
+from pose_output import result_people
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# 输出的部位列 (不含背景)，顺序与 BODY_PARTS 的编号一致
+PART_NAMES = [name for name, _ in sorted(BODY_PARTS.items(), key=lambda item: item[1]) if name != 'Background']
+
+# 进程池中每个进程自己的网络 (由 _init_worker 加载)
+_worker_net = None
+
+
+def default_workers():
+    """进程数取当前进程可用的 CPU 核数"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker(proto_path, model_path, cache_dir=None):
+    global _worker_net
+    cv.setNumThreads(1)
+    _worker_net = humanposetest.load_net(proto_path, model_path, cache_dir)
+
+
+def process_range(task):
+    """
+    进程池中执行: 处理一个视频的 [start, end) 帧
+
+    Args:
+        task (tuple): (视频路径, 起始帧, 结束帧, 是否多人)
+
+    Returns:
+        tuple: (起始帧, 帧号数组, 人序号数组, 关键点数组 (行数, 部位数, 3))
+    """
+    video_path, start, end, multi_person = task
+    cap = cv.VideoCapture(video_path)
+    cap.set(cv.CAP_PROP_POS_FRAMES, start)
+    if int(cap.get(cv.CAP_PROP_POS_FRAMES)) != start:
+        # 部分编码格式不支持精确定位，退回到从头逐帧跳过 (grab 不解码像素，仍比 read 快得多)
+        cap.release()
+        cap = cv.VideoCapture(video_path)
+        for _ in range(start):
+            cap.grab()
+    frame_numbers, person_numbers, keypoints = [], [], []
+    try:
+        for frame_no in range(start, end):
+            hasFrame, frame = cap.read()
+            if not hasFrame:
+                break
+            if multi_person:
+                people = detect_people(_worker_net, frame)
+            else:
+                people = result_people({'points': detect_keypoints(_worker_net, frame, with_conf=True)})
+                # 只按真实部位 (不含背景) 判断这一帧是否有人
+                people = people[(people[:, :len(PART_NAMES), 2] > 0).any(axis=1)]
+            for person_no, person in enumerate(people):
+                frame_numbers.append(frame_no)
+                person_numbers.append(person_no)
+                keypoints.append(person[:len(PART_NAMES)])
+    finally:
+        cap.release()
+    keypoints = np.asarray(keypoints, dtype=np.float32).reshape(-1, len(PART_NAMES), 3)
+    return start, np.asarray(frame_numbers, dtype=np.int64), np.asarray(person_numbers, dtype=np.int16), keypoints
+
+
+def split_ranges(frame_count, chunk_frames):
+    return [(start, min(start + chunk_frames, frame_count)) for start in range(0, frame_count, chunk_frames)]
+
+
+def _columns(frames, persons, keypoints, fps):
+    columns = {'frame': frames, 'time_s': (frames / fps if fps else np.zeros(len(frames))).astype(np.float32),
+               'person': persons}
+    for i, name in enumerate(PART_NAMES):
+        columns[f"{name}_x"] = keypoints[:, i, 0]
+        columns[f"{name}_y"] = keypoints[:, i, 1]
+        columns[f"{name}_score"] = keypoints[:, i, 2]
+    return columns
+
+
+class ColumnarWriter:
+    """按区间顺序追加写入列式文件 (Parquet 或 npz)"""
+
+    def __init__(self, path_without_ext, fps):
+        self.fps = fps
+        self.rows = 0
+        if pq is not None:
+            self.path = path_without_ext + '.parquet'
+            self._writer = None
+        else:
+            self.path = path_without_ext + '.npz'
+            self._chunks = []
+
+    def write(self, frames, persons, keypoints):
+        columns = _columns(frames, persons, keypoints, self.fps)
+        self.rows += len(frames)
+        if pq is None:
+            self._chunks.append(columns)
+            return
+        table = pa.table(columns)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if pq is not None:
+            if self._writer is None:
+                pq.write_table(pa.table(_columns(np.zeros(0, np.int64), np.zeros(0, np.int16),
+                                                 np.zeros((0, len(PART_NAMES), 3), np.float32), self.fps)), self.path)
+            else:
+                self._writer.close()
+            return
+        names = list(_columns(np.zeros(0, np.int64), np.zeros(0, np.int16),
+                              np.zeros((0, len(PART_NAMES), 3), np.float32), self.fps))
+        merged = {name: np.concatenate([chunk[name] for chunk in self._chunks]) if self._chunks else np.zeros(0)
+                  for name in names}
+        np.savez_compressed(self.path, **merged)
+
+
+def process_videos(video_paths, output_dir="poses", workers=None, chunk_frames=300, multi_person=False,
+                   proto_path=protoc, model_path=model, cache_dir=None):
+    """
+    并行处理多个视频文件
+
+    Args:
+        video_paths (list): 视频文件路径
+        output_dir (str): 输出目录，每个视频一个 <文件名>.pose.parquet / .npz
+        workers (int): 进程数，默认为可用核数
+        chunk_frames (int): 每个任务处理的帧数
+        multi_person (bool): 是否多人检测 (需要 COCO 模型)
+        cache_dir (str): 模型缓存目录，各进程从缓存加载并预热 (见 pose_model_cache.py)
+
+    Returns:
+        dict: 视频路径 -> (输出文件, 行数)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or default_workers()
+    if cache_dir and cached_model_paths(proto_path, model_path, cache_dir) is None:
+        # 在主进程中生成一次缓存，避免各进程同时转换
+        prepare_model(proto_path, model_path, cache_dir)
+    outputs = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(proto_path, model_path, cache_dir)) as executor:
+        for video_path in video_paths:
+            cap = cv.VideoCapture(video_path)
+            frame_count = int(cap.get(cv.CAP_PROP_FRAME_COUNT))
+            fps = cap.get(cv.CAP_PROP_FPS)
+            cap.release()
+            if frame_count <= 0:
+                print(f"⚠️  无法读取帧数，跳过: {video_path}")
+                continue
+
+            stem = os.path.splitext(os.path.basename(video_path))[0]
+            writer = ColumnarWriter(os.path.join(output_dir, f"{stem}.pose"), fps)
+            tasks = [(video_path, start, end, multi_person) for start, end in split_ranges(frame_count, chunk_frames)]
+            print(f"🎞️  {video_path}: {frame_count} 帧，{len(tasks)} 个区间 (进程数: {workers})")
+            # executor.map 按提交顺序返回结果，写出的文件天然按帧序排列
+            for _, frames, persons, keypoints in executor.map(process_range, tasks):
+                writer.write(frames, persons, keypoints)
+            writer.close()
+            outputs[video_path] = (writer.path, writer.rows)
+            print(f"✅ {video_path} -> {writer.path} ({writer.rows} 行)")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="录像文件的离线姿态提取")
+    parser.add_argument('videos', nargs='+', help="视频文件")
+    parser.add_argument('--output-dir', default='poses', help="输出目录")
+    parser.add_argument('--workers', type=int, help="进程数，默认为可用核数")
+    parser.add_argument('--chunk-frames', type=int, default=300, help="每个任务处理的帧数")
+    parser.add_argument('--multi-person', action='store_true', help="检测画面中的所有人 (需要 COCO 模型)")
+    parser.add_argument('--proto', default=protoc, help="prototxt 路径")
+    parser.add_argument('--model', default=model, help="caffemodel 路径")
+    parser.add_argument('--model-cache', help="模型缓存目录 (见 pose_model_cache.py)")
+    args = parser.parse_args()
+    process_videos(args.videos, args.output_dir, args.workers, args.chunk_frames, args.multi_person,
+                   args.proto, args.model, args.model_cache)
+
+
+if __name__ == '__main__':
+    main()
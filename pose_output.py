@@ -0,0 +1,156 @@
+"""
+无界面运行时的关键点输出与延迟统计
+
+输出目标 (open_sink):
+    -                       标准输出
+    unix:/tmp/pose.sock     连接本地 Unix socket
+    tcp://127.0.0.1:9000    连接本地 TCP 端口
+    其他                    视为文件路径 (追加写入)
+
+输出格式:
+    jsonl   每帧一行 JSON: {"seq", "captured", "infer_ms", "people": [[[x, y, score], ...], ...]}
+    binary  每帧一条定长头 + float32 数组，便于其他语言直接读取:
+            RECORD_HEADER = <4s H H Q d f H H  (magic b'POSE', 版本, 保留, seq, 采集时间, 推理耗时 ms,
+            人数, 部位数)，之后为 人数 x 部位数 x 3 个 little-endian float32 (x, y, score)
+"""
+
+import bisect
+import json
+import socket
+import struct
+import sys
+
+import numpy as np
+
+RECORD_MAGIC = b'POSE'
+RECORD_VERSION = 1
+RECORD_HEADER = struct.Struct('<4sHHQdfHH')
+OUTPUT_FORMATS = ('jsonl', 'binary')
+
+
+# ============================= 1. 输出目标 =============================
+
+class _SocketSink:
+    """把 socket 包装成只写的二进制流"""
+
+    def __init__(self, sock):
+        self._sock = sock
+
+    def write(self, data):
+        self._sock.sendall(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._sock.close()
+
+
+def open_sink(dest):
+    """按目标字符串打开一个二进制输出流 (支持 write / flush / close)"""
+    if dest in (None, '-'):
+        return sys.stdout.buffer
+    if dest.startswith('unix:'):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(dest[len('unix:'):])
+        return _SocketSink(sock)
+    if dest.startswith('tcp://'):
+        host, port = dest[len('tcp://'):].rsplit(':', 1)
+        return _SocketSink(socket.create_connection((host, int(port))))
+    return open(dest, 'ab')
+
+
+# ============================= 2. 编码 =============================
+
+def result_people(result):
+    """
+    把推理结果统一为 (人数, 部位数, 3) 的 float32 数组
+
+    单人模式的点列表 (见 humanposetest.heatmap_points) 最后一项为背景占位，不计入部位；
+    点为 (x, y, conf) 时使用其置信度，只有 (x, y) 时检出的部位记为 1.0，未检出的记为 0。
+    """
+    if 'people' in result:
+        return np.asarray(result['people'], dtype=np.float32)
+    points = result['points'][:-1]
+    person = np.zeros((1, len(points), 3), dtype=np.float32)
+    for i, point in enumerate(points):
+        if point is not None:
+            person[0, i] = (point[0], point[1], point[2] if len(point) > 2 else 1.0)
+    return person
+
+
+def encode_jsonl(result):
+    people = result_people(result)
+    record = {'seq': result['seq'], 'captured': round(result['captured'], 6),
+              'infer_ms': round(result['infer_ms'], 2), 'people': people.astype(np.float64).round(2).tolist()}
+    return (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def encode_binary(result):
+    people = result_people(result)
+    header = RECORD_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, 0, result['seq'], result['captured'],
+                                result['infer_ms'], people.shape[0], people.shape[1])
+    return header + people.astype('<f4').tobytes()
+
+
+def decode_binary(stream):
+    """逐条读取 binary 格式的记录，迭代 (seq, 采集时间, 推理耗时, people 数组)"""
+    while True:
+        header = stream.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+        magic, version, _, seq, captured, infer_ms, count, parts = RECORD_HEADER.unpack(header)
+        if magic != RECORD_MAGIC:
+            raise ValueError("不是有效的 POSE 记录流")
+        body = stream.read(count * parts * 3 * 4)
+        yield seq, captured, infer_ms, np.frombuffer(body, dtype='<f4').reshape(count, parts, 3)
+
+
+ENCODERS = {'jsonl': encode_jsonl, 'binary': encode_binary}
+
+
+# ============================= 3. 延迟统计 =============================
+
+class LatencyHistogram:
+    """对数分桶的延迟直方图 (毫秒)，记录开销固定，与样本数无关"""
+
+    def __init__(self, low_ms=0.1, high_ms=10000.0, buckets_per_decade=20):
+        decades = np.log10(high_ms / low_ms)
+        self.bounds = list(low_ms * 10 ** (np.arange(int(decades * buckets_per_decade) + 1) / buckets_per_decade))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def record(self, value_ms):
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+
+    def percentile(self, pct):
+        """返回落入该百分位的桶的上界 (近似值)"""
+        if not self.total:
+            return None
+        target = pct / 100 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+    def summary(self):
+        if not self.total:
+            return {'count': 0}
+        return {'count': self.total, 'mean_ms': round(self.sum_ms / self.total, 2),
+                **{f"p{pct}_ms": round(self.percentile(pct), 2) for pct in (50, 90, 99)}}
+
+    def render(self, width=40):
+        """文本形式的直方图，只显示有样本的桶"""
+        lines = []
+        peak = max(self.counts) or 1
+        for i, count in enumerate(self.counts):
+            if not count:
+                continue
+            upper = self.bounds[i] if i < len(self.bounds) else float('inf')
+            lines.append(f"  <= {upper:>9.2f} ms {count:>7} {'#' * max(1, count * width // peak)}")
+        return '\n'.join(lines)
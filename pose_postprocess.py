@@ -0,0 +1,184 @@
+"""
+OpenPose 输出的向量化后处理 (多人)
+
+网络输出 out 的形状为 (N, 57, H, W) (COCO): 前 19 个通道为 18 个部位 + 背景的热力图，
+后 38 个通道为 19 条肢体的部位亲和场 (PAF, 每条肢体 x / y 两个通道)。
+
+1. 峰值检测: 对全部热力图一次性做 3x3 最大池化式的非极大值抑制，得到所有部位的候选点
+2. 肢体打分: 对每条肢体，一次性计算所有 (起点候选, 终点候选) 组合沿连线的 PAF 积分
+3. 组装: 按得分贪心匹配肢体，再按共享的部位把肢体合并成人
+
+结果为 (人数, 部位数, 3) 的数组，每个部位为 (x, y, 置信度)，缺失部位的置信度为 0。
+只支持 COCO 模型 (MPI 模型的输出不含 PAF 通道)。
+"""
+
+import numpy as np
+
+# COCO 部位数 (不含背景)，顺序与 humanposetest.BODY_PARTS 一致
+NUM_PARTS = 18
+NUM_HEATMAPS = NUM_PARTS + 1
+
+# 肢体: (起点部位, 终点部位, PAF x 通道, PAF y 通道)；通道编号为在 out 第 1 维中的位置。
+# 前 17 条与 humanposetest.POSE_PAIRS 顺序一致，后 2 条 (肩-耳) 只用于把耳朵挂到人身上
+LIMBS = [
+    (1, 2, 31, 32), (1, 5, 39, 40), (2, 3, 33, 34), (3, 4, 35, 36), (5, 6, 41, 42),
+    (6, 7, 43, 44), (1, 8, 19, 20), (8, 9, 21, 22), (9, 10, 23, 24), (1, 11, 25, 26),
+    (11, 12, 27, 28), (12, 13, 29, 30), (1, 0, 47, 48), (0, 14, 49, 50), (14, 16, 53, 54),
+    (0, 15, 51, 52), (15, 17, 55, 56), (2, 17, 37, 38), (5, 16, 45, 46),
+]
+
+
+def find_peaks(heatmaps, threshold=0.1):
+    """
+    在所有热力图上同时找局部极大值
+
+    Args:
+        heatmaps (ndarray): (部位数, H, W)
+        threshold (float): 峰值的最低置信度
+
+    Returns:
+        tuple: (part, y, x, score) 四个等长数组，按部位排序
+    """
+    parts, height, width = heatmaps.shape
+    padded = np.pad(heatmaps, ((0, 0), (1, 1), (1, 1)), mode='constant', constant_values=-np.inf)
+    # 3x3 邻域最大值: 9 个平移视图逐元素取最大，不复制整张图
+    pooled = padded[:, 1:height + 1, 1:width + 1].copy()
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                np.maximum(pooled, padded[:, dy:dy + height, dx:dx + width], out=pooled)
+    mask = (heatmaps >= pooled) & (heatmaps > threshold)
+    part, y, x = np.nonzero(mask)
+    return part, y, x, heatmaps[part, y, x]
+
+
+def score_limb(paf_x, paf_y, starts, ends, samples=10, paf_threshold=0.05, min_ratio=0.8):
+    """
+    计算一条肢体所有候选组合的 PAF 得分
+
+    Args:
+        paf_x, paf_y (ndarray): 该肢体的 PAF 两个通道 (H, W)
+        starts, ends (ndarray): 起点 / 终点候选的坐标 (n, 2)，按 (x, y)
+        samples (int): 沿连线采样的点数
+        paf_threshold (float): 单个采样点被视为“方向一致”的最低投影值
+        min_ratio (float): 方向一致的采样点至少占的比例
+
+    Returns:
+        ndarray: (len(starts), len(ends)) 的得分矩阵，不成立的组合为 -inf
+    """
+    height, width = paf_x.shape
+    delta = ends[None, :, :] - starts[:, None, :]  # (na, nb, 2)
+    norm = np.sqrt((delta ** 2).sum(-1))
+    unit = delta / np.maximum(norm, 1e-6)[..., None]
+
+    steps = np.linspace(0.0, 1.0, samples)
+    points = starts[:, None, None, :] + steps[None, None, :, None] * delta[:, :, None, :]  # (na, nb, S, 2)
+    xs = np.clip(np.rint(points[..., 0]).astype(np.intp), 0, width - 1)
+    ys = np.clip(np.rint(points[..., 1]).astype(np.intp), 0, height - 1)
+    dots = paf_x[ys, xs] * unit[..., None, 0] + paf_y[ys, xs] * unit[..., None, 1]  # (na, nb, S)
+
+    # 距离先验: 连线长于半个图高时扣分，避免把相距很远的两个人的部位连起来
+    scores = dots.mean(-1) + np.minimum(0.5 * height / np.maximum(norm, 1e-6) - 1, 0)
+    valid = ((dots > paf_threshold).mean(-1) >= min_ratio) & (scores > 0) & (norm > 0)
+    return np.where(valid, scores, -np.inf)
+
+
+def match_limb(scores):
+    """
+    贪心匹配: 按得分从高到低取组合，每个候选点在一条肢体中只使用一次
+
+    Returns:
+        list: [(起点下标, 终点下标, 得分), ...]
+    """
+    flat = np.argsort(scores, axis=None)[::-1]
+    used_a, used_b = set(), set()
+    matches = []
+    limit = min(scores.shape)
+    for index in flat:
+        a, b = divmod(int(index), scores.shape[1])
+        score = scores[a, b]
+        if not np.isfinite(score):
+            break
+        if a in used_a or b in used_b:
+            continue
+        used_a.add(a)
+        used_b.add(b)
+        matches.append((a, b, float(score)))
+        if len(matches) == limit:
+            break
+    return matches
+
+
+def group_people(out, frame_width, frame_height, threshold=0.1, min_parts=4, min_mean_score=0.2):
+    """
+    把一张图的网络输出组装成多人关键点
+
+    Args:
+        out (ndarray): 一张图的网络输出 (57, H, W)
+        frame_width, frame_height (int): 原图尺寸，用于换算坐标
+        threshold (float): 部位峰值的最低置信度
+        min_parts (int): 一个人至少包含的部位数
+        min_mean_score (float): 一个人的平均得分下限
+
+    Returns:
+        ndarray: (人数, NUM_PARTS, 3) float32，每个部位为 (x, y, 置信度)
+    """
+    if out.shape[0] < LIMBS[-1][3] + 1:
+        raise ValueError(f"网络输出只有 {out.shape[0]} 个通道，缺少 PAF (仅支持 COCO 模型)")
+    height, width = out.shape[1:]
+    part, y, x, peak_scores = find_peaks(out[:NUM_PARTS], threshold)
+    coords = np.stack([x, y], axis=1).astype(np.float32)
+    # 每个部位的候选点在全局峰值数组中的下标区间
+    bounds = np.searchsorted(part, np.arange(NUM_PARTS + 1))
+
+    # people: 每行 NUM_PARTS 个峰值下标 (-1 为缺失)；totals: 每个人的累计得分
+    people = np.full((0, NUM_PARTS), -1, dtype=np.intp)
+    totals = []
+    for part_a, part_b, channel_x, channel_y in LIMBS:
+        a_ids = np.arange(bounds[part_a], bounds[part_a + 1])
+        b_ids = np.arange(bounds[part_b], bounds[part_b + 1])
+        if not len(a_ids) or not len(b_ids):
+            continue
+        scores = score_limb(out[channel_x], out[channel_y], coords[a_ids], coords[b_ids])
+        for a, b, score in match_limb(scores):
+            ia, ib = a_ids[a], b_ids[b]
+            owners = np.nonzero((people[:, part_a] == ia) | (people[:, part_b] == ib))[0]
+            if len(owners) == 0:
+                row = np.full((1, NUM_PARTS), -1, dtype=np.intp)
+                row[0, part_a], row[0, part_b] = ia, ib
+                people = np.vstack([people, row])
+                totals.append(peak_scores[ia] + peak_scores[ib] + score)
+            elif len(owners) == 1:
+                owner = owners[0]
+                if people[owner, part_b] == -1:
+                    people[owner, part_b] = ib
+                    totals[owner] += peak_scores[ib] + score
+            else:
+                first, second = owners[:2]
+                if not ((people[first] >= 0) & (people[second] >= 0)).any():
+                    # 两个片段没有重叠部位，说明是同一个人被拆开了，合并
+                    people[first] = np.maximum(people[first], people[second])
+                    totals[first] += totals[second] + score
+                    people = np.delete(people, second, axis=0)
+                    del totals[second]
+                elif people[first, part_b] == -1:
+                    people[first, part_b] = ib
+                    totals[first] += peak_scores[ib] + score
+
+    counts = (people >= 0).sum(1)
+    keep = (counts >= min_parts) & (np.asarray(totals, dtype=np.float32) / np.maximum(counts, 1) >= min_mean_score) \
+        if len(people) else np.zeros(0, dtype=bool)
+    people = people[keep]
+
+    result = np.zeros((len(people), NUM_PARTS, 3), dtype=np.float32)
+    present = people >= 0
+    ids = people[present]
+    result[present, 0] = coords[ids, 0] * frame_width / width
+    result[present, 1] = coords[ids, 1] * frame_height / height
+    result[present, 2] = peak_scores[ids]
+    return result
+
+
+def person_points(person):
+    """把一个人的 (NUM_PARTS, 3) 数组转换为 humanposetest.draw_pose 使用的点列表"""
+    return [(float(x), float(y)) if score > 0 else None for x, y, score in person] + [None]
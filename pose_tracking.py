@@ -0,0 +1,163 @@
+"""
+用稀疏光流 (Lucas-Kanade) 在两次网络推理之间跟踪关键点
+
+网络推理是主要开销，两次推理之间的帧只用 calcOpticalFlowPyrLK 把上一次的关键点
+传递到当前帧 (正向 + 反向校验，误差大的点视为丢失)。出现以下情况时重新推理:
+- 仍被跟踪到的部位比例低于 min_confidence
+- 关键点的单帧位移中位数超过 max_motion_px (快速运动时光流不可靠)
+- 距上次推理已达到当前的重检间隔
+
+重检间隔自适应: 重新推理时比较跟踪结果与推理结果的偏差，偏差小则逐步加大间隔，
+偏差大或因跟踪失败而提前重检时减半，范围为 [min_interval, max_interval] 帧。
+
+推理结果中没有人是正常状态而不是跟踪失败: 不计算跟踪比例，按重检间隔等待
+(连续为空时间隔同样逐步加大)，相邻帧灰度平均差超过 empty_change_threshold (可能有人进入) 时提前重检。
+"""
+
+import numpy as np
+import cv2 as cv
+
+LK_PARAMS = dict(winSize=(21, 21), maxLevel=3,
+                 criteria=(cv.TERM_CRITERIA_EPS | cv.TERM_CRITERIA_COUNT, 20, 0.03))
+
+
+class PoseTracker:
+    """
+    关键点跟踪器，people 数组形状为 (人数, 部位数, 3)，每个部位为 (x, y, 置信度)，置信度 0 为缺失
+    """
+
+    def __init__(self, min_interval=2, max_interval=60, min_confidence=0.6, max_motion_px=20.0,
+                 max_fb_error_px=2.0, drift_tolerance_px=8.0, empty_change_threshold=6.0):
+        """
+        Args:
+            min_interval (int): 重检间隔下限 (帧)
+            max_interval (int): 重检间隔上限 (帧)
+            min_confidence (float): 被跟踪到的部位比例低于该值时重检
+            max_motion_px (float): 单帧位移中位数超过该值时重检
+            max_fb_error_px (float): 正向-反向光流误差超过该值的点视为丢失
+            drift_tolerance_px (float): 重检时跟踪与推理结果的偏差低于该值才加大间隔
+            empty_change_threshold (float): 画面中没有人时，相邻帧灰度平均差 (0-255) 超过该值视为运动
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.min_confidence = min_confidence
+        self.max_motion_px = max_motion_px
+        self.max_fb_error_px = max_fb_error_px
+        self.drift_tolerance_px = drift_tolerance_px
+        self.empty_change_threshold = empty_change_threshold
+
+        self.interval = min_interval
+        self.people = None
+        self.confidence = 0.0
+        self.motion = 0.0
+        self.frames_since_detection = 0
+        self.last_reason = None
+        self._prev_gray = None
+        self._visible_at_detection = 0
+
+    @property
+    def active(self):
+        return self.people is not None and self._prev_gray is not None
+
+    def reset(self, gray, people):
+        """
+        用网络推理的结果重新开始跟踪，并据此调整重检间隔
+
+        Args:
+            gray (ndarray): 当前帧的灰度图
+            people (ndarray): 推理结果 (人数, 部位数, 3)
+        """
+        people = np.asarray(people, dtype=np.float32)
+        if self.people is not None:
+            drift = self._drift(self.people, people)
+            # 前后两次推理都没有人时同样视为稳定
+            stable = (drift is not None and drift <= self.drift_tolerance_px) or \
+                not ((self.people[..., 2] > 0).any() or (people[..., 2] > 0).any())
+            if self.last_reason == 'interval' and stable:
+                self.interval = min(self.max_interval, self.interval + max(1, self.interval // 2))
+            else:
+                self.interval = max(self.min_interval, self.interval // 2)
+        self.people = people.copy()
+        self._prev_gray = gray
+        self._visible_at_detection = int((people[..., 2] > 0).sum())
+        self.confidence = 1.0
+        self.motion = 0.0
+        self.frames_since_detection = 0
+        self.last_reason = None
+
+    def track(self, gray):
+        """
+        把关键点从上一帧传递到当前帧
+
+        Returns:
+            ndarray: 跟踪后的 people (丢失的部位置信度置 0)
+        """
+        self.frames_since_detection += 1
+        visible = self.people[..., 2] > 0
+        if not visible.any():
+            if self._visible_at_detection:
+                self.confidence = 0.0  # 推理时有人，现在全部跟丢
+            else:
+                change = cv.mean(cv.absdiff(self._prev_gray, gray))[0]
+                self.motion = float('inf') if change > self.empty_change_threshold else 0.0
+            self._prev_gray = gray
+            return self.people
+
+        p0 = self.people[visible][:, :2].reshape(-1, 1, 2).astype(np.float32)
+        p1, status, _ = cv.calcOpticalFlowPyrLK(self._prev_gray, gray, p0, None, **LK_PARAMS)
+        back, back_status, _ = cv.calcOpticalFlowPyrLK(gray, self._prev_gray, p1, None, **LK_PARAMS)
+        fb_error = np.linalg.norm((p0 - back).reshape(-1, 2), axis=1)
+        good = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error <= self.max_fb_error_px)
+
+        moved = p1.reshape(-1, 2)
+        coords = self.people[visible]
+        displacement = np.linalg.norm(moved - coords[:, :2], axis=1)
+        coords[good, :2] = moved[good]
+        coords[~good, 2] = 0.0
+        self.people[visible] = coords
+
+        self.motion = float(np.median(displacement[good])) if good.any() else float('inf')
+        self.confidence = float((self.people[..., 2] > 0).sum()) / max(self._visible_at_detection, 1)
+        self._prev_gray = gray
+        return self.people
+
+    def should_redetect(self):
+        """返回是否需要重新推理，原因记录在 last_reason (interval / confidence / motion)"""
+        if not self.active:
+            self.last_reason = 'init'
+        elif self.confidence < self.min_confidence:
+            self.last_reason = 'confidence'
+        elif self.motion > self.max_motion_px:
+            self.last_reason = 'motion'
+        elif self.frames_since_detection >= self.interval:
+            self.last_reason = 'interval'
+        else:
+            return False
+        return True
+
+    @staticmethod
+    def _drift(tracked, detected):
+        """
+        跟踪结果与推理结果的偏差: 按可见部位的中心就近配对后，
+        两者都可见的部位的距离中位数；无法比较时返回 None
+        """
+        if not len(tracked) or not len(detected):
+            return None
+
+        def centers(people):
+            visible = people[..., 2] > 0
+            counts = np.maximum(visible.sum(1, keepdims=True), 1)
+            return (people[..., :2] * visible[..., None]).sum(1) / counts
+
+        tracked_centers, detected_centers = centers(tracked), centers(detected)
+        distances = []
+        used = set()
+        for i, center in enumerate(detected_centers):
+            order = np.argsort(np.linalg.norm(tracked_centers - center, axis=1))
+            j = next((int(k) for k in order if int(k) not in used), None)
+            if j is None:
+                break
+            used.add(j)
+            both = (tracked[j, :, 2] > 0) & (detected[i, :, 2] > 0)
+            distances.extend(np.linalg.norm(tracked[j, both, :2] - detected[i, both, :2], axis=1))
+        return float(np.median(distances)) if distances else None